@@ -0,0 +1,50 @@
+"""Helpers shared by the benchmarks for building synthetic video catalogs."""
+
+import random
+import time
+
+# The words that synthetic titles are made of, and the tags given to synthetic videos
+WORDS = [
+    "amazing", "funny", "cat", "dog", "life", "google", "video", "about", "nothing", "another",
+    "cooking", "travel", "music", "guitar", "piano", "coding", "python", "review", "unboxing",
+    "tutorial", "morning", "evening", "garden", "ocean", "mountain", "city", "night", "football",
+    "history", "science", "space", "robot", "dance", "comedy", "news", "weather", "game", "art",
+]
+
+TAGS = [
+    "#animal", "#cat", "#dog", "#google", "#career", "#music", "#food", "#travel", "#tech",
+    "#sport", "#news", "#comedy", "#science", "#art", "#gaming", "#nature", "#diy", "#howto",
+]
+
+
+def write_catalog(path, count, seed=0):
+    """Writes a pipe-delimited videos.txt style file with `count` synthetic videos.
+
+    Args:
+        path: Where to write the file.
+        count: Number of videos to generate.
+        seed: Seed for the random generator, so runs are repeatable.
+
+    Returns:
+        The list of generated video ids, in file order.
+    """
+    rng = random.Random(seed)
+    video_ids = []
+    with open(path, "w") as video_file:
+        for i in range(count):
+            title = " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 5))).title()
+            tags = " , ".join(rng.sample(TAGS, rng.randint(0, 3)))
+            video_id = f"video_{i}_id"
+            video_ids.append(video_id)
+            video_file.write(f"{title} {i} | {video_id} | {tags}\n")
+    return video_ids
+
+
+def best_of(func, repeat=3):
+    """Runs `func` `repeat` times and returns the fastest wall-clock time in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
@@ -0,0 +1,42 @@
+"""Measures how many commands per second CommandParser.execute_command dispatches.
+
+The commands are sent to a player whose methods do nothing, so only parsing and dispatch is timed.
+
+Usage (from the python/ directory):
+    python3 -m benchmarks.command_dispatch_benchmark [--commands N]
+"""
+
+import argparse
+import time
+
+from src.command_parser import CommandParser
+
+
+class _NullPlayer:
+    def __getattr__(self, name):
+        return lambda *args: None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commands", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    command_parser = CommandParser(_NullPlayer())
+    commands = [
+        ["NUMBER_OF_VIDEOS"],
+        ["play", "amazing_cats_video_id"],
+        ["SEARCH_VIDEOS_WITH_TAG", "#cat"],
+        ["FLAG_VIDEO", "amazing_cats_video_id", "reason"],
+        ["allow_video", "amazing_cats_video_id"],
+    ]
+    for command in commands:
+        start = time.perf_counter()
+        for _ in range(args.commands):
+            command_parser.execute_command(command)
+        elapsed = time.perf_counter() - start
+        print(f"{command[0]:>24} {args.commands / elapsed:>12,.0f} commands/s")
+
+
+if __name__ == "__main__":
+    main()
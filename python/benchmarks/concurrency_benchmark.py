@@ -0,0 +1,78 @@
+"""Measures how reads of a shared FilteredVideoLibrary scale with the number of reading threads.
+
+Reads take no locks (bar a short one to cache the results of a search missing from the search
+cache), so they scale as far as the interpreter lets threads run in parallel - on a build with the
+GIL, total throughput stays roughly flat, but it should not fall as threads are added, nor while
+another thread keeps flagging and allowing videos.
+
+Usage (from the python/ directory):
+    python3 -m benchmarks.concurrency_benchmark [--videos N] [--seconds S]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+
+from src.filtered_video_library import FilteredVideoLibrary
+from .catalog import write_catalog
+
+_SEARCH_TERMS = ["cat", "guitar", "ocean", "robot", "news"]
+
+
+def _read(library, video_ids, stop, counts, slot):
+    rng = random.Random(slot)
+    reads = 0
+    while not stop.is_set():
+        library.get_video(rng.choice(video_ids))
+        library.search_titles(rng.choice(_SEARCH_TERMS))
+        reads += 2
+    counts[slot] = reads
+
+
+def _write(library, video_ids, stop):
+    rng = random.Random()
+    while not stop.is_set():
+        video_id = rng.choice(video_ids)
+        library.flag_video(video_id, "benchmark")
+        library.allow_video(video_id)
+
+
+def _measure(library, video_ids, threads, seconds, with_writer):
+    stop = threading.Event()
+    counts = [0] * threads
+    workers = [threading.Thread(target=_read, args=(library, video_ids, stop, counts, slot))
+               for slot in range(threads)]
+    if with_writer:
+        workers.append(threading.Thread(target=_write, args=(library, video_ids, stop)))
+    for worker in workers:
+        worker.start()
+    time.sleep(seconds)
+    stop.set()
+    for worker in workers:
+        worker.join()
+    return sum(counts) / seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--videos", type=int, default=100_000)
+    parser.add_argument("--seconds", type=float, default=2.0, help="per measurement")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        videos_path = os.path.join(tmp_dir, "videos.txt")
+        video_ids = write_catalog(videos_path, args.videos)
+        library = FilteredVideoLibrary(videos_path, snapshot=False)
+    print(f"{args.videos} videos")
+    print(f"{'threads':>8} {'reads/s':>12} {'reads/s with a writer':>22}")
+    for threads in (1, 2, 4, 8):
+        reads = _measure(library, video_ids, threads, args.seconds, with_writer=False)
+        reads_with_writer = _measure(library, video_ids, threads, args.seconds, with_writer=True)
+        print(f"{threads:>8} {reads:>12,.0f} {reads_with_writer:>22,.0f}")
+
+
+if __name__ == "__main__":
+    main()
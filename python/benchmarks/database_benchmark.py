@@ -0,0 +1,61 @@
+"""Compares the in-memory VideoLibrary with one querying an SQLite catalog.
+
+Usage (from the python/ directory):
+    python3 -m benchmarks.database_benchmark [--videos N]
+"""
+
+import argparse
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+
+from src.video_database import write_database
+from src.video_library import VideoLibrary
+from .catalog import best_of, write_catalog
+
+
+def _measure(videos_path, database_path):
+    gc.collect()
+    start = time.perf_counter()
+    library = VideoLibrary(videos_path, snapshot=False, database=database_path)
+    load_time = time.perf_counter() - start
+
+    video_ids = library._video_ids[::max(1, len(library._video_ids) // 1000)]
+    lookup_time = best_of(lambda: [library.get_video(video_id) for video_id in video_ids])
+    title_time = best_of(lambda: library.search_titles("guitar piano"))
+    tag_time = best_of(lambda: library.search_tags(["#music", "#cat"]))
+    del library
+
+    # Measured separately, as tracing allocations slows loading down
+    gc.collect()
+    tracemalloc.start()
+    library = VideoLibrary(videos_path, snapshot=False, database=database_path)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return load_time, memory, lookup_time, title_time, tag_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--videos", type=int, default=200_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        videos_path = os.path.join(tmp_dir, "videos.txt")
+        database_path = os.path.join(tmp_dir, "catalog.db")
+        write_catalog(videos_path, args.videos)
+        write_database(database_path, VideoLibrary(videos_path, snapshot=False).get_all_videos())
+        print(f"{args.videos} videos")
+        print(f"{'mode':>9} {'startup':>10} {'memory':>10} {'1000 lookups':>14} "
+              f"{'title search':>14} {'tag search':>12}")
+        for mode, database in (("memory", None), ("database", database_path)):
+            load_time, memory, lookup_time, title_time, tag_time = _measure(videos_path, database)
+            print(f"{mode:>9} {load_time:>9.2f}s {memory / 2 ** 20:>8.1f}MB "
+                  f"{lookup_time * 1000:>12.2f}ms {title_time * 1000:>12.2f}ms "
+                  f"{tag_time * 1000:>10.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
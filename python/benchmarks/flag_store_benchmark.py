@@ -0,0 +1,45 @@
+"""Measures how listing videos scales with the number of flagged videos.
+
+With the flags being a dictionary, looking each video's flag up costs the same no matter how many
+videos are flagged. get_all_videos also wraps each flagged video in a FlaggedVideo view, so only
+grows with the number of flagged videos by the cost of those small objects.
+
+Usage (from the python/ directory):
+    python3 -m benchmarks.flag_store_benchmark [--videos N] [--flags F1,F2,...]
+"""
+
+import argparse
+import os
+import tempfile
+
+from src.filtered_video_library import FilteredVideoLibrary
+from .catalog import best_of, write_catalog
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--videos", type=int, default=500_000)
+    parser.add_argument("--flags", default="0,1000,10000,100000,400000")
+    args = parser.parse_args()
+    flag_counts = sorted(int(count) for count in args.flags.split(","))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        videos_path = os.path.join(tmp_dir, "videos.txt")
+        video_ids = write_catalog(videos_path, args.videos)
+        library = FilteredVideoLibrary(videos_path)
+
+        print(f"{args.videos} videos")
+        print(f"{'flags':>10} {'get_all_videos':>16} {'non_flagged':>16}")
+        flagged = 0
+        for flag_count in flag_counts:
+            flag_count = min(flag_count, len(video_ids))
+            for video_id in video_ids[flagged:flag_count]:
+                library.flag_video(video_id, "benchmark")
+            flagged = flag_count
+            all_time = best_of(library.get_all_videos)
+            non_flagged_time = best_of(library.get_all_non_flagged_videos)
+            print(f"{flag_count:>10} {all_time * 1000:>14.1f}ms {non_flagged_time * 1000:>14.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
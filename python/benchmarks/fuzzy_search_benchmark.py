@@ -0,0 +1,68 @@
+"""Measures typo-tolerant title and tag searches against scanning every title, on 1M titles.
+
+The scan checks every word of every title against the query, as a fuzzy search without an index
+would. Its time is estimated from a sample of the titles, since a full scan takes minutes.
+
+Usage (from the python/ directory):
+    python3 -m benchmarks.fuzzy_search_benchmark [--videos N] [--queries Q1,Q2,...]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from src.filtered_video_library import FilteredVideoLibrary
+from src.fuzzy_index import default_max_distance, edit_distance
+from src.ranked_index import split_words
+from .catalog import best_of, write_catalog
+
+# How many titles the scan is timed on
+_SCAN_SAMPLE = 20_000
+
+
+def _scan(videos, search_term):
+    # Keeps the videos with a title word within a few edits of every word of the search term
+    query_words = split_words(search_term)
+    matches = []
+    for video in videos:
+        title_words = split_words(video.title)
+        if all(any(edit_distance(query_word, title_word, default_max_distance(query_word))
+                   is not None for title_word in title_words) for query_word in query_words):
+            matches.append(video)
+    return matches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--videos", type=int, default=1_000_000)
+    parser.add_argument("--queries", default="amzing,gutiar_tutorail,robto,pythn_revew,zzzzzz")
+    parser.add_argument("--tags", default="#musci,#gamign,#ct")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        videos_path = os.path.join(tmp_dir, "videos.txt")
+        write_catalog(videos_path, args.videos)
+        library = FilteredVideoLibrary(videos_path)
+        start = time.perf_counter()
+        library.search_titles_fuzzy("warm up")
+        library.search_tags_fuzzy(["#warm"])
+        print(f"{args.videos} videos, fuzzy indexes built in {time.perf_counter() - start:.1f}s")
+
+        sample = library.get_all_videos()[:_SCAN_SAMPLE]
+        print(f"{'query':>18} {'results':>9} {'scan (est.)':>12} {'index':>12}")
+        for search_term in args.queries.split(","):
+            results = len(library.search_titles_fuzzy(search_term))
+            scan_time = best_of(lambda: _scan(sample, search_term), repeat=1)
+            scan_time *= args.videos / min(args.videos, _SCAN_SAMPLE)
+            index_time = best_of(lambda: library.search_titles_fuzzy(search_term))
+            print(f"{search_term:>18} {results:>9} {scan_time * 1000:>10.0f}ms "
+                  f"{index_time * 1000:>10.1f}ms")
+        for tag in args.tags.split(","):
+            results = len(library.search_tags_fuzzy([tag]))
+            index_time = best_of(lambda: library.search_tags_fuzzy([tag]))
+            print(f"{tag:>18} {results:>9} {'':>12} {index_time * 1000:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
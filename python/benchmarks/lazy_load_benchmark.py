@@ -0,0 +1,56 @@
+"""Compares startup time and memory of the eager and lazy VideoLibrary loading modes.
+
+Usage (from the python/ directory):
+    python3 -m benchmarks.lazy_load_benchmark [--videos N]
+"""
+
+import argparse
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+
+from src.video_library import VideoLibrary
+from .catalog import write_catalog
+
+
+def _measure(videos_path, lazy):
+    gc.collect()
+    start = time.perf_counter()
+    library = VideoLibrary(videos_path, lazy=lazy)
+    load_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for video_id in library._video_ids[::max(1, len(library._video_ids) // 1000)]:
+        library.get_video(video_id)
+    lookup_time = time.perf_counter() - start
+    del library
+
+    # Measured separately, as tracing allocations slows loading down
+    gc.collect()
+    tracemalloc.start()
+    library = VideoLibrary(videos_path, lazy=lazy)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return load_time, memory, lookup_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--videos", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        videos_path = os.path.join(tmp_dir, "videos.txt")
+        write_catalog(videos_path, args.videos)
+        print(f"{args.videos} videos")
+        print(f"{'mode':>6} {'startup':>10} {'memory':>10} {'1000 lookups':>14}")
+        for mode, lazy in (("eager", False), ("lazy", True)):
+            load_time, memory, lookup_time = _measure(videos_path, lazy)
+            print(f"{mode:>6} {load_time:>9.2f}s {memory / 2 ** 20:>8.1f}MB "
+                  f"{lookup_time * 1000:>12.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Compares showing the first page of a listing against showing all of it, as the catalog grows.
+
+Each listing is run through a VideoPlayer writing to a NullSink, with search questions deferred,
+so the times cover finding, looking up and emitting the videos, but not formatting the output.
+
+Usage (from the python/ directory):
+    python3 -m benchmarks.pagination_benchmark [--sizes N1,N2,...] [--limit L]
+"""
+
+import argparse
+import os
+import tempfile
+
+from src.filtered_video_library import FilteredVideoLibrary
+from src.output_sink import NullSink
+from src.video_player import VideoPlayer
+from .catalog import best_of, write_catalog
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'videos':>9} {'command':>16} {'all':>12} {'first page':>12}")
+    for size in (int(size) for size in args.sizes.split(",")):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            videos_path = os.path.join(tmp_dir, "videos.txt")
+            write_catalog(videos_path, size)
+            library = FilteredVideoLibrary(videos_path, search_cache_size=0)
+            player = VideoPlayer(library, output=NullSink(), defer_answers=True)
+            commands = [("SHOW_ALL_VIDEOS", player.show_all_videos, ()),
+                        ("SEARCH_VIDEOS", player.search_videos, ("cat",)),
+                        ("SEARCH_WITH_TAG", player.search_videos_tag, ("#music",))]
+            for name, command, arguments in commands:
+                all_time = best_of(lambda: command(*arguments))
+                page_time = best_of(lambda: command(*arguments, 0, args.limit))
+                print(f"{size:>9} {name:>16} {all_time * 1000:>10.2f}ms {page_time * 1000:>10.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
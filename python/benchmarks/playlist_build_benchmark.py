@@ -0,0 +1,46 @@
+"""Compares building and emptying a large playlist with the ordered-set Playlist against a list.
+
+Usage (from the python/ directory):
+    python3 -m benchmarks.playlist_build_benchmark [--videos N]
+"""
+
+import argparse
+
+from src.video_playlist_library import PlaylistLibrary
+from .catalog import best_of
+
+
+def _list_build(video_ids):
+    # How PlaylistLibrary previously added and removed videos, on a plain list
+    videos = []
+    for video_id in video_ids:
+        if video_id not in videos:
+            videos.append(video_id)
+    for video_id in video_ids:
+        if video_id in videos:
+            videos.remove(video_id)
+
+
+def _library_build(video_ids):
+    library = PlaylistLibrary()
+    library.add_playlist("benchmark")
+    for video_id in video_ids:
+        library.add_video_to("benchmark", video_id)
+    for video_id in video_ids:
+        library.remove_video_from("benchmark", video_id)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--videos", type=int, default=50_000)
+    args = parser.parse_args()
+
+    video_ids = [f"video_{i}_id" for i in range(args.videos)]
+    print(f"Adding then removing {args.videos} videos")
+    for name, build in (("list", _list_build), ("ordered set", _library_build)):
+        elapsed = best_of(lambda: build(video_ids), repeat=1)
+        print(f"{name:>12} {elapsed * 1000:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
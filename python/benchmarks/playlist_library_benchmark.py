@@ -0,0 +1,84 @@
+"""Compares the hash map + sorted key PlaylistLibrary against the previous sorted list of playlists.
+
+Both libraries are filled with the same playlists before timing, and then a batch of playlists is
+created, looked up and deleted in each.
+
+Usage (from the python/ directory):
+    python3 -m benchmarks.playlist_library_benchmark [--playlists N] [--operations M]
+"""
+
+import argparse
+import random
+
+from src.video_playlist import Playlist
+from src.video_playlist_library import PlaylistLibrary
+from .catalog import best_of
+
+
+class _ListPlaylistLibrary:
+    # The playlist storage PlaylistLibrary previously used
+    def __init__(self, playlist_names=()):
+        self._playlists = [Playlist(name, []) for name in sorted(playlist_names, key=str.lower)]
+
+    def add_playlist(self, playlist_name):
+        for i in range(len(self._playlists)):
+            if self._playlists[i].name.lower() == playlist_name.lower():
+                return False
+            if self._playlists[i].name.lower() > playlist_name.lower():
+                self._playlists.insert(i, Playlist(playlist_name, []))
+                return True
+        self._playlists.append((Playlist(playlist_name, [])))
+        return True
+
+    def get_playlist(self, playlist_name):
+        index = self._find_playlist_index(playlist_name)
+        return None if index == -1 else self._playlists[index]
+
+    def remove_playlist(self, playlist_name):
+        index = self._find_playlist_index(playlist_name)
+        if index == -1:
+            return False
+        del self._playlists[index]
+        return True
+
+    def _find_playlist_index(self, playlist_name):
+        playlist_key = playlist_name.lower()
+        for i in range(len(self._playlists)):
+            if self._playlists[i].name.lower() == playlist_key:
+                return i
+        return -1
+
+
+def _run_operations(library, playlist_names):
+    for playlist_name in playlist_names:
+        library.add_playlist(playlist_name)
+    for playlist_name in playlist_names:
+        library.get_playlist(playlist_name.upper())
+    for playlist_name in playlist_names:
+        library.remove_playlist(playlist_name)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--playlists", type=int, default=100_000)
+    parser.add_argument("--operations", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    existing_names = [f"Playlist_{i}" for i in range(args.playlists)]
+    new_names = [f"Playlist_new_{rng.randrange(10 ** 9)}" for _ in range(args.operations)]
+
+    library = PlaylistLibrary()
+    for playlist_name in existing_names:
+        library.add_playlist(playlist_name)
+    list_library = _ListPlaylistLibrary(existing_names)
+
+    print(f"{args.playlists} playlists, {args.operations} creates + lookups + deletes")
+    for name, playlists in (("sorted list", list_library), ("hash map", library)):
+        elapsed = best_of(lambda: _run_operations(playlists, new_names), repeat=1)
+        per_operation = elapsed / (3 * args.operations)
+        print(f"{name:>12} {elapsed * 1000:>10.1f}ms ({per_operation * 1e6:,.1f}us per operation)")
+
+
+if __name__ == "__main__":
+    main()
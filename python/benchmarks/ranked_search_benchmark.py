@@ -0,0 +1,40 @@
+"""Compares picking the top k ranked results with a heap against sorting every match.
+
+Usage (from the python/ directory):
+    python3 -m benchmarks.ranked_search_benchmark [--videos N] [--queries Q1,Q2,...] [--k K]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from src.filtered_video_library import FilteredVideoLibrary
+from .catalog import best_of, write_catalog
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--videos", type=int, default=1_000_000)
+    parser.add_argument("--queries", default="cat,funny_cat,robot_dance_music,python_tutorial,nomatch")
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        videos_path = os.path.join(tmp_dir, "videos.txt")
+        write_catalog(videos_path, args.videos)
+        library = FilteredVideoLibrary(videos_path)
+        start = time.perf_counter()
+        library.search_ranked("warm up", 1)
+        print(f"{args.videos} videos, ranked index built in {time.perf_counter() - start:.1f}s")
+
+        print(f"{'query':>20} {'all sorted':>12} {'top ' + str(args.k):>12}")
+        for query in args.queries.split(","):
+            # Asking for every video makes the heap keep and order every match, like a full sort
+            all_time = best_of(lambda: library.search_ranked(query, args.videos))
+            top_time = best_of(lambda: library.search_ranked(query, args.k))
+            print(f"{query:>20} {all_time * 1000:>10.1f}ms {top_time * 1000:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
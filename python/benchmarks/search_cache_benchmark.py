@@ -0,0 +1,72 @@
+"""Measures the search result cache on a workload of repeated searches with occasional flags.
+
+Searches are drawn with a skewed (Zipf-like) popularity, as real searches are, and every
+--flag-every searches a random video is flagged or allowed, which invalidates only the cached
+searches it matches. The same workload is run with the cache disabled and enabled.
+
+Usage (from the python/ directory):
+    python3 -m benchmarks.search_cache_benchmark [--videos N] [--searches S] [--flag-every F]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from src.filtered_video_library import FilteredVideoLibrary
+from .catalog import TAGS, WORDS, write_catalog
+
+
+def _workload(video_ids, searches, flag_every, seed=0):
+    # Each item is ("title", term), ("tag", tag) or ("flag", video_id)
+    rng = random.Random(seed)
+    queries = [("title", word) for word in WORDS]
+    queries += [("title", f"{first} {second}") for first in WORDS[:10] for second in WORDS[:10]]
+    queries += [("tag", tag) for tag in TAGS]
+    rng.shuffle(queries)
+    weights = [1 / rank for rank in range(1, len(queries) + 1)]
+    workload = []
+    for i, query in enumerate(rng.choices(queries, weights, k=searches), start=1):
+        workload.append(query)
+        if flag_every and i % flag_every == 0:
+            workload.append(("flag", rng.choice(video_ids)))
+    return workload
+
+
+def _run(library, workload):
+    start = time.perf_counter()
+    for kind, argument in workload:
+        if kind == "title":
+            library.search_titles(argument)
+        elif kind == "tag":
+            library.search_tags([argument])
+        elif not library.flag_video(argument):
+            library.allow_video(argument)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--videos", type=int, default=200_000)
+    parser.add_argument("--searches", type=int, default=2_000)
+    parser.add_argument("--flag-every", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        videos_path = os.path.join(tmp_dir, "videos.txt")
+        video_ids = write_catalog(videos_path, args.videos)
+        workload = _workload(video_ids, args.searches, args.flag_every)
+
+        print(f"{args.videos} videos, {args.searches} searches, a flag every {args.flag_every}")
+        print(f"{'cache':>8} {'time':>10} {'per search':>12} {'hits':>8} {'misses':>8}")
+        for cache_size in (0, 1024):
+            library = FilteredVideoLibrary(videos_path, search_cache_size=cache_size)
+            elapsed = _run(library, workload)
+            cache = library.search_cache
+            print(f"{cache_size:>8} {elapsed:>9.2f}s {elapsed / args.searches * 1000:>10.2f}ms "
+                  f"{cache.hits:>8} {cache.misses:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Measures how many commands per second the TCP server executes for many concurrent clients.
+
+The clients run in the same process and event loop as the server, so this measures the server's
+overhead per command and per connection rather than the network's.
+
+Usage (from the python/ directory):
+    python3 -m benchmarks.server_benchmark [--clients N] [--commands N]
+"""
+
+import argparse
+import asyncio
+import time
+
+from src.server import VideoPlayerServer
+
+_COMMANDS = ["PLAY amazing_cats_video_id", "PAUSE", "CONTINUE", "SHOW_PLAYING", "STOP"]
+
+
+async def _client(port, commands):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write("".join(f"{command}\n" for command in commands).encode() + b"EXIT\n")
+    await writer.drain()
+    # The server closes the connection after EXIT
+    while await reader.read(1 << 16):
+        pass
+    writer.close()
+    await writer.wait_closed()
+
+
+async def _run(clients, commands_per_client):
+    server = await VideoPlayerServer().start()
+    port = server.sockets[0].getsockname()[1]
+    commands = [_COMMANDS[i % len(_COMMANDS)] for i in range(commands_per_client)]
+    async with server:
+        start = time.perf_counter()
+        await asyncio.gather(*(_client(port, commands) for _ in range(clients)))
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--commands", type=int, default=100, help="commands per client")
+    args = parser.parse_args()
+
+    elapsed = asyncio.run(_run(args.clients, args.commands))
+    total = args.clients * args.commands
+    print(f"{args.clients} clients sent {args.commands} commands each in {elapsed:.2f}s "
+          f"({total / elapsed:,.0f} commands/s)")
+
+
+if __name__ == "__main__":
+    main()
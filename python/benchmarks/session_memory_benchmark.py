@@ -0,0 +1,60 @@
+"""Measures the memory of a shared video library, and of each session playing from it.
+
+Usage (from the python/ directory):
+    python3 -m benchmarks.session_memory_benchmark [--videos N] [--sessions N]
+"""
+
+import argparse
+import gc
+import os
+import tempfile
+import tracemalloc
+
+from src.filtered_video_library import FilteredVideoLibrary
+from src.output_sink import NullSink
+from src.session_manager import SessionManager
+from .catalog import write_catalog
+
+# Every session plays a video and keeps a playlist of this many videos
+_PLAYLIST_VIDEOS = 5
+
+
+def _traced(build):
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, memory
+
+
+def _open_sessions(sessions, count, video_ids):
+    output = NullSink()
+    for i in range(count):
+        player = sessions.open_session(f"session_{i}", output)
+        player.play_video(video_ids[i % len(video_ids)])
+        player.create_playlist("favourites")
+        player.add_videos_to_playlist(
+            "favourites", [video_ids[(i + j) % len(video_ids)] for j in range(_PLAYLIST_VIDEOS)])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--videos", type=int, default=100_000)
+    parser.add_argument("--sessions", type=int, default=10_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        videos_path = os.path.join(tmp_dir, "videos.txt")
+        video_ids = write_catalog(videos_path, args.videos)
+        library, library_memory = _traced(lambda: FilteredVideoLibrary(videos_path, snapshot=False))
+    sessions = SessionManager(library)
+    _, sessions_memory = _traced(lambda: _open_sessions(sessions, args.sessions, video_ids))
+    print(f"Library of {args.videos} videos: {library_memory / 2 ** 20:.1f}MB")
+    print(f"{args.sessions} sessions: {sessions_memory / 2 ** 20:.1f}MB "
+          f"({sessions_memory / args.sessions:,.0f} bytes per session, with a "
+          f"{_PLAYLIST_VIDEOS} video playlist each)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Compares sorting every video by title against the library's title order for SHOW_ALL_VIDEOS.
+
+Both list the videos through a VideoPlayer writing to a NullSink, so the times include looking up
+each video and its flag, but not formatting the output.
+
+Usage (from the python/ directory):
+    python3 -m benchmarks.show_all_benchmark [--videos N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from src.filtered_video_library import FilteredVideoLibrary
+from src.output_sink import NullSink
+from src.video_player import VideoPlayer
+from .catalog import best_of, write_catalog
+
+
+def _sort_all(player, library):
+    # The listing previously done by VideoPlayer.show_all_videos
+    player._emit("all_videos_header")
+    videos = library.get_all_videos()
+    videos.sort(key=lambda x: x.title)
+    for video in videos:
+        player._emit("video", video=video)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--videos", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        videos_path = os.path.join(tmp_dir, "videos.txt")
+        write_catalog(videos_path, args.videos)
+        start = time.perf_counter()
+        library = FilteredVideoLibrary(videos_path)
+        print(f"{args.videos} videos loaded and indexed in {time.perf_counter() - start:.1f}s")
+        player = VideoPlayer(library, output=NullSink())
+
+        sort_time = best_of(lambda: _sort_all(player, library))
+        order_time = best_of(player.show_all_videos)
+        print(f"{'sort every time':>16} {sort_time * 1000:>10.1f}ms")
+        print(f"{'title order':>16} {order_time * 1000:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Compares cold start from videos.txt against cold start from a compiled binary snapshot.
+
+Usage (from the python/ directory):
+    python3 -m benchmarks.snapshot_benchmark [--videos N]
+"""
+
+import argparse
+import gc
+import os
+import tempfile
+import time
+
+from src.filtered_video_library import FilteredVideoLibrary
+from src.video_library import VideoLibrary
+from .catalog import best_of, write_catalog
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--videos", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        videos_path = os.path.join(tmp_dir, "videos.txt")
+        write_catalog(videos_path, args.videos)
+        print(f"{args.videos} videos")
+
+        start = time.perf_counter()
+        VideoLibrary(videos_path, compact=True, snapshot=False).save_snapshot()
+        print(f"{'compile snapshot':>28} {time.perf_counter() - start:>9.3f}s")
+
+        # Loaded first, so the garbage collector isn't also walking the text library's objects
+        gc.collect()
+        start = time.perf_counter()
+        # Without the search cache, so repeated searches time the index rather than cache hits
+        snapshot_library = FilteredVideoLibrary(videos_path, search_cache_size=0)
+        print(f"{'load from snapshot':>28} {time.perf_counter() - start:>9.3f}s")
+
+        start = time.perf_counter()
+        text_library = FilteredVideoLibrary(videos_path, snapshot=False, search_cache_size=0)
+        print(f"{'load from videos.txt':>28} {time.perf_counter() - start:>9.3f}s")
+
+        for name, library in (("text", text_library), ("snapshot", snapshot_library)):
+            search_time = best_of(lambda: library.search_titles("robot dance"))
+            print(f"{'search, ' + name:>28} {search_time * 1000:>8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
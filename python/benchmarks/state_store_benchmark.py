@@ -0,0 +1,57 @@
+"""Times saving playlist changes to each state store, and loading them back at startup.
+
+Usage (from the python/ directory):
+    python3 -m benchmarks.state_store_benchmark [--playlists N] [--videos N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from src.journal_state_store import JournalStateStore
+from src.state_store import SqliteStateStore
+
+
+def _save(store, playlist_videos):
+    start = time.perf_counter()
+    for playlist_name, video_ids in playlist_videos:
+        store.add_playlist(playlist_name)
+        for video_id in video_ids:
+            store.add_videos(playlist_name, [video_id])
+    store.close()
+    return time.perf_counter() - start
+
+
+def _load(open_store):
+    start = time.perf_counter()
+    store = open_store()
+    store.load()
+    elapsed = time.perf_counter() - start
+    store.close()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--playlists", type=int, default=100)
+    parser.add_argument("--videos", type=int, default=200, help="videos per playlist")
+    args = parser.parse_args()
+
+    playlist_videos = [(f"playlist_{p}", [f"video_{v}_id" for v in range(args.videos)])
+                       for p in range(args.playlists)]
+    changes = args.playlists * (args.videos + 1)
+    print(f"Saving {changes} changes ({args.playlists} playlists of {args.videos} videos)")
+    print(f"{'store':>8} {'batch size':>10} {'save':>10} {'changes/s':>12} {'load':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        for name, store_class in (("sqlite", SqliteStateStore), ("journal", JournalStateStore)):
+            for batch_size in (1, 256):
+                path = os.path.join(directory, f"{name}_{batch_size}")
+                save_time = _save(store_class(path, batch_size), playlist_videos)
+                load_time = _load(lambda: store_class(path))
+                print(f"{name:>8} {batch_size:>10} {save_time * 1000:>8.1f}ms "
+                      f"{changes / save_time:>12,.0f} {load_time * 1000:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Compares the tag posting-list index against scanning every video for SEARCH_VIDEOS_WITH_TAG.
+
+Usage (from the python/ directory):
+    python3 -m benchmarks.tag_search_benchmark [--videos N]
+"""
+
+import argparse
+import os
+import tempfile
+
+from src.filtered_video_library import FilteredVideoLibrary
+from .catalog import best_of, write_catalog
+
+
+def _scan(library, video_tag):
+    # The search previously done by VideoPlayer.search_videos_tag
+    matches = []
+    for video in library.get_all_non_flagged_videos():
+        if video_tag.lower() in map(lambda x: x.lower(), video.tags):
+            matches.append(video)
+    return matches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--videos", type=int, default=500_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        videos_path = os.path.join(tmp_dir, "videos.txt")
+        write_catalog(videos_path, args.videos)
+        library = FilteredVideoLibrary(videos_path)
+        tag_index = library._tag_index
+
+        print(f"{args.videos} videos")
+        scan_time = best_of(lambda: _scan(library, "#CAT"))
+        print(f"{'scan #cat':>28} {scan_time * 1000:>12.2f}ms")
+        queries = [
+            ("index #cat", ["#cat"], False),
+            ("index #cat AND #dog", ["#cat", "#dog"], False),
+            ("index #cat AND #dog AND #art", ["#cat", "#dog", "#art"], False),
+            ("index #cat OR #dog", ["#cat", "#dog"], True),
+            ("index #missing", ["#missing"], False),
+        ]
+        for name, tags, match_any in queries:
+            # Times the posting list work only, without building the result Video list
+            index_time = best_of(lambda: tag_index.search(tags, match_any))
+            results = len(tag_index.search(tags, match_any))
+            print(f"{name:>28} {index_time * 1000:>12.2f}ms ({results} results)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Compares the trigram title index against scanning every title for SEARCH_VIDEOS.
+
+Usage (from the python/ directory):
+    python3 -m benchmarks.title_search_benchmark [--videos N] [--terms T1,T2,...]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from src.filtered_video_library import FilteredVideoLibrary
+from .catalog import best_of, write_catalog
+
+
+def _scan(library, search_term):
+    # The search previously done by VideoPlayer.search_videos
+    matches = []
+    for video in library.get_all_non_flagged_videos():
+        if search_term.lower() in video.title.lower():
+            matches.append(video)
+    return matches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--videos", type=int, default=1_000_000)
+    parser.add_argument("--terms", default="ca,cat,python,robot dance,ocean 12345,nomatch")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        videos_path = os.path.join(tmp_dir, "videos.txt")
+        write_catalog(videos_path, args.videos)
+        start = time.perf_counter()
+        # Without the search cache, so repeated searches time the index rather than cache hits
+        library = FilteredVideoLibrary(videos_path, search_cache_size=0)
+        print(f"{args.videos} videos loaded and indexed in {time.perf_counter() - start:.1f}s")
+
+        print(f"{'term':>16} {'results':>9} {'scan':>12} {'index':>12}")
+        for search_term in args.terms.split(","):
+            results = len(library.search_titles(search_term))
+            assert results == len(_scan(library, search_term))
+            scan_time = best_of(lambda: _scan(library, search_term))
+            index_time = best_of(lambda: library.search_titles(search_term))
+            print(f"{search_term:>16} {results:>9} {scan_time * 1000:>10.2f}ms "
+                  f"{index_time * 1000:>10.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
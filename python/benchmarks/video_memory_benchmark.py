@@ -0,0 +1,75 @@
+"""Measures the memory each video costs in the default and compact VideoLibrary storage.
+
+Usage (from the python/ directory):
+    python3 -m benchmarks.video_memory_benchmark [--videos N]
+"""
+
+import argparse
+import csv
+import gc
+import os
+import tempfile
+import tracemalloc
+
+from src.video import Video
+from src.video_columns import VideoColumns
+from src.video_library import _csv_reader_with_strip, _parse_video
+from .catalog import write_catalog
+
+
+class _DictVideo:
+    # Video as it was before it used __slots__, for comparison
+    def __init__(self, video_title, video_id, video_tags):
+        self._title = video_title
+        self._video_id = video_id
+        self._tags = tuple(video_tags)
+        self._is_flagged = False
+        self._flag_reason = ""
+
+    @property
+    def video_id(self):
+        return self._video_id
+
+
+def _parse_lines(lines, video_class=Video):
+    for video_info in _csv_reader_with_strip(csv.reader(lines, delimiter="|")):
+        video = _parse_video(video_info)
+        yield video_class(video.title, video.video_id, video.tags)
+
+
+def _traced_memory(build):
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return memory
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--videos", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        videos_path = os.path.join(tmp_dir, "videos.txt")
+        write_catalog(videos_path, args.videos)
+        with open(videos_path) as video_file:
+            lines = video_file.readlines()
+
+    # Each store is built from the raw lines, so the strings it keeps are counted too
+    stores = [
+        ("dict-backed Video objects",
+         lambda: {video.video_id: video for video in _parse_lines(lines, _DictVideo)}),
+        ("__slots__ Video objects",
+         lambda: {video.video_id: video for video in _parse_lines(lines)}),
+        ("compact columns", lambda: VideoColumns(_parse_lines(lines))),
+    ]
+    print(f"{args.videos} videos, bytes per video (excluding the search indexes)")
+    for name, build in stores:
+        print(f"{name:>26} {_traced_memory(build) / args.videos:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
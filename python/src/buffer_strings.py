@@ -0,0 +1,35 @@
+"""Helpers for storing many strings in a few flat buffers."""
+
+from collections.abc import Sequence
+from typing import Iterable, List
+
+
+def join_lines(strings: Iterable[str]) -> bytes:
+    """Encodes strings without line breaks into one UTF-8 buffer, each ended by a line break."""
+    return "".join(string + "\n" for string in strings).encode("utf-8")
+
+
+def split_lines(buffer) -> List[str]:
+    """Decodes a buffer written by join_lines back into its strings."""
+    return str(buffer, "utf-8").split("\n")[:-1]
+
+
+class BufferStrings(Sequence):
+    """A read-only sequence of strings stored back to back in one UTF-8 buffer.
+
+    String i is the bytes between offsets[i] and offsets[i + 1], and is only decoded when accessed.
+    """
+
+    def __init__(self, buffer, offsets):
+        self._buffer = buffer
+        self._offsets = offsets
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("BufferStrings index out of range")
+        return str(self._buffer[self._offsets[index]:self._offsets[index + 1]], "utf-8")
+
+    def __len__(self):
+        return len(self._offsets) - 1
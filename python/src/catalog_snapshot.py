@@ -0,0 +1,126 @@
+"""Reads and writes binary snapshots of a video catalog.
+
+A snapshot holds the compact video columns, the title and tag search indexes and the title order of
+a videos.txt file as flat arrays, so a VideoLibrary can memory-map it and use it without parsing or indexing
+anything. It records the size and modification time of the file it was compiled from, and is
+ignored once that file changes.
+
+File layout (integers are little-endian unless stated otherwise):
+    header:   magic (8 bytes), version (u32), section count (u32), source size (u64),
+              source modification time in ns (u64)
+    sections: a table of (offset, length) u64 pairs, then each section's bytes, 8-byte aligned.
+              Array sections are stored in the byte order of the machine that wrote them, which
+              is why the magic differs between little and big-endian writers.
+"""
+
+import mmap
+import os
+import struct
+import sys
+from pathlib import Path
+
+from .tag_index import TagIndex
+from .title_index import TitleIndex
+from .title_order import TitleOrder
+from .video_columns import VideoColumns
+
+SNAPSHOT_VERSION = 2
+
+_MAGIC = b"YTSNAPLE" if sys.byteorder == "little" else b"YTSNAPBE"
+_HEADER = struct.Struct("<8sIIQQ")
+_SECTION = struct.Struct("<QQ")
+_ALIGNMENT = 8
+# Number of buffers the videos, title index, tag index and title order are each stored as
+_VIDEO_SECTIONS, _TITLE_SECTIONS, _TAG_SECTIONS, _ORDER_SECTIONS = 6, 5, 4, 1
+
+
+def default_snapshot_path(videos_path):
+    """Returns where the snapshot of the given video file is kept by default."""
+    return Path(str(videos_path) + ".snapshot")
+
+
+def write_snapshot(snapshot_path, videos_path, videos, title_index, tag_index, title_order):
+    """Writes a snapshot of a catalog.
+
+    The snapshot is written to a temporary file first and then moved into place, so a reader never
+    sees a partially written snapshot.
+
+    Args:
+        snapshot_path: Where to write the snapshot.
+        videos_path: The video file the catalog was loaded from.
+        videos: The VideoColumns holding the videos.
+        title_index: The TitleIndex over the videos, in the same order.
+        tag_index: The TagIndex over the videos, in the same order.
+        title_order: The TitleOrder of the videos, in the same order.
+    """
+    sections = [memoryview(buffer).cast("B") for buffer in
+                videos.to_buffers() + title_index.to_buffers() + tag_index.to_buffers()
+                + title_order.to_buffers()]
+    source = os.stat(videos_path)
+    offset = _HEADER.size + _SECTION.size * len(sections)
+    table = []
+    for section in sections:
+        offset = _align(offset)
+        table.append((offset, len(section)))
+        offset += len(section)
+
+    temp_path = Path(str(snapshot_path) + ".tmp")
+    with open(temp_path, "wb") as snapshot_file:
+        snapshot_file.write(_HEADER.pack(
+            _MAGIC, SNAPSHOT_VERSION, len(sections), source.st_size, source.st_mtime_ns))
+        for section_offset, length in table:
+            snapshot_file.write(_SECTION.pack(section_offset, length))
+        for (section_offset, _), section in zip(table, sections):
+            snapshot_file.write(b"\0" * (section_offset - snapshot_file.tell()))
+            snapshot_file.write(section)
+    os.replace(temp_path, snapshot_path)
+
+
+def read_snapshot(snapshot_path, videos_path):
+    """Memory-maps a snapshot of a catalog.
+
+    Args:
+        snapshot_path: Where the snapshot was written.
+        videos_path: The video file the snapshot should have been compiled from.
+
+    Returns:
+        A (VideoColumns, TitleIndex, TagIndex, TitleOrder) tuple backed by the mapped file. None if
+        the snapshot does not exist, was written by another version or byte order, is older than
+        the file, or is truncated or corrupt.
+    """
+    try:
+        with open(snapshot_path, "rb") as snapshot_file:
+            snapshot = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (FileNotFoundError, ValueError):
+        return None
+    if len(snapshot) < _HEADER.size:
+        return None
+    magic, version, section_count, source_size, source_mtime_ns = _HEADER.unpack_from(snapshot)
+    source = os.stat(videos_path)
+    if (magic != _MAGIC or version != SNAPSHOT_VERSION
+            or section_count != _VIDEO_SECTIONS + _TITLE_SECTIONS + _TAG_SECTIONS + _ORDER_SECTIONS
+            or (source_size, source_mtime_ns) != (source.st_size, source.st_mtime_ns)):
+        return None
+
+    data = memoryview(snapshot)
+    title_start = _VIDEO_SECTIONS
+    tag_start = title_start + _TITLE_SECTIONS
+    order_start = tag_start + _TAG_SECTIONS
+    # A truncated or corrupt snapshot (such as one cut short by a crash) is ignored like a stale one
+    try:
+        sections = []
+        for i in range(section_count):
+            offset, length = _SECTION.unpack_from(snapshot, _HEADER.size + i * _SECTION.size)
+            if offset + length > len(snapshot):
+                return None
+            sections.append(data[offset:offset + length])
+        return (VideoColumns.from_buffers(sections[:title_start]),
+                TitleIndex.from_buffers(sections[title_start:tag_start]),
+                TagIndex.from_buffers(sections[tag_start:order_start]),
+                TitleOrder.from_buffers(sections[order_start:]))
+    except (struct.error, TypeError, ValueError, IndexError):
+        return None
+
+
+def _align(offset):
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
@@ -1,7 +1,13 @@
 """A command parser class."""
 
-import textwrap
-from typing import Sequence
+import sys
+from typing import Callable, Collection, Optional, Sequence
+
+from .output_sink import Output, StdoutSink
+
+
+# Accepted argument counts of commands taking a playlist name and one or more further arguments
+_AT_LEAST_TWO = range(2, sys.maxsize)
 
 
 class CommandException(Exception):
@@ -10,10 +16,40 @@ class CommandException(Exception):
 
 
 class CommandParser:
-    """A class used to parse and execute a user Command."""
+    """A class used to parse and execute a user Command.
+
+    Commands are looked up by name in a table, so dispatching costs the same for every command.
+    Further commands can be added with register_command.
+    """
 
-    def __init__(self, video_player):
+    def __init__(self, video_player, output=None):
+        """The CommandParser class is initialized.
+
+        Args:
+            video_player: The VideoPlayer to execute commands on.
+            output: (optional) The OutputSink to send the parser's own output (such as HELP) to.
+                Defaults to printing it.
+        """
         self._player = video_player
+        self._output = output if output is not None else StdoutSink()
+        # Maps each upper case command name to its (handler, arities, error message, help text)
+        self._commands = {}
+        self._register_player_commands()
+
+    def register_command(self, name: str, handler: Callable, arities: Optional[Collection[int]] = None,
+                         error_message: str = "", help_text: str = ""):
+        """Adds a command to the parser, replacing any existing command with the same name.
+
+        Args:
+            name: The command name, matched regardless of case.
+            handler: Called with the command's arguments when the command is executed.
+            arities: (optional) The numbers of arguments the command accepts. If not given, the
+                handler is called without arguments, and any arguments given are ignored.
+            error_message: (optional) The message of the CommandException raised when the
+                command is given a number of arguments it does not accept.
+            help_text: (optional) The line describing the command in the HELP output.
+        """
+        self._commands[name.upper()] = (handler, arities, error_message, help_text)
 
     def execute_command(self, command: Sequence[str]):
         """Executes the user command. Expects the command to be upper case.
@@ -24,140 +60,164 @@ class CommandParser:
                 "Please enter a valid command, "
                 "type HELP for a list of available commands.")
 
-        if command[0].upper() == "NUMBER_OF_VIDEOS":
-            self._player.number_of_videos()
-
-        elif command[0].upper() == "SHOW_ALL_VIDEOS":
-            self._player.show_all_videos()
-
-        elif command[0].upper() == "PLAY":
-            if len(command) != 2:
-                raise CommandException(
-                    "Please enter PLAY command followed by video_id.")
-            self._player.play_video(command[1])
-
-        elif command[0].upper() == "PLAY_RANDOM":
-            self._player.play_random_video()
-
-        elif command[0].upper() == "STOP":
-            self._player.stop_video()
-
-        elif command[0].upper() == "PAUSE":
-            self._player.pause_video()
-
-        elif command[0].upper() == "CONTINUE":
-            self._player.continue_video()
-
-        elif command[0].upper() == "SHOW_PLAYING":
-            self._player.show_playing()
-
-        elif command[0].upper() == "CREATE_PLAYLIST":
-            if len(command) != 2:
-                raise CommandException(
-                    "Please enter CREATE_PLAYLIST command followed by a "
-                    "playlist name.")
-            self._player.create_playlist(command[1])
-
-        elif command[0].upper() == "ADD_TO_PLAYLIST":
-            if len(command) != 3:
-                raise CommandException(
-                    "Please enter ADD_TO_PLAYLIST command followed by a "
-                    "playlist name and video_id to add.")
-            self._player.add_to_playlist(command[1], command[2])
-
-        elif command[0].upper() == "REMOVE_FROM_PLAYLIST":
-            if len(command) != 3:
-                raise CommandException(
-                    "Please enter REMOVE_FROM_PLAYLIST command followed by a "
-                    "playlist name and video_id to remove.")
-            self._player.remove_from_playlist(command[1], command[2])
-
-        elif command[0].upper() == "CLEAR_PLAYLIST":
-            if len(command) != 2:
-                raise CommandException(
-                    "Please enter CLEAR_PLAYLIST command followed by a "
-                    "playlist name.")
-            self._player.clear_playlist(command[1])
-
-        elif command[0].upper() == "DELETE_PLAYLIST":
-            if len(command) != 2:
-                raise CommandException(
-                    "Please enter DELETE_PLAYLIST command followed by a "
-                    "playlist name.")
-            self._player.delete_playlist(command[1])
-
-        elif command[0].upper() == "SHOW_PLAYLIST":
-            if len(command) != 2:
-                raise CommandException(
-                    "Please enter SHOW_PLAYLIST command followed by a "
-                    "playlist name.")
-            self._player.show_playlist(command[1])
-
-        elif command[0].upper() == "SHOW_ALL_PLAYLISTS":
-            self._player.show_all_playlists()
-
-        elif command[0].upper() == "SEARCH_VIDEOS":
-            if len(command) != 2:
-                raise CommandException(
-                    "Please enter SEARCH_VIDEOS command followed by a "
-                    "search term.")
-            self._player.search_videos(command[1])
-
-        elif command[0].upper() == "SEARCH_VIDEOS_WITH_TAG":
-            if len(command) != 2:
-                raise CommandException(
-                    "Please enter SEARCH_VIDEOS_WITH_TAG command followed by a "
-                    "video tag.")
-            self._player.search_videos_tag(command[1])
-
-        elif command[0].upper() == "FLAG_VIDEO":
-            if len(command) == 3:
-                self._player.flag_video(command[1], command[2])
-            elif len(command) == 2:
-                self._player.flag_video(command[1])
-            else:
-                raise CommandException(
-                    "Please enter FLAG_VIDEO command followed by a "
-                    "video_id and an optional flag reason.")
-
-        elif command[0].upper() == "ALLOW_VIDEO":
-            if len(command) != 2:
-                raise CommandException(
-                    "Please enter ALLOW_VIDEO command followed by a "
-                    "video_id.")
-            self._player.allow_video(command[1])
-
-        elif command[0].upper() == "HELP":
-            self._get_help()
+        registered_command = self._commands.get(command[0].upper())
+        if registered_command is None:
+            self._output.write(Output("invalid_command", {}))
+            return
+        handler, arities, error_message, _ = registered_command
+        if arities is None:
+            handler()
+        elif len(command) - 1 in arities:
+            handler(*command[1:])
         else:
-            print(
-                "Please enter a valid command, type HELP for a list of "
-                "available commands.")
+            raise CommandException(error_message)
+
+    def _register_player_commands(self):
+        player = self._player
+        self.register_command(
+            "NUMBER_OF_VIDEOS", player.number_of_videos,
+            help_text="NUMBER_OF_VIDEOS - Shows how many videos are in the library.")
+        self.register_command(
+            "SHOW_ALL_VIDEOS", player.show_all_videos, {0, 2},
+            "Please enter SHOW_ALL_VIDEOS command, optionally followed by an offset and a limit.",
+            "SHOW_ALL_VIDEOS [<offset> <limit>] - Lists all videos from the library, or a page of "
+            "them.")
+        self.register_command(
+            "PLAY", player.play_video, {1},
+            "Please enter PLAY command followed by video_id.",
+            "PLAY <video_id> - Plays specified video.")
+        self.register_command(
+            "PLAY_RANDOM", player.play_random_video,
+            help_text="PLAY_RANDOM - Plays a random video from the library.")
+        self.register_command(
+            "STOP", player.stop_video,
+            help_text="STOP - Stop the current video.")
+        self.register_command(
+            "PAUSE", player.pause_video,
+            help_text="PAUSE - Pause the current video.")
+        self.register_command(
+            "CONTINUE", player.continue_video,
+            help_text="CONTINUE - Resume the current paused video.")
+        self.register_command(
+            "SHOW_PLAYING", player.show_playing,
+            help_text="SHOW_PLAYING - Displays the title, url and paused status of the video that "
+                      "is currently playing (or paused).")
+        self.register_command(
+            "CREATE_PLAYLIST", player.create_playlist, {1},
+            "Please enter CREATE_PLAYLIST command followed by a playlist name.",
+            "CREATE_PLAYLIST <playlist_name> - Creates a new (empty) playlist with the provided "
+            "name.")
+        self.register_command(
+            "ADD_TO_PLAYLIST", player.add_to_playlist, {2},
+            "Please enter ADD_TO_PLAYLIST command followed by a playlist name and video_id to add.",
+            "ADD_TO_PLAYLIST <playlist_name> <video_id> - Adds the requested video to the "
+            "playlist.")
+        self.register_command(
+            "REMOVE_FROM_PLAYLIST", player.remove_from_playlist, {2},
+            "Please enter REMOVE_FROM_PLAYLIST command followed by a playlist name and video_id to "
+            "remove.",
+            "REMOVE_FROM_PLAYLIST <playlist_name> <video_id> - Removes the specified video from "
+            "the specified playlist")
+        self.register_command(
+            "ADD_VIDEOS_TO_PLAYLIST",
+            lambda playlist_name, *video_ids: player.add_videos_to_playlist(playlist_name, video_ids),
+            _AT_LEAST_TWO,
+            "Please enter ADD_VIDEOS_TO_PLAYLIST command followed by a playlist name and the "
+            "video_ids to add.",
+            "ADD_VIDEOS_TO_PLAYLIST <playlist_name> <video_id>... - Adds all the requested videos "
+            "to the playlist.")
+        self.register_command(
+            "ADD_TAG_TO_PLAYLIST", player.add_tag_to_playlist, {2},
+            "Please enter ADD_TAG_TO_PLAYLIST command followed by a playlist name and a video tag.",
+            "ADD_TAG_TO_PLAYLIST <playlist_name> <tag_name> - Adds all videos with the tag to the "
+            "playlist.")
+        self.register_command(
+            "ADD_SEARCH_TO_PLAYLIST", player.add_search_to_playlist, {2},
+            "Please enter ADD_SEARCH_TO_PLAYLIST command followed by a playlist name and a search "
+            "term.",
+            "ADD_SEARCH_TO_PLAYLIST <playlist_name> <search_term> - Adds all videos whose titles "
+            "contain the search_term to the playlist.")
+        self.register_command(
+            "REMOVE_VIDEOS_FROM_PLAYLIST",
+            lambda playlist_name, *video_ids: player.remove_videos_from_playlist(playlist_name,
+                                                                                 video_ids),
+            _AT_LEAST_TWO,
+            "Please enter REMOVE_VIDEOS_FROM_PLAYLIST command followed by a playlist name and the "
+            "video_ids to remove.",
+            "REMOVE_VIDEOS_FROM_PLAYLIST <playlist_name> <video_id>... - Removes all the specified "
+            "videos from the playlist.")
+        self.register_command(
+            "CLEAR_PLAYLIST", player.clear_playlist, {1},
+            "Please enter CLEAR_PLAYLIST command followed by a playlist name.",
+            "CLEAR_PLAYLIST <playlist_name> - Removes all the videos from the playlist.")
+        self.register_command(
+            "DELETE_PLAYLIST", player.delete_playlist, {1},
+            "Please enter DELETE_PLAYLIST command followed by a playlist name.",
+            "DELETE_PLAYLIST <playlist_name> - Deletes the playlist.")
+        self.register_command(
+            "SHOW_PLAYLIST", player.show_playlist, {1, 3},
+            "Please enter SHOW_PLAYLIST command followed by a playlist name, and optionally an "
+            "offset and a limit.",
+            "SHOW_PLAYLIST <playlist_name> [<offset> <limit>] - List all the videos in this "
+            "playlist, or a page of them.")
+        self.register_command(
+            "SHOW_ALL_PLAYLISTS", player.show_all_playlists,
+            help_text="SHOW_ALL_PLAYLISTS - Display all the available playlists.")
+        self.register_command(
+            "SEARCH_VIDEOS", player.search_videos, {1, 3},
+            "Please enter SEARCH_VIDEOS command followed by a search term, and optionally an "
+            "offset and a limit.",
+            "SEARCH_VIDEOS <search_term> [<offset> <limit>] - Display all the videos whose titles "
+            "contain the search_term, or a page of them.")
+        self.register_command(
+            "SEARCH_VIDEOS_RANKED",
+            lambda search_term, offset=0, limit=None: player.search_videos(
+                search_term, offset, limit, ranked=True),
+            {1, 3},
+            "Please enter SEARCH_VIDEOS_RANKED command followed by a search term, and optionally "
+            "an offset and a limit.",
+            "SEARCH_VIDEOS_RANKED <search_words> [<offset> <limit>] - Display the videos most "
+            "relevant to the search words (joined by _), by title and tags, best first.")
+        self.register_command(
+            "SEARCH_VIDEOS_FUZZY",
+            lambda search_term, offset=0, limit=None: player.search_videos(
+                search_term, offset, limit, fuzzy=True),
+            {1, 3},
+            "Please enter SEARCH_VIDEOS_FUZZY command followed by a search term, and optionally "
+            "an offset and a limit.",
+            "SEARCH_VIDEOS_FUZZY <search_words> [<offset> <limit>] - Display all the videos whose "
+            "titles contain the search words (joined by _), allowing for typos.")
+        self.register_command(
+            "SEARCH_VIDEOS_WITH_TAG", player.search_videos_tag, {1, 3},
+            "Please enter SEARCH_VIDEOS_WITH_TAG command followed by a video tag, and optionally "
+            "an offset and a limit.",
+            "SEARCH_VIDEOS_WITH_TAG <tag_name> [<offset> <limit>] -Display all videos whose tags "
+            "contains the provided tag, or a page of them.")
+        self.register_command(
+            "SEARCH_VIDEOS_WITH_TAG_FUZZY",
+            lambda video_tag, offset=0, limit=None: player.search_videos_tag(
+                video_tag, offset, limit, fuzzy=True),
+            {1, 3},
+            "Please enter SEARCH_VIDEOS_WITH_TAG_FUZZY command followed by a video tag, and "
+            "optionally an offset and a limit.",
+            "SEARCH_VIDEOS_WITH_TAG_FUZZY <tag_name> [<offset> <limit>] - Display all videos whose "
+            "tags are the provided tag, allowing for typos.")
+        self.register_command(
+            "FLAG_VIDEO", player.flag_video, {1, 2},
+            "Please enter FLAG_VIDEO command followed by a video_id and an optional flag reason.",
+            "FLAG_VIDEO <video_id> <flag_reason> - Mark a video as flagged.")
+        self.register_command(
+            "ALLOW_VIDEO", player.allow_video, {1},
+            "Please enter ALLOW_VIDEO command followed by a video_id.",
+            "ALLOW_VIDEO <video_id> - Removes a flag from a video.")
+        self.register_command(
+            "HELP", self._get_help,
+            help_text="HELP - Displays help.")
 
     def _get_help(self):
         """Displays all available commands to the user."""
-        help_text = textwrap.dedent("""
-        Available commands:
-            NUMBER_OF_VIDEOS - Shows how many videos are in the library.
-            SHOW_ALL_VIDEOS - Lists all videos from the library.
-            PLAY <video_id> - Plays specified video.
-            PLAY_RANDOM - Plays a random video from the library.
-            STOP - Stop the current video.
-            PAUSE - Pause the current video.
-            CONTINUE - Resume the current paused video.
-            SHOW_PLAYING - Displays the title, url and paused status of the video that is currently playing (or paused).
-            CREATE_PLAYLIST <playlist_name> - Creates a new (empty) playlist with the provided name.
-            ADD_TO_PLAYLIST <playlist_name> <video_id> - Adds the requested video to the playlist.
-            REMOVE_FROM_PLAYLIST <playlist_name> <video_id> - Removes the specified video from the specified playlist
-            CLEAR_PLAYLIST <playlist_name> - Removes all the videos from the playlist.
-            DELETE_PLAYLIST <playlist_name> - Deletes the playlist.
-            SHOW_PLAYLIST <playlist_name> - List all the videos in this playlist.
-            SHOW_ALL_PLAYLISTS - Display all the available playlists.
-            SEARCH_VIDEOS <search_term> - Display all the videos whose titles contain the search_term.
-            SEARCH_VIDEOS_WITH_TAG <tag_name> -Display all videos whose tags contains the provided tag.
-            FLAG_VIDEO <video_id> <flag_reason> - Mark a video as flagged.
-            ALLOW_VIDEO <video_id> - Removes a flag from a video.
-            HELP - Displays help.
-            EXIT - Terminates the program execution.
-        """)
-        print(help_text)
+        help_lines = [help_text for _, _, _, help_text in self._commands.values() if help_text]
+        help_lines.append("EXIT - Terminates the program execution.")
+        help_text = "\nAvailable commands:\n" + "".join(
+            f"    {help_line}\n" for help_line in help_lines)
+        self._output.write(Output("help", {"text": help_text}))
@@ -0,0 +1,30 @@
+"""Compiles a videos.txt file into a binary snapshot that VideoLibrary loads much faster, or into
+an SQLite catalog that VideoLibrary can query without loading it into memory.
+
+Usage (from the python/ directory):
+    python3 -m src.compile_catalog [path/to/videos.txt]
+    python3 -m src.compile_catalog [path/to/videos.txt] --database path/to/catalog.db
+"""
+import argparse
+import time
+
+from .video_database import write_database
+from .video_library import VideoLibrary
+
+
+if __name__ == "__main__":
+    argument_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    argument_parser.add_argument("videos_path", nargs="?")
+    argument_parser.add_argument(
+        "--database", metavar="PATH",
+        help="write an SQLite catalog to PATH instead of a snapshot")
+    args = argument_parser.parse_args()
+    start = time.perf_counter()
+    library = VideoLibrary(args.videos_path, compact=True, snapshot=False)
+    if args.database is None:
+        output_path = library.save_snapshot()
+    else:
+        write_database(args.database, library.get_all_videos())
+        output_path = args.database
+    print(f"Compiled {len(library)} videos into {output_path} "
+          f"in {time.perf_counter() - start:.2f}s")
@@ -1,44 +1,104 @@
-"""Potential for optimisations: all searches are implemented as linear search, and video_ids must
-be converted to lowercase for each comparison.
+"""Flags are kept in a FlagOverlay, a dictionary keyed by the lowercased video_id, so flagging,
+allowing and looking up a flag are all constant time.
 
-Additionally, flags are not stored anywhere persistently, and must manually be tacked-on after
-retrieving the videos from file. Ideally, this information would be stored either with the video,
-or all video information would be stored in a database.
+Flags are not stored by this class: a VideoPlayer given a StateStore saves them and hands them back
+through load_flags at startup. They are kept apart from the videos, and only joined to them as
+FlaggedVideo views when read, so the catalog itself never changes.
+
+Title and tag searches are cached in a SearchCache, keyed by the normalized search. Since the
+catalog never changes, cached results only go out of date when a video matching the search is
+flagged or allowed, so only those searches are removed from the cache.
 """
 
+from .flag_overlay import FlagOverlay
+from .search_cache import SearchCache
 from .video_library import VideoLibrary
 
 
 class FilteredVideoLibrary(VideoLibrary):
-    """A modified version of VideoLibrary class with added functionality for flagging videos."""
-    def __init__(self):
-        super().__init__()
-        self._flagged_videos = []
-        self._flag_reasons = []
+    """A modified version of VideoLibrary class with added functionality for flagging videos.
+
+    Safe to share between threads. The videos themselves are never modified, so they are read
+    without locks, and the flags are kept in a FlagOverlay, which only locks to change them. A
+    flagged video is returned as a FlaggedVideo view joining the video to its flag, so reads never
+    write to the shared Video objects.
+
+    The search_cache attribute is the SearchCache of search results, whose hits and misses
+    counters show how often searches are repeated.
+    """
+    def __init__(self, videos_path=None, lazy=False, compact=False, snapshot=True, database=None,
+                 search_cache_size=1024):
+        super().__init__(videos_path, lazy, compact, snapshot, database)
+        self._flags = FlagOverlay(self._video_ids)
+        self.search_cache = SearchCache(search_cache_size)
 
     def get_video(self, video_id):
         # Adds flag information to the video before returning them.
         video = super().get_video(video_id)
         if video is not None:
-            video = self._set_flagged_status(video)
+            video = self._flags.view(video)
         return video
 
     def get_all_videos(self):
         # Adds flag information to the videos before returning them.
-        initial_videos = super().get_all_videos()
-        videos = []
-        for video in initial_videos:
-            videos.append(self._set_flagged_status(video))
-        return videos
+        return [self._flags.view(video) for video in super().get_all_videos()]
+
+    def iter_videos_by_title(self, start=0, stop=None):
+        # Adds flag information to the videos as they are yielded.
+        view = self._flags.view
+        return (view(video) for video in super().iter_videos_by_title(start, stop))
 
     def get_all_non_flagged_videos(self):
         """Filters the master video list and removes any flagged videos"""
-        videos = self.get_all_videos()
-        non_flagged_videos = []
-        for video in videos:
-            if video.video_id not in self._flagged_videos:
-                non_flagged_videos.append(video)
-        return non_flagged_videos
+        return self._filter_flagged(super().get_all_videos())
+
+    def get_random_non_flagged_video(self):
+        """Picks a random video that is not flagged, in constant time.
+
+        Returns:
+            A random non-flagged Video object. None if every video is flagged.
+        """
+        video_id = self._flags.random_non_flagged_id()
+        if video_id is None:
+            return None
+        return self.get_video(video_id)
+
+    def search_titles(self, search_term):
+        # Leaves out flagged videos. None of the rest are flagged, so they need no flag information.
+        return self._cached_search(("title", search_term.lower()), super().search_titles,
+                                   search_term)
+
+    def search_tags(self, video_tags, match_any=False):
+        # Leaves out flagged videos. None of the rest are flagged, so they need no flag information.
+        tags = tuple(sorted({tag.lower() for tag in video_tags}))
+        return self._cached_search(("tags", tags, match_any), super().search_tags,
+                                   video_tags, match_any)
+
+    def search_ranked(self, search_term, limit):
+        # Leaves out flagged videos while ranking, so they never take the place of a result.
+        video_ids = self._video_ids
+        get_reason = self._flags.get_reason
+        ordinals = self._rank(search_term, limit,
+                              lambda ordinal: get_reason(video_ids[ordinal]) is None)
+        return self._get_videos_by_ordinal(ordinals)
+
+    def search_titles_fuzzy(self, search_term):
+        # Leaves out flagged videos. None of the rest are flagged, so they need no flag information.
+        return self._filter_flagged(super().search_titles_fuzzy(search_term))
+
+    def search_tags_fuzzy(self, video_tags, match_any=False):
+        # Leaves out flagged videos. None of the rest are flagged, so they need no flag information.
+        return self._filter_flagged(super().search_tags_fuzzy(video_tags, match_any))
+
+    def iter_search_titles(self, search_term):
+        # Leaves out flagged videos as they are reached. Bypasses the search cache, which only
+        # holds complete results.
+        return self._iter_non_flagged(super().iter_search_titles(search_term))
+
+    def iter_search_tags(self, video_tags, match_any=False):
+        # Leaves out flagged videos as they are reached. Bypasses the search cache, which only
+        # holds complete results.
+        return self._iter_non_flagged(super().iter_search_tags(video_tags, match_any))
 
     def flag_video(self, video_id, flag_reason=""):
         """Adds a flag to a given video
@@ -50,15 +110,32 @@ class FilteredVideoLibrary(VideoLibrary):
         Returns:
             A bool indicating whether the video was successfully flagged
         """
-        video = self.get_video(video_id)
+        video = super().get_video(video_id)
         if video is None:
             return False
-        if video.is_flagged:
+        flag_reason = flag_reason if flag_reason != "" else "Not supplied"
+        if not self._flags.flag(video.video_id, flag_reason):
             return False
-        self._flagged_videos.append(video_id)
-        self._flag_reasons.append(flag_reason if flag_reason != "" else "Not supplied")
+        self._invalidate_searches(video)
         return True
 
+    def load_flags(self, flags):
+        """Flags many videos at once, such as those loaded from a StateStore at startup.
+
+        Args:
+            flags: Maps the ID of each video to flag to the reason it was flagged. IDs of videos
+                that are not in the library are skipped.
+        """
+        if not flags:
+            return
+        get_catalog_video = super().get_video
+        newly_flagged = self._flags.load({video_id: flag_reason
+                                          for video_id, flag_reason in flags.items()
+                                          if get_catalog_video(video_id) is not None})
+        # Only videos that were not flagged before change any search results
+        for video_id in newly_flagged:
+            self._invalidate_searches(get_catalog_video(video_id))
+
     def allow_video(self, video_id):
         """Removes the flag from a previously flagged video
 
@@ -68,28 +145,42 @@ class FilteredVideoLibrary(VideoLibrary):
         Returns:
             A bool indicating whether a flag was removed from the given video
         """
-        video = self.get_video(video_id)
+        video = super().get_video(video_id)
         if video is None:
             return False
-        if not video.is_flagged:
+        if not self._flags.allow(video.video_id):
             return False
-        index = self._get_flag_index(video_id)
-        del self._flagged_videos[index]
-        del self._flag_reasons[index]
+        self._invalidate_searches(video)
         return True
 
-    def _set_flagged_status(self, video):
-        flag_index = self._get_flag_index(video.video_id)
-        if flag_index == -1:
-            video.is_flagged = False
-            video.flag_reason = ""
-        else:
-            video.is_flagged = True
-            video.flag_reason = self._flag_reasons[flag_index]
-        return video
+    def _cached_search(self, key, search, *arguments):
+        results = self.search_cache.get(key)
+        if results is None:
+            # Read before searching, in case a video is flagged or allowed during the search
+            generation = self.search_cache.generation
+            results = tuple(self._filter_flagged(search(*arguments)))
+            self.search_cache.put(key, results, generation)
+        return list(results)
+
+    def _invalidate_searches(self, video):
+        # The video was just flagged or allowed, changing the results of every search it matches
+        title = video.title.lower()
+        video_tags = {tag.lower() for tag in video.tags}
+
+        def matches(key):
+            if key[0] == "title":
+                return key[1] in title
+            _, tags, match_any = key
+            if match_any:
+                return not video_tags.isdisjoint(tags)
+            return bool(tags) and video_tags.issuperset(tags)
+
+        self.search_cache.invalidate(matches)
+
+    def _filter_flagged(self, videos):
+        get_reason = self._flags.get_reason
+        return [video for video in videos if get_reason(video.video_id) is None]
 
-    def _get_flag_index(self, video_id):
-        for i in range(len(self._flagged_videos)):
-            if self._flagged_videos[i].lower() == video_id.lower():
-                return i
-        return -1
+    def _iter_non_flagged(self, videos):
+        get_reason = self._flags.get_reason
+        return (video for video in videos if get_reason(video.video_id) is None)
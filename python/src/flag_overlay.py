@@ -0,0 +1,74 @@
+"""The flags of a video catalog, kept apart from the videos themselves."""
+
+import threading
+from typing import List, Mapping, Optional
+
+from .indexed_set import IndexedSet
+from .video import FlaggedVideo
+
+
+class FlagOverlay:
+    """Records which videos of a catalog are flagged, and joins the flags onto videos when read.
+
+    Safe to share between threads. Writers take turns under a lock, while readers take no lock at
+    all: each only looks up single flags, which a writer changes in one step, so a reader sees every
+    flag either as it was before a change or after it, never half way.
+    """
+
+    def __init__(self, video_ids):
+        """
+        Args:
+            video_ids: The IDs of every video in the catalog, none of which start flagged.
+        """
+        # Maps the lowercased video_id of each flagged video to the reason it was flagged
+        self._reasons = {}
+        # Held to change the flags, and to use _non_flagged_ids
+        self._lock = threading.Lock()
+        # IDs of every video that is not flagged, for picking one at random in constant time
+        self._non_flagged_ids = IndexedSet(video_ids)
+
+    def flag(self, video_id: str, flag_reason: str) -> bool:
+        """Flags a video of the catalog - returns false if it is already flagged."""
+        with self._lock:
+            if video_id.lower() in self._reasons:
+                return False
+            self._reasons[video_id.lower()] = flag_reason
+            self._non_flagged_ids.discard(video_id)
+            return True
+
+    def allow(self, video_id: str) -> bool:
+        """Removes the flag from a video of the catalog - returns false if it is not flagged."""
+        with self._lock:
+            if self._reasons.pop(video_id.lower(), None) is None:
+                return False
+            self._non_flagged_ids.add(video_id)
+            return True
+
+    def load(self, flags: Mapping[str, str]) -> List[str]:
+        """Flags many videos of the catalog at once, by video_id, replacing any earlier reasons.
+
+        Returns:
+            The IDs of the videos that were not flagged before.
+        """
+        newly_flagged = []
+        with self._lock:
+            for video_id, flag_reason in flags.items():
+                if self._reasons.get(video_id.lower()) is None:
+                    newly_flagged.append(video_id)
+                self._reasons[video_id.lower()] = flag_reason
+                self._non_flagged_ids.discard(video_id)
+        return newly_flagged
+
+    def get_reason(self, video_id: str) -> Optional[str]:
+        """Returns why a video was flagged, or None if it is not flagged."""
+        return self._reasons.get(video_id.lower())
+
+    def view(self, video):
+        """Returns the video as it should be shown: a FlaggedVideo if flagged, else the video."""
+        flag_reason = self._reasons.get(video.video_id.lower())
+        return video if flag_reason is None else FlaggedVideo(video, flag_reason)
+
+    def random_non_flagged_id(self) -> Optional[str]:
+        """Returns the ID of a random video that is not flagged, or None if all of them are."""
+        with self._lock:
+            return self._non_flagged_ids.choice()
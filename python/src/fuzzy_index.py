@@ -0,0 +1,134 @@
+"""A fuzzy word index class."""
+
+from array import array
+from typing import Iterable, List, Optional
+
+_GRAM_SIZE = 2
+# Pads words so their first and last characters are in as many bigrams as the middle ones
+_PADDING = "\0" * (_GRAM_SIZE - 1)
+# The most of a word's bigrams one edit can change: swapping two letters changes three
+_GRAMS_PER_EDIT = _GRAM_SIZE + 1
+
+
+def default_max_distance(word: str) -> int:
+    """Returns how many typos to allow in a word: none up to 2 characters, 2 from 6 characters."""
+    if len(word) <= 2:
+        return 0
+    return 1 if len(word) <= 5 else 2
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> Optional[int]:
+    """Returns the edit distance between two strings, or None if it is over max_distance.
+
+    The edits are inserting, deleting or replacing a character, or swapping two adjacent ones
+    (the optimal string alignment distance). Stops as soon as every way of editing one string into
+    the other needs more edits than allowed.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return None
+    before_previous = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i]
+        for j in range(1, len(b) + 1):
+            distance = min(previous[j] + 1, current[j - 1] + 1,
+                           previous[j - 1] + (a[i - 1] != b[j - 1]))
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                distance = min(distance, before_previous[j - 2] + 1)
+            current.append(distance)
+        # Each row only depends on the two before it
+        if min(current) > max_distance and (i == len(a) or min(previous) > max_distance):
+            return None
+        before_previous, previous = previous, current
+    return previous[-1] if previous[-1] <= max_distance else None
+
+
+class FuzzyIndex:
+    """Finds the words within a few typos (edits) of a word, out of a fixed set of words.
+
+    Each bigram (pair of adjacent characters) of each padded word maps to the ascending list of ids
+    of the words containing it, alongside how many times each contains it. Each edit changes at
+    most three of a word's bigrams, so a word within d edits of the query shares all but at most 3d
+    of the query's bigrams. Only the words sharing enough bigrams are compared with the query
+    character by character. A query too short to be sure of sharing any, for the edits allowed,
+    is instead compared with the words of about its length.
+    """
+
+    def __init__(self, words: Iterable[str] = ()):
+        self._words = []
+        self._postings = {}
+        # Maps each word length to the ids of the words that long
+        self._lengths = {}
+        for word in words:
+            self.add(word)
+
+    def add(self, word: str) -> int:
+        """Adds a word to the index.
+
+        Args:
+            word: The word to add. Expected not to be in the index already.
+
+        Returns:
+            The id the word was given.
+        """
+        word_id = len(self._words)
+        self._words.append(word)
+        self._lengths.setdefault(len(word), array("I")).append(word_id)
+        for gram, count in self._grams(word).items():
+            postings = self._postings.get(gram)
+            if postings is None:
+                postings = self._postings[gram] = (array("I"), array("H"))
+            postings[0].append(word_id)
+            postings[1].append(min(count, 0xFFFF))
+        return word_id
+
+    def search(self, word: str, max_distance: Optional[int] = None) -> List[str]:
+        """Finds the words in the index within a number of edits of a word.
+
+        Args:
+            word: The word to look for.
+            max_distance: (optional) The most edits allowed (see edit_distance). Defaults to
+                default_max_distance(word).
+
+        Returns:
+            The matching words, closest first. Equally close words are in the order they were
+            added.
+        """
+        if max_distance is None:
+            max_distance = default_max_distance(word)
+        grams = self._grams(word)
+        min_shared = sum(grams.values()) - _GRAMS_PER_EDIT * max_distance
+        if min_shared <= 0:
+            # Too short, for so many edits, to be sure of sharing any bigram
+            lengths = range(len(word) - max_distance, len(word) + max_distance + 1)
+            candidates = sorted(word_id for length in lengths
+                                for word_id in self._lengths.get(length, ()))
+        else:
+            shared = {}
+            for gram, query_count in grams.items():
+                postings = self._postings.get(gram)
+                if postings is not None:
+                    for word_id, count in zip(*postings):
+                        shared[word_id] = shared.get(word_id, 0) + min(count, query_count)
+            candidates = sorted(word_id for word_id, count in shared.items()
+                                if count >= min_shared)
+        matches = []
+        for word_id in candidates:
+            distance = edit_distance(word, self._words[word_id], max_distance)
+            if distance is not None:
+                matches.append((distance, word_id))
+        matches.sort()
+        return [self._words[word_id] for _, word_id in matches]
+
+    def __len__(self):
+        return len(self._words)
+
+    @staticmethod
+    def _grams(word):
+        # Maps each bigram of the padded word to how many times it occurs
+        padded = _PADDING + word + _PADDING
+        grams = {}
+        for i in range(len(padded) - _GRAM_SIZE + 1):
+            gram = padded[i:i + _GRAM_SIZE]
+            grams[gram] = grams.get(gram, 0) + 1
+        return grams
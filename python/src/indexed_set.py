@@ -0,0 +1,50 @@
+"""A set class supporting constant time random sampling."""
+
+import random
+
+
+class IndexedSet:
+    """A set whose items are also kept in a list, so a random item can be picked in constant time.
+
+    Removing an item swaps the last item into its slot, so iteration order is not insertion order
+    once items have been removed.
+    """
+
+    def __init__(self, items=()):
+        # Built in bulk rather than through add, as this is done for whole libraries at startup
+        self._items = list(dict.fromkeys(items))
+        self._positions = dict(zip(self._items, range(len(self._items))))
+
+    def add(self, item):
+        """Adds an item to the set - returns false if it was already present."""
+        if item in self._positions:
+            return False
+        self._positions[item] = len(self._items)
+        self._items.append(item)
+        return True
+
+    def discard(self, item):
+        """Removes an item from the set - returns false if it was not present."""
+        position = self._positions.pop(item, None)
+        if position is None:
+            return False
+        last_item = self._items.pop()
+        if position < len(self._items):
+            self._items[position] = last_item
+            self._positions[last_item] = position
+        return True
+
+    def choice(self, rng=random):
+        """Returns a random item from the set, or None if the set is empty."""
+        if not self._items:
+            return None
+        return self._items[rng.randrange(len(self._items))]
+
+    def __contains__(self, item):
+        return item in self._positions
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
@@ -0,0 +1,236 @@
+"""A StateStore that appends every change to a journal file, and compacts it into a snapshot.
+
+Each change is one JSON line in the journal. Changes are appended batch_size at a time, or sooner
+once the oldest has waited max_delay seconds, with one fsync per batch rather than per change. Once compact_after changes have been journaled, the whole
+state is written to a snapshot file and the journal starts again empty, so loading the state at
+startup never replays more than compact_after changes.
+
+The snapshot and the journal both record a generation number, which compaction increments. A
+journal whose generation does not match the snapshot's was already compacted into it (the process
+stopped between writing the snapshot and starting the new journal), so it is not replayed.
+"""
+
+import json
+import os
+import threading
+from typing import Optional
+
+from .state_store import FlushTimer, StateStore
+
+
+def _write_durably(path, text):
+    # Writes the file next to its final path first, so it is replaced whole or not at all
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "w", encoding="utf-8") as temporary_file:
+        temporary_file.write(text)
+        temporary_file.flush()
+        os.fsync(temporary_file.fileno())
+    os.replace(temporary_path, path)
+    if os.name == "posix":
+        # The rename itself is only durable once the directory holding the file is synced
+        directory = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+
+
+def _journal_header(generation):
+    return json.dumps({"generation": generation}) + "\n"
+
+
+def _journal_generation(header):
+    # Returns the generation a journal header records, or None if the header is damaged
+    try:
+        header = json.loads(header)
+    except ValueError:
+        return None
+    return header.get("generation") if isinstance(header, dict) else None
+
+
+class JournalStateStore(StateStore):
+    """Stores the state in an append-only journal file, plus a snapshot file next to it.
+
+    A crash loses at most the changes made in the last max_delay seconds. A change that was
+    only partly written when the process stopped is dropped when the journal is next loaded. Safe to
+    share between threads, which take turns under a lock.
+    """
+
+    def __init__(self, journal_path: str, batch_size: int = 256, compact_after: int = 10_000,
+                 max_delay: Optional[float] = 1.0):
+        """
+        Args:
+            journal_path: The journal file to use, created if it does not exist yet. The snapshot
+                is kept at the same path with ".snapshot" appended.
+            batch_size: (optional) How many changes to queue before appending them all at once.
+            compact_after: (optional) How many changes to journal before compacting the journal
+                into the snapshot.
+            max_delay: (optional) The most seconds a change is queued for before it is appended,
+                however few changes have been queued. None waits for batch_size changes.
+        """
+        self._journal_path = journal_path
+        self._snapshot_path = f"{journal_path}.snapshot"
+        self._batch_size = batch_size
+        self._compact_after = compact_after
+        # The current state, including changes not yet written: the reason each flagged video was
+        # flagged, and each playlist's (name, video ids) by lowercased name. The ids are the keys
+        # of a dict, to keep them in order as Playlist does.
+        self._flags = {}
+        self._playlists = {}
+        self._generation = 0
+        # How many changes the journal holds, and the JSON lines of those not yet written to it
+        self._journaled = 0
+        self._pending = []
+        self._appliers = {
+            "flag_video": self._apply_flag_video,
+            "allow_video": self._apply_allow_video,
+            "add_playlist": self._apply_add_playlist,
+            "remove_playlist": self._apply_remove_playlist,
+            "add_videos": self._apply_add_videos,
+            "remove_videos": self._apply_remove_videos,
+            "clear_playlist": self._apply_clear_playlist,
+        }
+        self._lock = threading.RLock()
+        self._flush_timer = FlushTimer(self._flush_pending, max_delay)
+        self._recover()
+        self._journal = open(self._journal_path, "a", encoding="utf-8")
+
+    def load(self):
+        with self._lock:
+            playlists = [(name, list(video_ids)) for name, video_ids in self._playlists.values()]
+            return dict(self._flags), playlists
+
+    def flag_video(self, video_id, flag_reason):
+        self._record("flag_video", video_id, flag_reason)
+
+    def allow_video(self, video_id):
+        self._record("allow_video", video_id)
+
+    def add_playlist(self, playlist_name):
+        self._record("add_playlist", playlist_name)
+
+    def remove_playlist(self, playlist_name):
+        self._record("remove_playlist", playlist_name.lower())
+
+    def add_videos(self, playlist_name, video_ids):
+        self._record("add_videos", playlist_name.lower(), list(video_ids))
+
+    def remove_videos(self, playlist_name, video_ids):
+        self._record("remove_videos", playlist_name.lower(), list(video_ids))
+
+    def clear_playlist(self, playlist_name):
+        self._record("clear_playlist", playlist_name.lower())
+
+    def flush(self):
+        with self._lock:
+            self._append_pending()
+            if self._journaled >= self._compact_after:
+                self.compact()
+
+    def compact(self):
+        """Writes the whole state to the snapshot, and starts the journal again empty."""
+        with self._lock:
+            self._append_pending()
+            generation = self._generation + 1
+            playlists = [[name, list(video_ids)] for name, video_ids in self._playlists.values()]
+            _write_durably(self._snapshot_path, json.dumps(
+                {"generation": generation, "flags": self._flags, "playlists": playlists}))
+            self._journal.close()
+            _write_durably(self._journal_path, _journal_header(generation))
+            self._journal = open(self._journal_path, "a", encoding="utf-8")
+            self._generation = generation
+            self._journaled = 0
+
+    def close(self):
+        with self._lock:
+            self.flush()
+            self._journal.close()
+
+    def _record(self, operation, *arguments):
+        with self._lock:
+            self._appliers[operation](*arguments)
+            self._pending.append(json.dumps([operation, *arguments]) + "\n")
+            if len(self._pending) >= self._batch_size:
+                self.flush()
+            else:
+                self._flush_timer.start()
+
+    def _flush_pending(self):
+        # Called by the flush timer, which may go off just after the store was flushed or closed
+        with self._lock:
+            if self._pending:
+                self.flush()
+
+    def _append_pending(self):
+        self._flush_timer.cancel()
+        if self._pending:
+            self._journal.write("".join(self._pending))
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+            self._journaled += len(self._pending)
+            self._pending.clear()
+
+    def _recover(self):
+        # Loads the snapshot, then replays the journal on top of it
+        if os.path.exists(self._snapshot_path):
+            with open(self._snapshot_path, encoding="utf-8") as snapshot_file:
+                snapshot = json.load(snapshot_file)
+            self._generation = snapshot["generation"]
+            self._flags = snapshot["flags"]
+            for name, video_ids in snapshot["playlists"]:
+                self._playlists[name.lower()] = (name, dict.fromkeys(video_ids))
+
+        if not os.path.exists(self._journal_path):
+            _write_durably(self._journal_path, _journal_header(self._generation))
+            return
+        with open(self._journal_path, "rb") as journal_file:
+            lines = journal_file.readlines()
+        if not lines or _journal_generation(lines[0]) != self._generation:
+            _write_durably(self._journal_path, _journal_header(self._generation))
+            return
+        replayed_length = len(lines[0])
+        for line in lines[1:]:
+            try:
+                if not line.endswith(b"\n"):
+                    raise ValueError("Incomplete line")
+                change = json.loads(line)
+                if not isinstance(change, list) or not change:
+                    raise ValueError("Not a change")
+                operation, *arguments = change
+                self._appliers[operation](*arguments)
+            except (ValueError, TypeError, KeyError):
+                # Written partly when the process stopped, or otherwise damaged - it and anything
+                # after it are dropped
+                break
+            replayed_length += len(line)
+            self._journaled += 1
+        os.truncate(self._journal_path, replayed_length)
+
+    def _apply_flag_video(self, video_id, flag_reason):
+        self._flags[video_id] = flag_reason
+
+    def _apply_allow_video(self, video_id):
+        self._flags.pop(video_id, None)
+
+    def _apply_add_playlist(self, playlist_name):
+        self._playlists.setdefault(playlist_name.lower(), (playlist_name, {}))
+
+    def _apply_remove_playlist(self, playlist_key):
+        self._playlists.pop(playlist_key, None)
+
+    def _apply_add_videos(self, playlist_key, video_ids):
+        playlist = self._playlists.get(playlist_key)
+        if playlist is not None:
+            for video_id in video_ids:
+                playlist[1].setdefault(video_id)
+
+    def _apply_remove_videos(self, playlist_key, video_ids):
+        playlist = self._playlists.get(playlist_key)
+        if playlist is not None:
+            for video_id in video_ids:
+                playlist[1].pop(video_id, None)
+
+    def _apply_clear_playlist(self, playlist_key):
+        playlist = self._playlists.get(playlist_key)
+        if playlist is not None:
+            playlist[1].clear()
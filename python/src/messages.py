@@ -0,0 +1,86 @@
+"""The messages the video player and command parser output, by kind.
+
+Output is passed around as a message kind and the fields to format its template with, so that
+callers wanting structured results never need to parse or even format the text.
+"""
+
+MESSAGES = {
+    # Commands
+    "invalid_command": "Please enter a valid command, type HELP for a list of available commands.",
+    "help": "{text}",
+
+    # Part 1
+    "number_of_videos": "{count} videos in the library",
+    "all_videos_header": "Here's a list of all available videos:",
+    "video": "{video}",
+    "play_video_missing": "Cannot play video: Video does not exist",
+    "play_video_flagged": "Cannot play video: Video is currently flagged (reason: {flag_reason})",
+    "playing_video": "Playing video: {title}",
+    "stop_nothing_playing": "Cannot stop video: No video is currently playing",
+    "stopping_video": "Stopping video: {title}",
+    "no_videos_available": "No videos available",
+    "pause_nothing_playing": "Cannot pause video: No video is currently playing",
+    "video_already_paused": "Video already paused: {title}",
+    "pausing_video": "Pausing video: {title}",
+    "continue_nothing_playing": "Cannot continue video: No video is currently playing",
+    "continue_not_paused": "Cannot continue video: Video is not paused",
+    "continuing_video": "Continuing video: {title}",
+    "nothing_playing": "No video is currently playing",
+    "currently_playing": "Currently playing: {video}",
+    "currently_playing_paused": "Currently playing: {video} - PAUSED",
+
+    # Part 2
+    "playlist_exists": "Cannot create playlist: A playlist with the same name already exists",
+    "playlist_created": "Successfully created new playlist: {playlist_name}",
+    "add_playlist_missing": "Cannot add video to {playlist_name}: Playlist does not exist",
+    "add_video_missing": "Cannot add video to {playlist_name}: Video does not exist",
+    "add_video_flagged":
+        "Cannot add video to {playlist_name}: Video is currently flagged (reason: {flag_reason})",
+    "add_video_duplicate": "Cannot add video to {playlist_name}: Video already added",
+    "video_added": "Added video to {playlist_name}: {title}",
+    "no_playlists": "No playlists exist yet",
+    "all_playlists_header": "Showing all playlists:",
+    "playlist_name": "{playlist_name}",
+    "show_playlist_missing": "Cannot show playlist {playlist_name}: Playlist does not exist",
+    "playlist_header": "Showing playlist: {playlist_name}",
+    "playlist_empty": "No videos here yet",
+    "remove_playlist_missing": "Cannot remove video from {playlist_name}: Playlist does not exist",
+    "remove_video_missing": "Cannot remove video from {playlist_name}: Video does not exist",
+    "remove_video_absent": "Cannot remove video from {playlist_name}: Video is not in playlist",
+    "video_removed": "Removed video from {playlist_name}: {title}",
+    "clear_playlist_missing": "Cannot clear playlist {playlist_name}: Playlist does not exist",
+    "playlist_cleared": "Successfully removed all videos from {playlist_name}",
+    "delete_playlist_missing": "Cannot delete playlist {playlist_name}: Playlist does not exist",
+    "playlist_deleted": "Deleted playlist: {playlist_name}",
+
+    # Bulk playlist commands
+    "add_videos_playlist_missing": "Cannot add videos to {playlist_name}: Playlist does not exist",
+    "videos_added":
+        "Added {added} videos to {playlist_name} "
+        "(skipped: {missing} do not exist, {flagged} flagged, {duplicate} already added)",
+    "remove_videos_playlist_missing":
+        "Cannot remove videos from {playlist_name}: Playlist does not exist",
+    "videos_removed":
+        "Removed {removed} videos from {playlist_name} "
+        "(skipped: {missing} do not exist, {absent} not in playlist)",
+
+    # Paginated listings
+    "invalid_page": "Cannot show page: Offset must be 0 or more, and limit 1 or more",
+    "more_results": "Showed {first} to {last}. For the next page, use offset {next_offset}",
+    "no_more_results": "Nothing to show from offset {offset}",
+
+    # Part 3
+    "no_search_results": "No search results for {query}",
+    "search_results_header": "Here are the results for {query}:",
+    "search_result": "{number}) {video}",
+    "search_prompt": "Would you like to play any of the above? If yes, specify the number of the video.",
+    "search_prompt_hint": "If your answer is not a valid number, we will assume it's a no.",
+
+    # Part 4
+    "flag_video_missing": "Cannot flag video: Video does not exist",
+    "flag_video_flagged": "Cannot flag video: Video is already flagged",
+    "video_flagged": "Successfully flagged video: {title} (reason: {flag_reason})",
+    "allow_video_missing": "Cannot remove flag from video: Video does not exist",
+    "allow_video_not_flagged": "Cannot remove flag from video: Video is not flagged",
+    "video_allowed": "Successfully removed flag from video: {title}",
+}
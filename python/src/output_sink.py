@@ -0,0 +1,94 @@
+"""Output sink classes, deciding where the output of the video player goes."""
+
+import abc
+import sys
+from typing import List
+
+from .messages import MESSAGES
+
+
+class Output:
+    """One line of output: a message kind (see messages.MESSAGES) and the fields of its template."""
+
+    __slots__ = ("kind", "fields")
+
+    def __init__(self, kind: str, fields: dict):
+        self.kind = kind
+        self.fields = fields
+
+    @property
+    def text(self) -> str:
+        """Returns the output formatted as text."""
+        return MESSAGES[self.kind].format(**self.fields)
+
+
+class OutputSink(abc.ABC):
+    """Receives the output of a VideoPlayer. Subclasses decide what to do with it."""
+
+    @abc.abstractmethod
+    def write(self, output: Output):
+        """Receives one line of output."""
+
+    def flush(self):
+        """Makes sure all output received so far has reached its destination."""
+        pass
+
+
+class StdoutSink(OutputSink):
+    """Prints each line of output to stdout straight away. The default sink."""
+
+    def write(self, output):
+        print(output.text)
+
+
+class BufferedSink(OutputSink):
+    """Formats output as text, but only writes it to the stream once enough has built up."""
+
+    def __init__(self, stream=None, buffer_lines=4096):
+        """
+        Args:
+            stream: (optional) The text stream to write to. Defaults to stdout.
+            buffer_lines: (optional) How many lines to hold before writing them all at once.
+        """
+        self._stream = stream
+        self._buffer_lines = buffer_lines
+        self._lines = []
+
+    def write(self, output):
+        self._lines.append(output.text)
+        if len(self._lines) >= self._buffer_lines:
+            self.flush()
+
+    def flush(self):
+        if self._lines:
+            stream = self._stream if self._stream is not None else sys.stdout
+            stream.write("\n".join(self._lines) + "\n")
+            self._lines.clear()
+            stream.flush()
+
+
+class ListSink(OutputSink):
+    """Keeps every line of output as text in a list."""
+
+    def __init__(self):
+        self.lines: List[str] = []
+
+    def write(self, output):
+        self.lines.append(output.text)
+
+
+class ResultSink(OutputSink):
+    """Keeps every line of output as an Output object, without ever formatting it as text."""
+
+    def __init__(self):
+        self.results: List[Output] = []
+
+    def write(self, output):
+        self.results.append(output)
+
+
+class NullSink(OutputSink):
+    """Discards all output."""
+
+    def write(self, output):
+        pass
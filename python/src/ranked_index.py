@@ -0,0 +1,132 @@
+"""A ranked search index class."""
+
+import heapq
+import math
+import re
+from array import array
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
+
+# Words are runs of letters and digits, so "funny_cats", "#cat" and "Cats!" all split into words
+_WORD = re.compile(r"[^\W_]+")
+
+
+def split_words(text: str) -> List[str]:
+    """Returns the lowercased words of a text, in order."""
+    return _WORD.findall(text.lower())
+
+
+class RankedIndex:
+    """Ranks videos by how relevant their titles and tags are to a query, with Okapi BM25.
+
+    Every video is identified by its ordinal, i.e. its position in the iterable the index was built
+    from. Each word of a lowercased title maps to the ascending list of ordinals of the titles
+    containing it, alongside how many times each contains it. A query word also found in a video's
+    tags (such as "cat" for "#cat") adds a boost to the video's score, weighted by how rare the tag
+    is, so a video can match on its tags alone.
+
+    The matches are scored in one pass over the query words' posting lists, and the best k picked
+    with a heap in time linear in the number of matches, without sorting all of them. Only those k
+    results are ever turned into videos.
+    """
+
+    # The BM25 parameters: how quickly repeating a word stops raising the score, and how much a
+    # long title lowers it
+    K1 = 1.2
+    B = 0.75
+    # How much a tag matching a query word counts for, relative to a title word as rare as the tag
+    TAG_BOOST = 0.5
+
+    def __init__(self, videos: Iterable[Tuple[str, Sequence[str]]] = ()):
+        self._size = 0
+        self._total_length = 0
+        # The number of words in each title
+        self._lengths = array("H")
+        # Maps each word to the (ordinals, counts) of the titles containing it
+        self._title_postings = {}
+        # Maps each word to the ordinals of the videos with a tag containing it
+        self._tag_postings = {}
+        for title, tags in videos:
+            self.add(title, tags)
+
+    def add(self, title: str, tags: Sequence[str]) -> int:
+        """Adds the title and tags of the next video to the index.
+
+        Args:
+            title: The title of the video.
+            tags: The tags of the video.
+
+        Returns:
+            The ordinal the video was given.
+        """
+        ordinal = self._size
+        self._size += 1
+        words = split_words(title)
+        self._lengths.append(min(len(words), 0xFFFF))
+        self._total_length += len(words)
+        counts = {}
+        for word in words:
+            counts[word] = counts.get(word, 0) + 1
+        for word, count in counts.items():
+            postings = self._title_postings.get(word)
+            if postings is None:
+                postings = self._title_postings[word] = (array("I"), array("H"))
+            postings[0].append(ordinal)
+            postings[1].append(min(count, 0xFFFF))
+        for word in {word for tag in tags for word in split_words(tag)}:
+            postings = self._tag_postings.get(word)
+            if postings is None:
+                postings = self._tag_postings[word] = array("I")
+            postings.append(ordinal)
+        return ordinal
+
+    def search(self, query: str, limit: int, keep: Optional[Callable[[int], bool]] = None
+               ) -> List[int]:
+        """Finds the videos most relevant to a query, ignoring case.
+
+        Args:
+            query: The words to look for, in any order.
+            limit: The most videos to return.
+            keep: (optional) Given the ordinal of a matching video, returns whether it may be a
+                result. Videos left out this way never take the place of a result.
+
+        Returns:
+            The ordinals of the best matching videos, most relevant first. Equally relevant
+            videos are in ordinal order.
+        """
+        words = set(split_words(query))
+        if not words or limit <= 0:
+            return []
+        average_length = self._total_length / self._size if self._total_length else 1
+        lengths = self._lengths
+        scores = {}
+        for word in words:
+            postings = self._title_postings.get(word)
+            if postings is not None:
+                weight = self._inverse_frequency(len(postings[0])) * (self.K1 + 1)
+                for ordinal, count in zip(*postings):
+                    norm = self.K1 * (1 - self.B + self.B * lengths[ordinal] / average_length)
+                    scores[ordinal] = scores.get(ordinal, 0.0) + weight * count / (count + norm)
+            tag_postings = self._tag_postings.get(word)
+            if tag_postings is not None:
+                boost = self.TAG_BOOST * self._inverse_frequency(len(tag_postings))
+                for ordinal in tag_postings:
+                    scores[ordinal] = scores.get(ordinal, 0.0) + boost
+        candidates = scores.items()
+        if keep is not None:
+            candidates = (candidate for candidate in candidates if keep(candidate[0]))
+        best = heapq.nlargest(limit, candidates,
+                              key=lambda candidate: (candidate[1], -candidate[0]))
+        return [ordinal for ordinal, _ in best]
+
+    def title_words(self) -> List[str]:
+        """Returns every distinct word of the titles, in the order they were first added."""
+        return list(self._title_postings)
+
+    def titles_with_word(self, word: str) -> Sequence[int]:
+        """Returns the ascending ordinals of the titles containing a word."""
+        postings = self._title_postings.get(word)
+        return postings[0] if postings is not None else ()
+
+    def _inverse_frequency(self, matches):
+        # The BM25 weight of a word found in the given number of videos: the rarer, the higher
+        return math.log(1 + (self._size - matches + 0.5) / (matches + 0.5))
@@ -1,14 +1,39 @@
-"""A youtube terminal simulator."""
+"""A youtube terminal simulator.
+
+Usage (from the python/ directory):
+    python3 -m src.run                   Interactive mode.
+    python3 -m src.run --batch [FILE]    Executes the commands in FILE (or piped into stdin, if no
+                                         FILE or "-" is given) one per line, then reports how many
+                                         commands per second were executed on stderr.
+    python3 -m src.run --state DATABASE  Loads flags and playlists from the SQLite DATABASE file
+                                         (created if missing), and saves every change to them there.
+                                         Can be combined with --batch.
+    python3 -m src.run --journal FILE    As --state, but appends the changes to a journal FILE,
+                                         which is compacted into FILE.snapshot as it grows.
+"""
+import argparse
+import contextlib
+import io
+import sys
+import time
+
 from .video_player import VideoPlayer
 from .command_parser import CommandException
 from .command_parser import CommandParser
+from .journal_state_store import JournalStateStore
+from .state_store import SqliteStateStore
 
+# Output is flushed to the terminal in chunks of this many bytes in batch mode
+BATCH_OUTPUT_BUFFER_SIZE = 1 << 20
 
-if __name__ == "__main__":
-    print("""Hello and welcome to YouTube, what would you like to do?
-    Enter HELP for list of available commands or EXIT to terminate.""")
-    video_player = VideoPlayer()
-    parser = CommandParser(video_player)
+WELCOME_MESSAGE = """Hello and welcome to YouTube, what would you like to do?
+    Enter HELP for list of available commands or EXIT to terminate."""
+GOODBYE_MESSAGE = "YouTube has now terminated its execution. Thank you and goodbye!"
+
+
+def run_interactive(parser):
+    """Reads commands typed by the user and executes them until EXIT is entered."""
+    print(WELCOME_MESSAGE)
     while True:
         command = input("YT> ")
         if command.upper() == "EXIT":
@@ -17,5 +42,97 @@ if __name__ == "__main__":
             parser.execute_command(command.split())
         except CommandException as e:
             print(e)
-    print("YouTube has now terminated its execution. "
-          "Thank you and goodbye!")
+    print(GOODBYE_MESSAGE)
+
+
+def run_batch(parser, command_file):
+    """Executes every command in a file, one per line, until the file ends or EXIT is read.
+
+    Commands that ask a question (such as SEARCH_VIDEOS) read their answer from the next line of
+    the file, as they would from the next line typed in interactive mode.
+
+    Args:
+        parser: The CommandParser to execute the commands with.
+        command_file: The text file to read the commands from.
+
+    Returns:
+        The number of commands executed.
+    """
+    commands_executed = 0
+    with _stdin_from(command_file):
+        for line in iter(command_file.readline, ""):
+            command = line.split()
+            if command and command[0].upper() == "EXIT":
+                break
+            try:
+                parser.execute_command(command)
+            except CommandException as e:
+                print(e)
+            commands_executed += 1
+    return commands_executed
+
+
+@contextlib.contextmanager
+def _stdin_from(command_file):
+    # input() reads from sys.stdin, so questions are answered from the command file
+    stdin = sys.stdin
+    sys.stdin = command_file
+    try:
+        yield
+    finally:
+        sys.stdin = stdin
+
+
+def _buffered_stdout():
+    sys.stdout.flush()
+    return io.TextIOWrapper(
+        io.BufferedWriter(io.FileIO(sys.stdout.fileno(), "w", closefd=False),
+                          buffer_size=BATCH_OUTPUT_BUFFER_SIZE),
+        encoding=sys.stdout.encoding)
+
+
+def _main():
+    argument_parser = argparse.ArgumentParser(description="A youtube terminal simulator.")
+    argument_parser.add_argument(
+        "--batch", nargs="?", const="-", metavar="FILE",
+        help="execute the commands in FILE (or stdin) instead of prompting for them")
+    state_arguments = argument_parser.add_mutually_exclusive_group()
+    state_arguments.add_argument(
+        "--state", metavar="DATABASE",
+        help="keep flags and playlists in the SQLite DATABASE file between runs")
+    state_arguments.add_argument(
+        "--journal", metavar="FILE",
+        help="keep flags and playlists in the journal FILE between runs")
+    args = argument_parser.parse_args()
+
+    with contextlib.ExitStack() as stack:
+        state_store = None
+        if args.state is not None:
+            state_store = SqliteStateStore(args.state)
+        elif args.journal is not None:
+            state_store = JournalStateStore(args.journal)
+        if state_store is not None:
+            # Registered first, so it is closed last, after any output has been flushed
+            stack.callback(state_store.close)
+        video_player = VideoPlayer(state_store=state_store)
+        parser = CommandParser(video_player)
+        if args.batch is None:
+            run_interactive(parser)
+            return
+
+        if args.batch == "-":
+            command_file = sys.stdin
+        else:
+            command_file = stack.enter_context(open(args.batch))
+        output = stack.enter_context(_buffered_stdout())
+        stack.enter_context(contextlib.redirect_stdout(output))
+        start = time.perf_counter()
+        commands_executed = run_batch(parser, command_file)
+        output.flush()
+        elapsed = time.perf_counter() - start
+    print(f"Executed {commands_executed} commands in {elapsed:.3f}s "
+          f"({commands_executed / elapsed if elapsed else 0:,.0f} commands/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    _main()
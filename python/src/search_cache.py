@@ -0,0 +1,82 @@
+"""A bounded cache of search results, for the searches a library is asked to repeat most."""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional, Sequence
+
+
+class SearchCache:
+    """Keeps the results of recently used searches, up to a maximum number of searches.
+
+    Entries are removed selectively through invalidate when the results of some searches change.
+    Safe to share between threads. Lookups take no lock: a hit only marks its entry as used, in one
+    step, and a full cache evicts with the second chance (clock) approximation of least recently
+    used - the oldest entry goes, unless it was used since it was last looked at, in which case it
+    is moved to the back and marked unused. Only put and invalidate lock, to change the entries.
+    The hits and misses counters are likewise updated without a lock, so are approximate while
+    several threads search at once.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        """
+        Args:
+            max_size: (optional) The most searches to keep results for. 0 disables the cache.
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        # Maps each search's key to a [results, used since last looked at] list, oldest first
+        self._entries = OrderedDict()
+        # Counts invalidations, so results computed while one happened are not stored
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        """Pass to put, having read it before computing the results to store."""
+        return self._generation
+
+    def get(self, key: Hashable) -> Optional[Sequence]:
+        """Returns the cached results of a search, or None if there are none."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        entry[1] = True
+        return entry[0]
+
+    def put(self, key: Hashable, results: Sequence, generation: int):
+        """Caches the results of a search, evicting a search not used lately if full.
+
+        Args:
+            key: The normalized search.
+            results: The results to cache, which must not be modified afterwards.
+            generation: The generation read before computing the results. If an invalidation
+                happened since, the results may already be out of date, so are not cached.
+        """
+        with self._lock:
+            if generation != self._generation or self.max_size <= 0:
+                return
+            self._entries[key] = [results, False]
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                oldest_key, oldest = self._entries.popitem(last=False)
+                if oldest[1]:
+                    # Used since it was last looked at: given a second chance at the back
+                    oldest[1] = False
+                    self._entries[oldest_key] = oldest
+
+    def invalidate(self, affected: Callable[[Hashable], bool]):
+        """Removes the cached results of every search whose key the function returns true for."""
+        with self._lock:
+            self._generation += 1
+            for key in [key for key in self._entries if affected(key)]:
+                del self._entries[key]
+
+    def clear(self):
+        """Removes all cached results."""
+        self.invalidate(lambda key: True)
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,193 @@
+"""A TCP front-end serving the video player to many clients at once.
+
+Usage (from the python/ directory):
+    python3 -m src.server [--host HOST] [--port PORT]
+
+Clients send commands one per line, as typed in interactive mode, and receive the output one line
+at a time. Each connection is a session of its own, with its own playback state and playlists, over
+one shared video library. EXIT (or closing the connection) ends the session.
+"""
+import argparse
+import asyncio
+import itertools
+
+from .command_parser import CommandException, CommandParser
+from .output_sink import OutputSink
+from .run import GOODBYE_MESSAGE, WELCOME_MESSAGE
+from .session_manager import SessionManager
+
+# Commands longer than this many bytes are refused, and the connection closed
+MAX_COMMAND_LENGTH = 1 << 16
+# The most bytes of commands read from a client at once
+READ_SIZE = 1 << 16
+# How many bytes of output to collect for a client before sending them and waiting for the client
+# to read them, before executing any more of its commands
+SEND_SIZE = 1 << 16
+
+
+class _ConnectionSink(OutputSink):
+    """Collects the output for a client, to be sent by the server between slices of commands.
+
+    The commands run on a worker thread, which never touches the connection. Only the event loop
+    sends the collected output, once the worker has returned.
+    """
+
+    def __init__(self):
+        self._lines = []
+        self.size = 0
+
+    def write(self, output):
+        self.write_text(output.text)
+
+    def write_text(self, text):
+        """Adds a line of text that is not a player's Output, such as an error message."""
+        self._lines.append(text)
+        self.size += len(text) + 1
+
+    def flush(self):
+        # The server sends the output as soon as the command asking for it (such as a question
+        # awaiting its answer) has returned
+        pass
+
+    def take(self):
+        """Returns the output collected so far as bytes, and starts collecting afresh."""
+        if not self._lines:
+            return b""
+        self._lines.append("")
+        data = "\n".join(self._lines).encode("utf-8")
+        self._lines.clear()
+        self.size = 0
+        return data
+
+
+class VideoPlayerServer:
+    """Serves a session to each client connected over TCP, with all the I/O done asynchronously.
+
+    Commands are executed on worker threads, so a long command (such as listing a huge catalog)
+    never holds up the other clients. The commands a client has sent so far are executed in slices,
+    each ending once SEND_SIZE bytes of output have been collected, so a client sending many commands
+    at once gets the output back in few writes. Between slices the event loop sends the output and
+    waits until the client has read enough of it (asyncio's drain) before running the next slice.
+
+    No worker thread ever waits for a client, so clients that stop reading hold up only their own
+    commands, however many of them there are. The output waiting for each of them never grows past
+    about SEND_SIZE plus the output of one command plus the transport's high-water mark.
+    """
+
+    def __init__(self, sessions=None, max_command_length=MAX_COMMAND_LENGTH):
+        """
+        Args:
+            sessions: (optional) The SessionManager to open the clients' sessions in. Defaults to
+                one over the bundled videos.txt file.
+            max_command_length: (optional) The longest command line accepted, in bytes.
+        """
+        self._sessions = sessions if sessions is not None else SessionManager()
+        self._max_command_length = max_command_length
+        self._connection_numbers = itertools.count(1)
+
+    async def start(self, host="127.0.0.1", port=0):
+        """Starts accepting connections.
+
+        Args:
+            host: (optional) The address to listen on. Defaults to localhost only.
+            port: (optional) The port to listen on. Defaults to any free port.
+
+        Returns:
+            The asyncio.Server, whose sockets tell the port picked.
+        """
+        return await asyncio.start_server(self._serve_client, host, port)
+
+    async def _serve_client(self, reader, writer):
+        session_id = f"connection_{next(self._connection_numbers)}"
+        output = _ConnectionSink()
+        player = self._sessions.open_session(session_id, output, defer_answers=True)
+        parser = CommandParser(player, output)
+        try:
+            output.write_text(WELCOME_MESSAGE)
+            unfinished_line = b""
+            running = True
+            while running:
+                writer.write(output.take())
+                await writer.drain()
+                data = await reader.read(READ_SIZE)
+                if not data:
+                    # A last command without a newline still counts
+                    if unfinished_line:
+                        await self._execute_lines(player, parser, output, writer,
+                                                  [unfinished_line])
+                    break
+                lines = (unfinished_line + data).split(b"\n")
+                unfinished_line = lines.pop()
+                if len(unfinished_line) > self._max_command_length:
+                    output.write_text("Command too long")
+                    break
+                running = await self._execute_lines(player, parser, output, writer, lines)
+            writer.write(output.take())
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._sessions.close_session(session_id)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _execute_lines(self, player, parser, output, writer, lines):
+        # Executes the lines a slice at a time, sending each slice's output before the next.
+        # Returns false once the client has sent EXIT.
+        loop = asyncio.get_running_loop()
+        start = 0
+        while start < len(lines):
+            start, running = await loop.run_in_executor(
+                None, self._execute_slice, player, parser, output, lines, start)
+            if not running:
+                return False
+            if start < len(lines):
+                writer.write(output.take())
+                await writer.drain()
+        return True
+
+    @staticmethod
+    def _execute_slice(player, parser, output, lines, start):
+        # Executes lines from start until SEND_SIZE bytes of output are waiting. Returns where the
+        # next slice starts, and false once the client has sent EXIT.
+        for i in range(start, len(lines)):
+            command = lines[i].decode("utf-8", errors="replace").rstrip("\r")
+            if player.has_question:
+                player.answer_question(command)
+            elif command.upper() == "EXIT":
+                output.write_text(GOODBYE_MESSAGE)
+                return i + 1, False
+            else:
+                try:
+                    parser.execute_command(command.split())
+                except CommandException as e:
+                    output.write_text(str(e))
+            if output.size >= SEND_SIZE:
+                return i + 1, True
+        return len(lines), True
+
+
+async def _serve(host, port):
+    server = await VideoPlayerServer().start(host, port)
+    for server_socket in server.sockets:
+        print(f"Serving on {server_socket.getsockname()}")
+    async with server:
+        await server.serve_forever()
+
+
+def _main():
+    argument_parser = argparse.ArgumentParser(description="Serves the video player over TCP.")
+    argument_parser.add_argument("--host", default="127.0.0.1")
+    argument_parser.add_argument("--port", type=int, default=8000)
+    args = argument_parser.parse_args()
+    try:
+        asyncio.run(_serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    _main()
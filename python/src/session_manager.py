@@ -0,0 +1,75 @@
+"""Hosts many users' video players in one process, over one shared video library."""
+
+from typing import Dict, Optional
+
+from .filtered_video_library import FilteredVideoLibrary
+from .output_sink import OutputSink
+from .state_store import NullStateStore, StateStore
+from .video_player import VideoPlayer
+
+
+class SessionManager:
+    """Keeps a VideoPlayer for each open session, all playing from the same FilteredVideoLibrary.
+
+    The videos and their search indexes are loaded once, however many sessions there are. Each
+    session only adds its own playback state and playlists on top.
+
+    Flags are global: a video flagged in one session is flagged in all of them. They are kept in a
+    single flag store, loaded once when the manager starts and told about every session's flag
+    changes, while each session's own store only keeps its playlists.
+    """
+
+    def __init__(self, video_library: Optional[FilteredVideoLibrary] = None,
+                 flag_store: Optional[StateStore] = None):
+        """
+        Args:
+            video_library: (optional) The library every session plays videos from. Defaults to one
+                loaded from the bundled videos.txt file.
+            flag_store: (optional) The StateStore keeping the flags between runs. Only its flags
+                are used. Defaults to not keeping them.
+        """
+        self._video_library = video_library if video_library is not None else FilteredVideoLibrary()
+        self._flag_store = flag_store if flag_store is not None else NullStateStore()
+        self._sessions: Dict[str, VideoPlayer] = {}
+        flags, _ = self._flag_store.load()
+        self._video_library.load_flags(flags)
+
+    @property
+    def video_library(self) -> FilteredVideoLibrary:
+        return self._video_library
+
+    def open_session(self, session_id: str, output: Optional[OutputSink] = None,
+                     state_store: Optional[StateStore] = None,
+                     defer_answers: bool = False) -> VideoPlayer:
+        """Starts a new session.
+
+        Args:
+            session_id: Unique session ID string.
+            output: (optional) The OutputSink to send the session's output to. Defaults to
+                printing it.
+            state_store: (optional) The StateStore keeping the session's playlists between runs.
+                Any flags in it are ignored, as flags are kept in the manager's flag store.
+                Defaults to not keeping them.
+            defer_answers: (optional) Whether the session's questions are answered through
+                VideoPlayer.answer_question rather than input(). Defaults to input().
+
+        Returns:
+            The session's VideoPlayer.
+        """
+        if session_id in self._sessions:
+            raise ValueError(f"Session {session_id} is already open")
+        player = VideoPlayer(self._video_library, output, state_store, defer_answers,
+                             self._flag_store)
+        self._sessions[session_id] = player
+        return player
+
+    def get_session(self, session_id: str) -> Optional[VideoPlayer]:
+        """Returns the VideoPlayer of an open session, or None if there is no such session."""
+        return self._sessions.get(session_id)
+
+    def close_session(self, session_id: str) -> bool:
+        """Ends a session - returns false if there is no such session."""
+        return self._sessions.pop(session_id, None) is not None
+
+    def __len__(self):
+        return len(self._sessions)
@@ -0,0 +1,202 @@
+"""Stores that keep the user's state (flags and playlists) between runs of the video player.
+
+A VideoPlayer loads everything from its store in one go when it starts, and then tells the store
+about every change it makes. SqliteStateStore writes those changes behind: they are queued and
+written in a single transaction once enough have built up, once the oldest has waited max_delay
+seconds, or when the store is flushed or closed.
+"""
+
+import sqlite3
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# The state a store loads: the reason each flagged video (by video_id) was flagged, and each
+# playlist as its name and video ids, in the order they were added
+StoredState = Tuple[Dict[str, str], List[Tuple[str, List[str]]]]
+
+
+class StateStore:
+    """Receives the changes a VideoPlayer makes to its state. Subclasses decide where they go.
+
+    Playlists are identified by their lowercased names, as in PlaylistLibrary.
+    """
+
+    def load(self) -> StoredState:
+        """Returns all the state stored so far."""
+        return {}, []
+
+    def flag_video(self, video_id: str, flag_reason: str):
+        pass
+
+    def allow_video(self, video_id: str):
+        pass
+
+    def add_playlist(self, playlist_name: str):
+        pass
+
+    def remove_playlist(self, playlist_name: str):
+        pass
+
+    def add_videos(self, playlist_name: str, video_ids: Iterable[str]):
+        """Adds videos to the end of a playlist, skipping any already in it."""
+        pass
+
+    def remove_videos(self, playlist_name: str, video_ids: Iterable[str]):
+        pass
+
+    def clear_playlist(self, playlist_name: str):
+        pass
+
+    def flush(self):
+        """Makes sure every change received so far has been stored."""
+        pass
+
+    def close(self):
+        """Flushes the store and releases anything it holds open."""
+        self.flush()
+
+
+class FlushTimer:
+    """Calls a store's flush function once the oldest change not yet written has waited long enough.
+
+    Bounds how many changes a crash can lose in a quiet session, where batches would take a long
+    time to fill up. Only used while holding the store's lock.
+    """
+
+    def __init__(self, flush: Callable[[], None], max_delay: Optional[float]):
+        self._flush = flush
+        self._max_delay = max_delay
+        self._timer = None
+
+    def start(self):
+        """Starts counting down, if not already, as a change has just been queued."""
+        if self._max_delay is not None and self._timer is None:
+            self._timer = threading.Timer(self._max_delay, self._flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def cancel(self):
+        """Stops counting down, as every change queued so far has just been written."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+
+class NullStateStore(StateStore):
+    """Stores nothing, so all state is lost when the video player exits. The default store."""
+    pass
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS flags (
+    video_id TEXT PRIMARY KEY,
+    flag_reason TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS playlists (
+    playlist_key TEXT PRIMARY KEY,
+    name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS playlist_videos (
+    position INTEGER PRIMARY KEY AUTOINCREMENT,
+    playlist_key TEXT NOT NULL,
+    video_id TEXT NOT NULL,
+    UNIQUE (playlist_key, video_id)
+);
+"""
+
+
+class SqliteStateStore(StateStore):
+    """Stores the state in an SQLite database file.
+
+    Changes are written behind, batch_size at a time, or sooner once the oldest of them has waited
+    max_delay seconds, so a crash loses at most the changes made in the last max_delay seconds.
+    Safe to share between threads, which take turns under a lock.
+    """
+
+    def __init__(self, database_path: str, batch_size: int = 256, max_delay: Optional[float] = 1.0):
+        """
+        Args:
+            database_path: The database file to use, created if it does not exist yet.
+            batch_size: (optional) How many changes to queue before writing them all at once.
+            max_delay: (optional) The most seconds a change is queued for before it is written,
+                however few changes have been queued. None waits for batch_size changes.
+        """
+        # Only used while holding _lock, so any thread may use it
+        self._connection = sqlite3.connect(database_path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        # Each batch is committed atomically, but a power cut may lose the last few batches
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+        self._batch_size = batch_size
+        # The (statement, parameters) of each change not yet written, in order
+        self._pending = []
+        self._lock = threading.RLock()
+        self._flush_timer = FlushTimer(self._flush_pending, max_delay)
+
+    def load(self):
+        with self._lock:
+            self.flush()
+            flags = dict(self._connection.execute("SELECT video_id, flag_reason FROM flags"))
+            playlists = {playlist_key: (name, []) for playlist_key, name in
+                         self._connection.execute("SELECT playlist_key, name FROM playlists")}
+            for playlist_key, video_id in self._connection.execute(
+                    "SELECT playlist_key, video_id FROM playlist_videos ORDER BY position"):
+                playlists[playlist_key][1].append(video_id)
+        return flags, list(playlists.values())
+
+    def flag_video(self, video_id, flag_reason):
+        self._queue("INSERT OR REPLACE INTO flags VALUES (?, ?)", (video_id, flag_reason))
+
+    def allow_video(self, video_id):
+        self._queue("DELETE FROM flags WHERE video_id = ?", (video_id,))
+
+    def add_playlist(self, playlist_name):
+        self._queue("INSERT OR IGNORE INTO playlists VALUES (?, ?)",
+                    (playlist_name.lower(), playlist_name))
+
+    def remove_playlist(self, playlist_name):
+        self.clear_playlist(playlist_name)
+        self._queue("DELETE FROM playlists WHERE playlist_key = ?", (playlist_name.lower(),))
+
+    def add_videos(self, playlist_name, video_ids):
+        playlist_key = playlist_name.lower()
+        for video_id in video_ids:
+            self._queue("INSERT OR IGNORE INTO playlist_videos (playlist_key, video_id) VALUES (?, ?)",
+                        (playlist_key, video_id))
+
+    def remove_videos(self, playlist_name, video_ids):
+        playlist_key = playlist_name.lower()
+        for video_id in video_ids:
+            self._queue("DELETE FROM playlist_videos WHERE playlist_key = ? AND video_id = ?",
+                        (playlist_key, video_id))
+
+    def clear_playlist(self, playlist_name):
+        self._queue("DELETE FROM playlist_videos WHERE playlist_key = ?", (playlist_name.lower(),))
+
+    def flush(self):
+        with self._lock:
+            self._flush_timer.cancel()
+            if self._pending:
+                with self._connection:
+                    for statement, parameters in self._pending:
+                        self._connection.execute(statement, parameters)
+                self._pending.clear()
+
+    def close(self):
+        with self._lock:
+            self.flush()
+            self._connection.close()
+
+    def _queue(self, statement, parameters):
+        with self._lock:
+            self._pending.append((statement, parameters))
+            if len(self._pending) >= self._batch_size:
+                self.flush()
+            else:
+                self._flush_timer.start()
+
+    def _flush_pending(self):
+        # Called by the flush timer, which may go off just after the store was flushed or closed
+        with self._lock:
+            if self._pending:
+                self.flush()
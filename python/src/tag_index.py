@@ -0,0 +1,138 @@
+"""A tag search index class."""
+
+from array import array
+from bisect import bisect_left
+from itertools import accumulate, chain
+from typing import Iterable, Iterator, List, Sequence
+
+from .buffer_strings import join_lines, split_lines
+
+
+class TagIndex:
+    """An inverted index from lowercased video tags to the videos carrying them.
+
+    Every video is identified by its ordinal, i.e. its position in the iterable the index was built
+    from. Each tag maps to the ascending list ("posting list") of ordinals of the videos with that
+    tag, so queries over several tags can be answered by intersecting or merging sorted lists.
+    """
+
+    def __init__(self, video_tags: Iterable[Sequence[str]] = ()):
+        self._size = 0
+        self._postings = {}
+        for tags in video_tags:
+            self.add(tags)
+
+    def add(self, tags: Sequence[str]) -> int:
+        """Adds the tags of the next video to the index.
+
+        Args:
+            tags: The tags of the video.
+
+        Returns:
+            The ordinal the video was given.
+        """
+        ordinal = self._size
+        self._size += 1
+        for tag in {tag.lower() for tag in tags}:
+            postings = self._postings.get(tag)
+            if postings is None:
+                postings = self._postings[tag] = array("I")
+            postings.append(ordinal)
+        return ordinal
+
+    def search(self, tags: Sequence[str], match_any=False) -> List[int]:
+        """Finds the videos carrying the given tags, ignoring case.
+
+        Args:
+            tags: The tags to look for.
+            match_any: (optional) Match videos with any of the tags, instead of all of them.
+
+        Returns:
+            The ascending ordinals of the matching videos.
+        """
+        postings = [self._postings.get(tag.lower(), ()) for tag in set(tags)]
+        if not postings:
+            return []
+        if match_any:
+            return _union(postings)
+        postings.sort(key=len)
+        matches = list(postings[0])
+        for other in postings[1:]:
+            if not matches:
+                break
+            matches = _intersect(matches, other)
+        return matches
+
+    def iter_search(self, tags: Sequence[str], match_any=False) -> Iterator[int]:
+        """Finds the videos carrying the given tags like search, but only as they are asked for.
+
+        A single tag's posting list is read as it goes. Several tags are combined up front.
+
+        Args:
+            tags: The tags to look for.
+            match_any: (optional) Match videos with any of the tags, instead of all of them.
+
+        Yields:
+            The ascending ordinals of the matching videos.
+        """
+        tags = {tag.lower() for tag in tags}
+        if len(tags) == 1:
+            return iter(self._postings.get(tags.pop(), ()))
+        return iter(self.search(tags, match_any))
+
+    def tags(self) -> List[str]:
+        """Returns every distinct lowercased tag in the index."""
+        return list(self._postings)
+
+    def to_buffers(self):
+        """Returns the index as a list of bytes-like buffers, to be read back by from_buffers."""
+        posting_offsets = array("Q", chain([0], accumulate(map(len, self._postings.values()))))
+        postings = array("I")
+        for tag_postings in self._postings.values():
+            postings.extend(tag_postings)
+        return [array("Q", [self._size]), join_lines(self._postings), posting_offsets, postings]
+
+    @classmethod
+    def from_buffers(cls, buffers):
+        """Builds an index on top of buffers returned by to_buffers, without copying them.
+
+        The index cannot be added to afterwards.
+
+        Args:
+            buffers: A list of byte-format memoryviews over the buffers.
+        """
+        size, tags, posting_offsets, postings = buffers
+        index = cls()
+        index._size = size.cast("Q")[0]
+        posting_offsets = posting_offsets.cast("Q")
+        postings = postings.cast("I")
+        index._postings = {tag: postings[posting_offsets[i]:posting_offsets[i + 1]]
+                           for i, tag in enumerate(split_lines(tags))}
+        return index
+
+    def __len__(self):
+        return self._size
+
+
+# Above this size ratio, binary searching the larger posting list for each entry of the smaller one
+# beats testing every entry of the larger one for membership
+_GALLOP_RATIO = 32
+
+
+def _intersect(smaller, larger):
+    if len(larger) < _GALLOP_RATIO * len(smaller):
+        return list(filter(set(smaller).__contains__, larger))
+    # Both lists are ascending, so each lookup in the larger list can start where the last one ended
+    matches = []
+    low = 0
+    for ordinal in smaller:
+        low = bisect_left(larger, ordinal, low)
+        if low == len(larger):
+            break
+        if larger[low] == ordinal:
+            matches.append(ordinal)
+    return matches
+
+
+def _union(postings):
+    return sorted(set().union(*postings))
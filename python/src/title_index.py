@@ -0,0 +1,116 @@
+"""A title search index class."""
+
+from array import array
+from itertools import accumulate, chain
+from typing import Iterable, Iterator, List
+
+from .buffer_strings import BufferStrings, join_lines, split_lines
+
+
+class TitleIndex:
+    """A trigram index over video titles, answering case-insensitive substring searches.
+
+    Every title is identified by its ordinal, i.e. its position in the iterable the index was built
+    from. Each three character sequence ("trigram") of a lowercased title maps to the ascending
+    list of ordinals of the titles containing it. A search only has to check the titles in the
+    shortest posting list of the search term's trigrams, instead of every title in the library.
+    """
+
+    GRAM_SIZE = 3
+
+    def __init__(self, titles: Iterable[str] = ()):
+        self._titles = []
+        self._postings = {}
+        for title in titles:
+            self.add(title)
+
+    def add(self, title: str) -> int:
+        """Adds a title to the index.
+
+        Args:
+            title: The title to index.
+
+        Returns:
+            The ordinal the title was given.
+        """
+        ordinal = len(self._titles)
+        title = title.lower()
+        self._titles.append(title)
+        for gram in self._grams(title):
+            postings = self._postings.get(gram)
+            if postings is None:
+                postings = self._postings[gram] = array("I")
+            postings.append(ordinal)
+        return ordinal
+
+    def search(self, search_term: str) -> List[int]:
+        """Finds every title containing the search term, ignoring case.
+
+        Args:
+            search_term: The text to look for.
+
+        Returns:
+            The ascending ordinals of the matching titles.
+        """
+        return list(self.iter_search(search_term))
+
+    def iter_search(self, search_term: str) -> Iterator[int]:
+        """Finds the titles containing the search term like search, but only as they are asked for.
+
+        Args:
+            search_term: The text to look for.
+
+        Yields:
+            The ascending ordinals of the matching titles.
+        """
+        search_term = search_term.lower()
+        if len(search_term) < self.GRAM_SIZE:
+            # Too short to have any trigrams - but a term this short matches most titles anyway,
+            # so checking every title costs about as much as listing the results.
+            candidates = range(len(self._titles))
+        else:
+            candidates = None
+            for gram in self._grams(search_term):
+                postings = self._postings.get(gram)
+                if postings is None:
+                    return iter(())
+                if candidates is None or len(postings) < len(candidates):
+                    candidates = postings
+        titles = self._titles
+        return (ordinal for ordinal in candidates if search_term in titles[ordinal])
+
+    def to_buffers(self):
+        """Returns the index as a list of bytes-like buffers, to be read back by from_buffers."""
+        titles = [title.encode("utf-8") for title in self._titles]
+        title_offsets = array("Q", chain([0], accumulate(map(len, titles))))
+        posting_offsets = array("Q", chain([0], accumulate(map(len, self._postings.values()))))
+        postings = array("I")
+        for gram_postings in self._postings.values():
+            postings.extend(gram_postings)
+        return [b"".join(titles), title_offsets, join_lines(self._postings), posting_offsets,
+                postings]
+
+    @classmethod
+    def from_buffers(cls, buffers):
+        """Builds an index on top of buffers returned by to_buffers, without copying them.
+
+        The index cannot be added to afterwards.
+
+        Args:
+            buffers: A list of byte-format memoryviews over the buffers.
+        """
+        titles, title_offsets, grams, posting_offsets, postings = buffers
+        index = cls()
+        index._titles = BufferStrings(titles, title_offsets.cast("Q"))
+        posting_offsets = posting_offsets.cast("Q")
+        postings = postings.cast("I")
+        index._postings = {gram: postings[posting_offsets[i]:posting_offsets[i + 1]]
+                           for i, gram in enumerate(split_lines(grams))}
+        return index
+
+    def __len__(self):
+        return len(self._titles)
+
+    @classmethod
+    def _grams(cls, text):
+        return {text[i:i + cls.GRAM_SIZE] for i in range(len(text) - cls.GRAM_SIZE + 1)}
@@ -0,0 +1,44 @@
+"""A title order class."""
+
+from array import array
+from typing import Iterable, Sequence
+
+
+class TitleOrder:
+    """The ordinals of videos sorted by title, so videos can be listed by title without sorting.
+
+    Every video is identified by its ordinal, i.e. its position in the iterable the order was built
+    from. Titles are compared as Python compares strings, and videos with equal titles keep their
+    catalog order, as a stable sort of the videos by title would leave them.
+    """
+
+    def __init__(self, titles: Iterable[str] = ()):
+        titles = list(titles)
+        self._ordinals = array("I", sorted(range(len(titles)), key=titles.__getitem__))
+
+    def ordinals(self, start: int = 0, stop: int = None) -> Sequence[int]:
+        """Returns the ordinals of the videos from start up to stop, counted in title order."""
+        return self._ordinals[start:stop]
+
+    def __len__(self):
+        return len(self._ordinals)
+
+    def to_buffers(self):
+        """Returns the order as a list of bytes-like buffers, to be read back by from_buffers."""
+        return [self._ordinals]
+
+    @classmethod
+    def from_buffers(cls, buffers):
+        """Builds an order on top of buffers returned by to_buffers, without copying them.
+
+        Args:
+            buffers: A list of byte-format memoryviews over the buffers.
+        """
+        return cls.from_ordinals(buffers[0].cast("I"))
+
+    @classmethod
+    def from_ordinals(cls, ordinals: Sequence[int]):
+        """Builds an order from ordinals already sorted by title, such as a database returns."""
+        order = cls()
+        order._ordinals = ordinals if isinstance(ordinals, memoryview) else array("I", ordinals)
+        return order
@@ -4,7 +4,15 @@ from typing import Sequence
 
 
 class Video:
-    """A class used to represent a Video."""
+    """A class used to represent a Video.
+
+    Videos never change once created, so a catalog of them can be shared freely - between threads,
+    or between processes forked from one that loaded it. Whether a video is flagged is not part of
+    the video: FilteredVideoLibrary returns a FlaggedVideo view for a flagged one.
+    """
+
+    # Videos are created in very large numbers, so don't give each one an attribute dictionary
+    __slots__ = ("_title", "_video_id", "_tags")
 
     def __init__(self, video_title: str, video_id: str, video_tags: Sequence[str]):
         """Video constructor."""
@@ -14,8 +22,6 @@ class Video:
         # Turn the tags into a tuple here so it's unmodifiable,
         # in case the caller changes the 'video_tags' they passed to us
         self._tags = tuple(video_tags)
-        self._is_flagged = False
-        self._flag_reason = ""
 
     @property
     def title(self) -> str:
@@ -35,23 +41,53 @@ class Video:
     @property
     def is_flagged(self) -> bool:
         """Returns whether or not this video is flagged."""
-        return self._is_flagged
-
-    @is_flagged.setter
-    def is_flagged(self, value):
-        self._is_flagged = value
+        return False
 
     @property
-    def flag_reason(self):
+    def flag_reason(self) -> str:
         """Returns the reason why this video was flagged (if it is not flagged, will be an empty string)."""
-        return self._flag_reason
-
-    @flag_reason.setter
-    def flag_reason(self, value):
-        self._flag_reason = value
+        return ""
 
     def tostring(self):
         """Returns a formatted string representation of the video."""
-        video_text = f"{self.title} ({self.video_id}) [{' '.join(self.tags)}]"
-        flag_text = "" if not self._is_flagged else f" - FLAGGED (reason: {self._flag_reason})"
-        return video_text + flag_text
+        return f"{self.title} ({self.video_id}) [{' '.join(self.tags)}]"
+
+    def __str__(self):
+        return self.tostring()
+
+
+class FlaggedVideo:
+    """A view of a Video that has been flagged, adding the flag to the video without changing it."""
+
+    __slots__ = ("_video", "_flag_reason")
+
+    def __init__(self, video: Video, flag_reason: str):
+        self._video = video
+        self._flag_reason = flag_reason
+
+    @property
+    def title(self) -> str:
+        return self._video.title
+
+    @property
+    def video_id(self) -> str:
+        return self._video.video_id
+
+    @property
+    def tags(self) -> Sequence[str]:
+        return self._video.tags
+
+    @property
+    def is_flagged(self) -> bool:
+        return True
+
+    @property
+    def flag_reason(self) -> str:
+        return self._flag_reason
+
+    def tostring(self):
+        """Returns a formatted string representation of the video, and why it was flagged."""
+        return f"{self._video.tostring()} - FLAGGED (reason: {self._flag_reason})"
+
+    def __str__(self):
+        return self.tostring()
@@ -0,0 +1,83 @@
+"""A compact video storage class."""
+
+from array import array
+from collections.abc import Mapping
+
+from .buffer_strings import BufferStrings, join_lines, split_lines
+from .video import Video
+
+
+class VideoColumns(Mapping):
+    """A read-only video_id -> Video mapping storing every field in compact columns.
+
+    Titles are kept as one UTF-8 buffer, and tags as ids into a table of distinct tag names, so
+    each video costs a few array entries rather than several Python objects. A new Video object is
+    built from the columns every time one is looked up.
+    """
+
+    def __init__(self, videos=()):
+        self._rows = {}
+        self._title_buffer = bytearray()
+        self._title_offsets = array("Q", [0])
+        self._titles = BufferStrings(self._title_buffer, self._title_offsets)
+        self._tag_names = []
+        self._tag_ids = {}
+        self._video_tags = array("I")
+        self._video_tag_offsets = array("Q", [0])
+        for video in videos:
+            self._add(video.title, video.video_id, video.tags)
+
+    def _add(self, title, video_id, tags):
+        # A repeated video_id keeps its first position but takes the last definition, like a dict
+        self._rows[video_id] = len(self._titles)
+        self._title_buffer += title.encode("utf-8")
+        self._title_offsets.append(len(self._title_buffer))
+        for tag in tags:
+            tag_id = self._tag_ids.get(tag)
+            if tag_id is None:
+                tag_id = self._tag_ids[tag] = len(self._tag_names)
+                self._tag_names.append(tag)
+            self._video_tags.append(tag_id)
+        self._video_tag_offsets.append(len(self._video_tags))
+
+    def to_buffers(self):
+        """Returns the columns as a list of bytes-like buffers, to be read back by from_buffers."""
+        if len(self._rows) != len(self._titles):
+            # Drop the rows of repeated video_ids, so rows line up with positions again
+            return VideoColumns(self.values()).to_buffers()
+        return [join_lines(self._rows), self._title_buffer, self._title_offsets,
+                join_lines(self._tag_names), self._video_tags, self._video_tag_offsets]
+
+    @classmethod
+    def from_buffers(cls, buffers):
+        """Builds the columns on top of buffers returned by to_buffers, without copying them.
+
+        Args:
+            buffers: A list of byte-format memoryviews over the buffers.
+        """
+        video_ids, title_buffer, title_offsets, tag_names, video_tags, video_tag_offsets = buffers
+        columns = cls()
+        video_ids = split_lines(video_ids)
+        columns._rows = dict(zip(video_ids, range(len(video_ids))))
+        columns._title_buffer = title_buffer
+        columns._title_offsets = title_offsets.cast("Q")
+        columns._titles = BufferStrings(columns._title_buffer, columns._title_offsets)
+        columns._tag_names = split_lines(tag_names)
+        columns._tag_ids = {tag: tag_id for tag_id, tag in enumerate(columns._tag_names)}
+        columns._video_tags = video_tags.cast("I")
+        columns._video_tag_offsets = video_tag_offsets.cast("Q")
+        return columns
+
+    def __getitem__(self, video_id):
+        row = self._rows[video_id]
+        tag_ids = self._video_tags[self._video_tag_offsets[row]:self._video_tag_offsets[row + 1]]
+        return Video(self._titles[row], video_id, [self._tag_names[tag_id] for tag_id in tag_ids])
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __contains__(self, video_id):
+        return video_id in self._rows
@@ -0,0 +1,239 @@
+"""An SQLite video catalog, which a VideoLibrary can query instead of loading a video file.
+
+Videos are looked up through the unique index on video_id, titles are searched through an FTS5
+trigram table and tags through an index of (tag, ordinal) pairs, so only the videos a command asks
+for are ever read into memory. Ordinals are positions in the catalog, as in TitleIndex and TagIndex.
+"""
+
+import os
+import sqlite3
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Iterable, Iterator, List, Sequence, Tuple
+
+from .title_order import TitleOrder
+from .video import Video
+
+_SCHEMA = """
+CREATE TABLE videos (
+    ordinal INTEGER PRIMARY KEY,
+    video_id TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    tags TEXT NOT NULL
+);
+CREATE TABLE video_tags (
+    tag TEXT NOT NULL,
+    ordinal INTEGER NOT NULL,
+    PRIMARY KEY (tag, ordinal)
+) WITHOUT ROWID;
+CREATE INDEX videos_by_title ON videos (title, ordinal);
+CREATE VIRTUAL TABLE titles USING fts5(
+    title, content='videos', content_rowid='ordinal', tokenize='trigram'
+);
+"""
+
+# The tags of a video are stored joined by this, which the video file format never puts in a tag
+_TAG_SEPARATOR = ","
+
+# The trigram tokenizer cannot match terms shorter than this
+_GRAM_SIZE = 3
+
+# Whether the SQLite library Python is linked against has the FTS5 trigram tokenizer (added in
+# SQLite 3.34), which the catalog's title search needs
+HAS_TRIGRAM_TOKENIZER = sqlite3.sqlite_version_info >= (3, 34, 0)
+
+
+def _require_trigram_tokenizer():
+    if not HAS_TRIGRAM_TOKENIZER:
+        raise RuntimeError(f"SQLite catalogs need SQLite 3.34 or newer for trigram title search, "
+                           f"but Python is using SQLite {sqlite3.sqlite_version}")
+
+
+def write_database(database_path, videos: Iterable[Video]):
+    """Writes the videos into a new SQLite catalog, replacing any existing one.
+
+    The catalog is written to a temporary file first, so a reader never sees half of it.
+
+    Args:
+        database_path: Where to write the catalog.
+        videos: The videos, in catalog order. A repeated video_id replaces the earlier video, in
+            its place, as when a VideoLibrary loads a video file.
+    """
+    _require_trigram_tokenizer()
+    videos = {video.video_id: video for video in videos}.values()
+    temporary_path = f"{database_path}.tmp"
+    if os.path.exists(temporary_path):
+        os.remove(temporary_path)
+    connection = sqlite3.connect(temporary_path)
+    try:
+        with connection:
+            connection.executescript(_SCHEMA)
+            for ordinal, video in enumerate(videos):
+                connection.execute(
+                    "INSERT INTO videos VALUES (?, ?, ?, ?)",
+                    (ordinal, video.video_id, video.title, _TAG_SEPARATOR.join(video.tags)))
+                connection.executemany(
+                    "INSERT OR IGNORE INTO video_tags VALUES (?, ?)",
+                    ((tag.lower(), ordinal) for tag in video.tags))
+            connection.execute("INSERT INTO titles(titles) VALUES ('rebuild')")
+    finally:
+        connection.close()
+    os.replace(temporary_path, database_path)
+
+
+class VideoDatabase(Mapping):
+    """A read-only video_id -> Video mapping over an SQLite catalog written by write_database.
+
+    Video objects are read from the database every time they are looked up. The title_index and
+    tag_index attributes search the catalog the way TitleIndex and TagIndex search memory.
+
+    SQLite connections cannot be shared between threads, so each thread gets its own read-only
+    connection the first time it queries the catalog.
+    """
+
+    def __init__(self, database_path):
+        _require_trigram_tokenizer()
+        self._connections = _ThreadConnections(database_path)
+        self.title_index = DatabaseTitleIndex(self._connections)
+        self.tag_index = DatabaseTagIndex(self._connections)
+
+    @property
+    def _connection(self):
+        return self._connections.get()
+
+    def __getitem__(self, video_id):
+        row = self._connection.execute(
+            "SELECT title, tags FROM videos WHERE video_id = ?", (video_id,)).fetchone()
+        if row is None:
+            raise KeyError(video_id)
+        return _to_video(video_id, *row)
+
+    def __iter__(self):
+        return (video_id for video_id, in
+                self._connection.execute("SELECT video_id FROM videos ORDER BY ordinal"))
+
+    def __len__(self):
+        return self._connection.execute("SELECT COUNT(*) FROM videos").fetchone()[0]
+
+    def __contains__(self, video_id):
+        return self._connection.execute(
+            "SELECT 1 FROM videos WHERE video_id = ?", (video_id,)).fetchone() is not None
+
+    def title_order(self) -> TitleOrder:
+        """Returns the order of the videos by title, read through the index on titles."""
+        # SQLite compares text as UTF-8 bytes, which orders strings as Python does
+        return TitleOrder.from_ordinals(ordinal for ordinal, in self._connection.execute(
+            "SELECT ordinal FROM videos ORDER BY title, ordinal"))
+
+    def values(self):
+        # Reads every video in one query, rather than one query per video
+        rows = self._connection.execute("SELECT video_id, title, tags FROM videos ORDER BY ordinal")
+        return [_to_video(video_id, title, tags) for video_id, title, tags in rows]
+
+    def iter_titles_and_tags(self) -> Iterator[Tuple[str, Tuple[str, ...]]]:
+        """Yields the (title, tags) of every video in catalog order, straight from the cursor.
+
+        Unlike values, never holds more than one video's row in memory, so indexes over the whole
+        catalog can be built from it.
+        """
+        rows = self._connection.execute("SELECT title, tags FROM videos ORDER BY ordinal")
+        return ((title, tuple(tags.split(_TAG_SEPARATOR)) if tags else ()) for title, tags in rows)
+
+
+class _ThreadConnections(threading.local):
+    """Opens a read-only connection to an SQLite catalog for each thread that asks for one."""
+
+    def __init__(self, database_path):
+        self._uri = Path(database_path).resolve().as_uri() + "?mode=ro"
+        self._connection = None
+
+    def get(self):
+        if self._connection is None:
+            self._connection = sqlite3.connect(self._uri, uri=True)
+        return self._connection
+
+
+class DatabaseTitleIndex:
+    """Finds the titles in an SQLite catalog containing a search term, through its FTS5 table."""
+
+    def __init__(self, connections):
+        self._connections = connections
+
+    def search(self, search_term: str) -> List[int]:
+        """Finds every title containing the search term, ignoring case.
+
+        Args:
+            search_term: The text to look for.
+
+        Returns:
+            The ascending ordinals of the matching titles.
+        """
+        return list(self.iter_search(search_term))
+
+    def iter_search(self, search_term: str) -> Iterator[int]:
+        """Finds the titles containing the search term like search, but only as they are asked for.
+
+        Args:
+            search_term: The text to look for.
+
+        Yields:
+            The ascending ordinals of the matching titles.
+        """
+        search_term = search_term.lower()
+        if len(search_term) < _GRAM_SIZE:
+            # Too short for the trigram table - but a term this short matches most titles anyway
+            rows = self._connections.get().execute(
+                "SELECT ordinal, title FROM videos ORDER BY ordinal")
+        else:
+            phrase = '"' + search_term.replace('"', '""') + '"'
+            rows = self._connections.get().execute(
+                "SELECT rowid, title FROM titles WHERE titles MATCH ? ORDER BY rowid", (phrase,))
+        # SQLite folds case differently to Python for some characters, so the matches are checked
+        return (ordinal for ordinal, title in rows if search_term in title.lower())
+
+
+class DatabaseTagIndex:
+    """Finds the videos in an SQLite catalog carrying given tags, through its tag index."""
+
+    def __init__(self, connections):
+        self._connections = connections
+
+    def search(self, tags: Sequence[str], match_any=False) -> List[int]:
+        """Finds the videos carrying the given tags, ignoring case.
+
+        Args:
+            tags: The tags to look for.
+            match_any: (optional) Match videos with any of the tags, instead of all of them.
+
+        Returns:
+            The ascending ordinals of the matching videos.
+        """
+        return list(self.iter_search(tags, match_any))
+
+    def iter_search(self, tags: Sequence[str], match_any=False) -> Iterator[int]:
+        """Finds the videos carrying the given tags like search, reading rows as they are asked for.
+
+        Args:
+            tags: The tags to look for.
+            match_any: (optional) Match videos with any of the tags, instead of all of them.
+
+        Yields:
+            The ascending ordinals of the matching videos.
+        """
+        tags = list({tag.lower() for tag in tags})
+        if not tags:
+            return iter(())
+        compound = " UNION " if match_any else " INTERSECT "
+        query = compound.join(["SELECT ordinal FROM video_tags WHERE tag = ?"] * len(tags))
+        return (ordinal for ordinal, in
+                self._connections.get().execute(query + " ORDER BY ordinal", tags))
+
+    def tags(self) -> List[str]:
+        """Returns every distinct lowercased tag in the catalog."""
+        rows = self._connections.get().execute("SELECT DISTINCT tag FROM video_tags")
+        return [tag for tag, in rows]
+
+
+def _to_video(video_id, title, tags):
+    return Video(title, video_id, tags.split(_TAG_SEPARATOR) if tags else [])
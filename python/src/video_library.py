@@ -1,9 +1,22 @@
 """A video library class."""
 
+from .catalog_snapshot import default_snapshot_path, read_snapshot, write_snapshot
+from .fuzzy_index import FuzzyIndex
+from .ranked_index import RankedIndex, split_words
+from .tag_index import TagIndex
+from .title_index import TitleIndex
+from .title_order import TitleOrder
 from .video import Video
+from .video_columns import VideoColumns
+from .video_database import VideoDatabase
+from collections.abc import Mapping
 from pathlib import Path
 import csv
+import mmap
+import threading
 
+# How many videos iter_videos_by_title reads the title order for at a time
+_PAGE_SIZE = 1024
 
 # Helper Wrapper around CSV reader to strip whitespace from around
 # each item.
@@ -11,27 +24,170 @@ def _csv_reader_with_strip(reader):
     yield from ((item.strip() for item in line) for line in reader)
 
 
+def _parse_video(video_info):
+    title, url, tags = video_info
+    return Video(
+        title,
+        url,
+        [tag.strip() for tag in tags.split(",")] if tags else [],
+    )
+
+
+class _LazyVideoMap(Mapping):
+    """A read-only video_id -> Video mapping over a memory-mapped video file.
+
+    Only the byte offset of each line is kept in memory; the Video object is parsed from the file
+    every time it is looked up.
+    """
+
+    def __init__(self, videos_path):
+        self._offsets = {}
+        self._mmap = None
+        with open(videos_path, "rb") as video_file:
+            if Path(videos_path).stat().st_size > 0:
+                self._mmap = mmap.mmap(video_file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap is None:
+            return
+        offset = 0
+        for line in iter(self._mmap.readline, b""):
+            if line.strip():
+                self._offsets[line.split(b"|", 2)[1].strip().decode("utf-8")] = offset
+            offset += len(line)
+
+    def __getitem__(self, video_id):
+        offset = self._offsets[video_id]
+        end = self._mmap.find(b"\n", offset)
+        line = self._mmap[offset:end if end != -1 else len(self._mmap)]
+        reader = _csv_reader_with_strip(csv.reader([line.decode("utf-8")], delimiter="|"))
+        return _parse_video(next(reader))
+
+    def __iter__(self):
+        return iter(self._offsets)
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __contains__(self, video_id):
+        return video_id in self._offsets
+
+
 class VideoLibrary:
-    """A class used to represent a Video Library."""
-
-    def __init__(self):
-        """The VideoLibrary class is initialized."""
-        self._videos = {}
-        with open(Path(__file__).parent / "videos.txt") as video_file:
-            reader = _csv_reader_with_strip(
-                csv.reader(video_file, delimiter="|"))
-            for video_info in reader:
-                title, url, tags = video_info
-                self._videos[url] = Video(
-                    title,
-                    url,
-                    [tag.strip() for tag in tags.split(",")] if tags else [],
-                )
+    """A class used to represent a Video Library.
+
+    The videos never change once loaded, so the library is safe to read from many threads at once
+    without locks. The only lock guards building the search indexes of a lazy library.
+
+    Alongside the search indexes, the library keeps the order of its videos by title, so they can
+    be listed by title without sorting them. The indexes for ranked and fuzzy searches are only
+    built on the first search needing them, under the same lock.
+    """
+
+    def __init__(self, videos_path=None, lazy=False, compact=False, snapshot=True, database=None):
+        """The VideoLibrary class is initialized.
+
+        Args:
+            videos_path: (optional) Path to a pipe-delimited video file. Defaults to the videos.txt
+                file shipped alongside this module.
+            lazy: (optional) Only index where each video is in the file, and read Video objects
+                from it on demand. The search indexes are then built on the first search.
+            compact: (optional) Keep the videos in compact columns instead of one Video object
+                each, building Video objects on demand. Cannot be combined with lazy.
+            snapshot: (optional) Use the binary snapshot compiled from the video file (see
+                save_snapshot) when there is an up to date one, whatever the other options are.
+            database: (optional) Path to an SQLite catalog (see video_database.write_database) to
+                query for videos and searches, instead of loading videos_path into memory. Cannot
+                be combined with lazy or compact.
+        """
+        if lazy and compact:
+            raise ValueError("A VideoLibrary cannot be both lazy and compact")
+        if database is not None and (lazy or compact):
+            raise ValueError("A VideoLibrary backed by a database cannot be lazy or compact")
+        if videos_path is None:
+            videos_path = Path(__file__).parent / "videos.txt"
+        self._videos_path = videos_path
+        self._title_index = None
+        self._tag_index = None
+        self._title_order = None
+        self._ranked_index = None
+        self._fuzzy_title_words = None
+        self._fuzzy_tags = None
+        self._index_lock = threading.Lock()
+        loaded_snapshot = None
+        if snapshot and database is None:
+            loaded_snapshot = read_snapshot(default_snapshot_path(videos_path), videos_path)
+        if database is not None:
+            self._videos = VideoDatabase(database)
+            self._title_index = self._videos.title_index
+            self._tag_index = self._videos.tag_index
+            self._title_order = self._videos.title_order()
+        elif loaded_snapshot is not None:
+            self._videos, self._title_index, self._tag_index, self._title_order = loaded_snapshot
+        elif lazy:
+            self._videos = _LazyVideoMap(videos_path)
+        else:
+            with open(videos_path) as video_file:
+                reader = _csv_reader_with_strip(
+                    csv.reader(video_file, delimiter="|"))
+                videos = (_parse_video(video_info) for video_info in reader)
+                if compact:
+                    self._videos = VideoColumns(videos)
+                else:
+                    self._videos = {video.video_id: video for video in videos}
+        # Ordinals in the title and tag indexes are positions in this list. Even for a database, the
+        # IDs are small enough to keep in memory when the videos are not.
+        self._video_ids = list(self._videos)
+        if self._title_index is None and not lazy:
+            self._build_indexes()
+
+    def save_snapshot(self):
+        """Compiles the library into a binary snapshot next to its video file.
+
+        Later libraries loaded from the same, unchanged, video file will map the snapshot instead
+        of parsing and indexing the file.
+
+        Returns:
+            The path of the snapshot.
+        """
+        if isinstance(self._videos, VideoDatabase):
+            raise ValueError("A VideoLibrary backed by a database has no video file to snapshot")
+        if self._title_index is None:
+            self._build_indexes()
+        videos = self._videos
+        if not isinstance(videos, VideoColumns):
+            videos = VideoColumns(videos.values())
+        snapshot_path = default_snapshot_path(self._videos_path)
+        write_snapshot(snapshot_path, self._videos_path, videos, self._title_index,
+                       self._tag_index, self._title_order)
+        return snapshot_path
 
     def get_all_videos(self):
         """Returns all available video information from the video library."""
         return list(self._videos.values())
 
+    def __len__(self):
+        # Counts the videos without loading any of them
+        return len(self._video_ids)
+
+    def iter_videos_by_title(self, start=0, stop=None):
+        """Yields the videos sorted by title, without sorting them.
+
+        The title order is read a page at a time, and each video is only looked up as it is
+        yielded, so listing a huge catalog never holds all of it in memory.
+
+        Args:
+            start: (optional) The position, in title order, of the first video to yield.
+            stop: (optional) The position, in title order, to stop before. Defaults to the end.
+
+        Yields:
+            Video objects, sorted by title. Videos with the same title are in library order.
+        """
+        if self._title_order is None:
+            self._build_indexes()
+        stop = len(self._title_order) if stop is None else min(stop, len(self._title_order))
+        for page_start in range(start, stop, _PAGE_SIZE):
+            ordinals = self._title_order.ordinals(page_start, min(page_start + _PAGE_SIZE, stop))
+            yield from self._get_videos_by_ordinal(ordinals)
+
     def get_video(self, video_id):
         """Returns the video object (title, url, tags) from the video library.
 
@@ -43,3 +199,176 @@ class VideoLibrary:
             does not exist.
         """
         return self._videos.get(video_id, None)
+
+    def search_titles(self, search_term):
+        """Returns the videos whose titles contain the search term, ignoring case.
+
+        Args:
+            search_term: The query to be used in search.
+
+        Returns:
+            A list of the matching Video objects, in library order.
+        """
+        if self._title_index is None:
+            self._build_indexes()
+        return self._get_videos_by_ordinal(self._title_index.search(search_term))
+
+    def search_tags(self, video_tags, match_any=False):
+        """Returns the videos carrying the given tags, ignoring case.
+
+        Args:
+            video_tags: The tags to be used in search.
+            match_any: (optional) Match videos with any of the tags, instead of all of them.
+
+        Returns:
+            A list of the matching Video objects, in library order.
+        """
+        if self._tag_index is None:
+            self._build_indexes()
+        return self._get_videos_by_ordinal(self._tag_index.search(video_tags, match_any))
+
+    def search_ranked(self, search_term, limit):
+        """Returns the videos most relevant to the words of the search term, ignoring case.
+
+        Videos are scored on how many of the words their titles contain, and how rare those words
+        are, with a boost for the words their tags contain (see RankedIndex).
+
+        Args:
+            search_term: The words to look for, in any order.
+            limit: The most videos to return.
+
+        Returns:
+            A list of the best matching Video objects, most relevant first.
+        """
+        return self._get_videos_by_ordinal(self._rank(search_term, limit))
+
+    def search_titles_fuzzy(self, search_term):
+        """Returns the videos whose titles contain every word of the search term, allowing typos.
+
+        Each word may be a few edits away from a word of the title (see
+        fuzzy_index.default_max_distance). Words are found in the index of title words built for
+        ranked searches, so the catalog is never scanned.
+
+        Args:
+            search_term: The words to look for, in any order.
+
+        Returns:
+            A list of the matching Video objects, in library order.
+        """
+        ranked_index = self._get_ranked_index()
+        if self._fuzzy_title_words is None:
+            with self._index_lock:
+                if self._fuzzy_title_words is None:
+                    self._fuzzy_title_words = FuzzyIndex(ranked_index.title_words())
+        matches = None
+        for word in set(split_words(search_term)):
+            word_matches = set()
+            for title_word in self._fuzzy_title_words.search(word):
+                word_matches.update(ranked_index.titles_with_word(title_word))
+            matches = word_matches if matches is None else matches & word_matches
+            if not matches:
+                return []
+        return self._get_videos_by_ordinal(sorted(matches or ()))
+
+    def search_tags_fuzzy(self, video_tags, match_any=False):
+        """Returns the videos carrying the given tags, ignoring case and allowing typos.
+
+        Each tag may be a few edits away from a tag of the video (see
+        fuzzy_index.default_max_distance).
+
+        Args:
+            video_tags: The tags to be used in search.
+            match_any: (optional) Match videos with any of the tags, instead of all of them.
+
+        Returns:
+            A list of the matching Video objects, in library order.
+        """
+        if self._tag_index is None:
+            self._build_indexes()
+        if self._fuzzy_tags is None:
+            with self._index_lock:
+                if self._fuzzy_tags is None:
+                    self._fuzzy_tags = FuzzyIndex(self._tag_index.tags())
+        matches = None
+        for tag in {tag.lower() for tag in video_tags}:
+            tag_matches = set(self._tag_index.search(self._fuzzy_tags.search(tag), match_any=True))
+            if matches is None:
+                matches = tag_matches
+            elif match_any:
+                matches |= tag_matches
+            else:
+                matches &= tag_matches
+        return self._get_videos_by_ordinal(sorted(matches or ()))
+
+    def iter_search_titles(self, search_term):
+        """Yields the videos whose titles contain the search term, ignoring case.
+
+        Titles are only checked, and videos only looked up, as they are asked for, so taking the
+        first few results costs the same however many videos match.
+
+        Args:
+            search_term: The query to be used in search.
+
+        Yields:
+            The matching Video objects, in library order.
+        """
+        if self._title_index is None:
+            self._build_indexes()
+        return self._iter_videos_by_ordinal(self._title_index.iter_search(search_term))
+
+    def iter_search_tags(self, video_tags, match_any=False):
+        """Yields the videos carrying the given tags, ignoring case.
+
+        The videos are only looked up as they are asked for, as are the matches of a single tag.
+
+        Args:
+            video_tags: The tags to be used in search.
+            match_any: (optional) Match videos with any of the tags, instead of all of them.
+
+        Yields:
+            The matching Video objects, in library order.
+        """
+        if self._tag_index is None:
+            self._build_indexes()
+        return self._iter_videos_by_ordinal(self._tag_index.iter_search(video_tags, match_any))
+
+    def _build_indexes(self):
+        with self._index_lock:
+            if self._title_index is not None:
+                # Built by another thread while this one waited for the lock
+                return
+            title_index = TitleIndex()
+            tag_index = TagIndex()
+            titles = []
+            for video_id in self._video_ids:
+                video = self._videos[video_id]
+                title_index.add(video.title)
+                tag_index.add(video.tags)
+                titles.append(video.title)
+            # The title index is published last, as it is what marks the indexes as built
+            self._title_order = TitleOrder(titles)
+            self._tag_index = tag_index
+            self._title_index = title_index
+
+    def _rank(self, search_term, limit, keep=None):
+        return self._get_ranked_index().search(search_term, limit, keep)
+
+    def _get_ranked_index(self):
+        if self._ranked_index is None:
+            with self._index_lock:
+                if self._ranked_index is None:
+                    if isinstance(self._videos, VideoDatabase):
+                        # Streamed, as the database's videos may not all fit in memory at once
+                        videos = self._videos.iter_titles_and_tags()
+                    else:
+                        videos = ((video.title, video.tags) for video in self._videos.values())
+                    self._ranked_index = RankedIndex(videos)
+        return self._ranked_index
+
+    def _get_videos_by_ordinal(self, ordinals):
+        return [self._videos[self._video_ids[ordinal]] for ordinal in ordinals]
+
+    def _iter_videos_by_ordinal(self, ordinals):
+        videos = self._videos
+        video_ids = self._video_ids
+        return (videos[video_ids[ordinal]] for ordinal in ordinals)
@@ -3,32 +3,127 @@
 If continuing development, should consider refactoring out the "search videos" logic to a separate
 video searching class
 """
+import functools
+import itertools
+import threading
+
 from .filtered_video_library import FilteredVideoLibrary
+from .output_sink import Output, StdoutSink
+from .state_store import NullStateStore
 from .video_playlist_library import PlaylistLibrary
-from random import randint
+
+
+def _synchronized(method):
+    # Runs the method holding the player's lock, so one command finishes before the next starts
+    @functools.wraps(method)
+    def synchronized_method(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return synchronized_method
+
+
+# How many results a ranked search shows when not given a limit
+RANKED_RESULTS = 10
+
+
+def _parse_page(offset, limit):
+    # Returns the offset and limit of a page as integers, or None if they are not valid
+    try:
+        offset = int(offset)
+        limit = None if limit is None else int(limit)
+    except ValueError:
+        return None
+    if offset < 0 or (limit is not None and limit < 1):
+        return None
+    return offset, limit
 
 
 class VideoPlayer:
-    """A class used to represent a Video Player."""
+    """A class used to represent a Video Player.
+
+    A player only holds one user's playback state and playlists, so many players can share one
+    FilteredVideoLibrary (see SessionManager). Flags belong to the library, so are shared by them.
 
-    def __init__(self):
-        self._video_library = FilteredVideoLibrary()
+    Safe to share between threads: each command holds the player's lock while it runs. Locks are
+    only ever taken in the order player, then library or playlist library, then playlist, so
+    threads never wait for each other in a cycle.
+
+    The listing commands (show_all_videos, show_playlist and the searches) can show a page of
+    their results, given an offset and a limit. The videos are drawn from the library's
+    generators as they are shown, so showing the first page costs the same however many results
+    there are.
+    """
+
+    __slots__ = ("_video_library", "_output", "_state_store", "_flag_store", "_current_video",
+                 "_video_paused", "_playlist_library", "_defer_answers", "_pending_matches",
+                 "_lock")
+
+    def __init__(self, video_library=None, output=None, state_store=None, defer_answers=False,
+                 flag_store=None):
+        """The VideoPlayer class is initialized.
+
+        Args:
+            video_library: (optional) The FilteredVideoLibrary to play videos from, which may be
+                shared with other players. Defaults to one loaded from the bundled videos.txt file.
+            output: (optional) The OutputSink to send all output to. Defaults to printing it.
+            state_store: (optional) The StateStore to load flags and playlists from, and to save
+                every change to them to. Defaults to not saving them at all.
+            defer_answers: (optional) Return as soon as a question (such as which search result to
+                play) has been asked, instead of reading the answer with input(). The answer is
+                then passed to answer_question.
+            flag_store: (optional) The StateStore to save every change to the flags to instead,
+                such as one shared by all the players of a SessionManager. The video library is
+                expected to hold its flags already, and any flags in state_store are ignored.
+        """
+        self._video_library = video_library if video_library is not None else FilteredVideoLibrary()
+        self._output = output if output is not None else StdoutSink()
+        self._state_store = state_store if state_store is not None else NullStateStore()
+        self._flag_store = flag_store if flag_store is not None else self._state_store
         self._current_video = None
         self._video_paused = False
         self._playlist_library = PlaylistLibrary()
-
+        self._defer_answers = defer_answers
+        # The search results offered by a question still waiting for its answer, if any
+        self._pending_matches = None
+        # Reentrant, as commands run other commands (such as play_video running stop_video)
+        self._lock = threading.RLock()
+        flags, playlists = self._state_store.load()
+        if self._flag_store is self._state_store:
+            self._video_library.load_flags(flags)
+        # Videos may have left the catalog since the playlists were stored
+        get_video = self._video_library.get_video
+        self._playlist_library.load_playlists(
+            (playlist_name, [video_id for video_id in video_ids if get_video(video_id) is not None])
+            for playlist_name, video_ids in playlists)
+
+    @_synchronized
     def number_of_videos(self):
-        num_videos = len(self._video_library.get_all_videos())
-        print(f"{num_videos} videos in the library")
-
-    def show_all_videos(self):
-        """Returns all videos."""
-        print("Here's a list of all available videos:")
-        videos = self._video_library.get_all_videos()
-        videos.sort(key=lambda x: x.title)
-        for video in videos:
-            print(video.tostring())
+        num_videos = len(self._video_library)
+        self._emit("number_of_videos", count=num_videos)
+
+    @_synchronized
+    def show_all_videos(self, offset=0, limit=None):
+        """Returns all videos.
 
+        Args:
+            offset: (optional) How many videos to skip, in title order, before showing any.
+            limit: (optional) The most videos to show. Defaults to all of them.
+        """
+        page = _parse_page(offset, limit)
+        if page is None:
+            self._emit("invalid_page")
+            return
+        offset, limit = page
+        self._emit("all_videos_header")
+        # The library keeps its videos in title order, so they are streamed out without sorting.
+        # One more video than the page holds is asked for, to tell whether another page follows.
+        stop = None if limit is None else offset + limit + 1
+        shown = self._emit_page(self._video_library.iter_videos_by_title(offset, stop), offset,
+                                limit)
+        if shown == 0 and offset > 0:
+            self._emit("no_more_results", offset=offset)
+
+    @_synchronized
     def play_video(self, video_id):
         """Plays the respective video.
 
@@ -37,60 +132,67 @@ class VideoPlayer:
         """
         video = self._video_library.get_video(video_id)
         if video is None:
-            print("Cannot play video: Video does not exist")
+            self._emit("play_video_missing")
         elif video.is_flagged:
-            print(f"Cannot play video: Video is currently flagged (reason: {video.flag_reason})")
+            self._emit("play_video_flagged", flag_reason=video.flag_reason)
         else:
             if self._current_video is not None:
                 self.stop_video()
             self._current_video = video
             self._video_paused = False
-            print(f"Playing video: {self._current_video.title}")
+            self._emit("playing_video", title=self._current_video.title)
 
+    @_synchronized
     def stop_video(self):
         """Stops the current video."""
         if self._current_video is None:
-            print("Cannot stop video: No video is currently playing")
+            self._emit("stop_nothing_playing")
         else:
-            print(f"Stopping video: {self._current_video.title}")
+            self._emit("stopping_video", title=self._current_video.title)
             self._current_video = None
 
+    @_synchronized
     def play_random_video(self):
         """Plays a random video from the video library."""
-        videos = self._video_library.get_all_non_flagged_videos()
-        if len(videos) <= 0:
-            print("No videos available")
+        video = self._video_library.get_random_non_flagged_video()
+        if video is None:
+            self._emit("no_videos_available")
         else:
-            video_index = randint(0, len(videos) - 1)
-            self.play_video(videos[video_index].video_id)
+            self.play_video(video.video_id)
 
+    @_synchronized
     def pause_video(self):
         """Pauses the current video."""
         if self._current_video is None:
-            print("Cannot pause video: No video is currently playing")
+            self._emit("pause_nothing_playing")
         elif self._video_paused:
-            print(f"Video already paused: {self._current_video.title}")
+            self._emit("video_already_paused", title=self._current_video.title)
         else:
             self._video_paused = True
-            print(f"Pausing video: {self._current_video.title}")
+            self._emit("pausing_video", title=self._current_video.title)
 
+    @_synchronized
     def continue_video(self):
         """Resumes playing the current video."""
         if self._current_video is None:
-            print("Cannot continue video: No video is currently playing")
+            self._emit("continue_nothing_playing")
         elif not self._video_paused:
-            print("Cannot continue video: Video is not paused")
+            self._emit("continue_not_paused")
         else:
             self._video_paused = False
-            print(f"Continuing video: {self._current_video.title}")
+            self._emit("continuing_video", title=self._current_video.title)
 
+    @_synchronized
     def show_playing(self):
         """Displays video currently playing."""
         if self._current_video is None:
-            print("No video is currently playing")
+            self._emit("nothing_playing")
+        elif self._video_paused:
+            self._emit("currently_playing_paused", video=self._current_video)
         else:
-            print(f"Currently playing: {self._current_video.tostring()}" + (" - PAUSED" if self._video_paused else ""))
+            self._emit("currently_playing", video=self._current_video)
 
+    @_synchronized
     def create_playlist(self, playlist_name):
         """Creates a playlist with a given name.
 
@@ -99,10 +201,12 @@ class VideoPlayer:
         """
         playlist_created = self._playlist_library.add_playlist(playlist_name)
         if not playlist_created:
-            print("Cannot create playlist: A playlist with the same name already exists")
+            self._emit("playlist_exists")
         else:
-            print(f"Successfully created new playlist: {playlist_name}")
+            self._state_store.add_playlist(playlist_name)
+            self._emit("playlist_created", playlist_name=playlist_name)
 
+    @_synchronized
     def add_to_playlist(self, playlist_name, video_id):
         """Adds a video to a playlist with a given name.
 
@@ -113,46 +217,111 @@ class VideoPlayer:
         playlist_exists = self._playlist_library.get_playlist(playlist_name) is not None
         video = self._video_library.get_video(video_id)
         if not playlist_exists:
-            print(f"Cannot add video to {playlist_name}: Playlist does not exist")
+            self._emit("add_playlist_missing", playlist_name=playlist_name)
         elif video is None:
-            print(f"Cannot add video to {playlist_name}: Video does not exist")
+            self._emit("add_video_missing", playlist_name=playlist_name)
         elif video.is_flagged:
-            print(f"Cannot add video to {playlist_name}: Video is currently flagged (reason: {video.flag_reason})")
+            self._emit("add_video_flagged", playlist_name=playlist_name,
+                       flag_reason=video.flag_reason)
         else:
             video_added = self._playlist_library.add_video_to(playlist_name, video_id)
             if not video_added:
-                print(f"Cannot add video to {playlist_name}: Video already added")
+                self._emit("add_video_duplicate", playlist_name=playlist_name)
             else:
-                print(f"Added video to {playlist_name}: {video.title}")
+                self._state_store.add_videos(playlist_name, [video_id])
+                self._emit("video_added", playlist_name=playlist_name, title=video.title)
+
+    @_synchronized
+    def add_videos_to_playlist(self, playlist_name, video_ids):
+        """Adds several videos to a playlist with a given name, reporting a single summary.
+
+        Videos that do not exist, are flagged or are already in the playlist are skipped.
+
+        Args:
+            playlist_name: The playlist name.
+            video_ids: The video_ids to be added, in order.
+        """
+        if self._playlist_library.get_playlist(playlist_name) is None:
+            self._emit("add_videos_playlist_missing", playlist_name=playlist_name)
+            return
+        valid_video_ids = []
+        missing = flagged = 0
+        for video_id in video_ids:
+            video = self._video_library.get_video(video_id)
+            if video is None:
+                missing += 1
+            elif video.is_flagged:
+                flagged += 1
+            else:
+                valid_video_ids.append(video_id)
+        added = self._playlist_library.add_videos_to(playlist_name, valid_video_ids)
+        if added:
+            self._state_store.add_videos(playlist_name, valid_video_ids)
+        self._emit("videos_added", playlist_name=playlist_name, added=added, missing=missing,
+                   flagged=flagged, duplicate=len(valid_video_ids) - added)
+
+    @_synchronized
+    def add_tag_to_playlist(self, playlist_name, video_tag):
+        """Adds every video with the given tag to a playlist with a given name.
+
+        Args:
+            playlist_name: The playlist name.
+            video_tag: The video tag to be used in search.
+        """
+        videos = self._video_library.search_tags([video_tag])
+        self.add_videos_to_playlist(playlist_name, [video.video_id for video in videos])
 
+    @_synchronized
+    def add_search_to_playlist(self, playlist_name, search_term):
+        """Adds every video whose title contains the search_term to a playlist with a given name.
+
+        Args:
+            playlist_name: The playlist name.
+            search_term: The query to be used in search.
+        """
+        videos = self._video_library.search_titles(search_term)
+        self.add_videos_to_playlist(playlist_name, [video.video_id for video in videos])
+
+    @_synchronized
     def show_all_playlists(self):
         """Display all playlists."""
         playlists = self._playlist_library.get_all_playlist_names()
         if len(playlists) == 0:
-            print("No playlists exist yet")
+            self._emit("no_playlists")
         else:
-            print("Showing all playlists:")
+            self._emit("all_playlists_header")
             for playlist_name in playlists:
-                print(playlist_name)
+                self._emit("playlist_name", playlist_name=playlist_name)
 
-    def show_playlist(self, playlist_name):
+    @_synchronized
+    def show_playlist(self, playlist_name, offset=0, limit=None):
         """Display all videos in a playlist with a given name.
 
         Args:
             playlist_name: The playlist name.
+            offset: (optional) How many videos to skip, in playlist order, before showing any.
+            limit: (optional) The most videos to show. Defaults to all of them.
         """
+        page = _parse_page(offset, limit)
         playlist = self._playlist_library.get_playlist(playlist_name)
-        if playlist is None:
-            print(f"Cannot show playlist {playlist_name}: Playlist does not exist")
+        if page is None:
+            self._emit("invalid_page")
+        elif playlist is None:
+            self._emit("show_playlist_missing", playlist_name=playlist_name)
         else:
-            print(f"Showing playlist: {playlist_name}")
-            if len(playlist.videos) == 0:
-                print("No videos here yet")
-            else:
-                for video_id in playlist.videos:
-                    video = self._video_library.get_video(video_id)
-                    print(video.tostring())
-
+            offset, limit = page
+            self._emit("playlist_header", playlist_name=playlist_name)
+            # One more video than the page holds is asked for, to tell whether another page follows
+            stop = None if limit is None else offset + limit + 1
+            video_ids = playlist.iter_videos(offset, stop)
+            videos = (self._video_library.get_video(video_id) for video_id in video_ids)
+            if self._emit_page(videos, offset, limit) == 0:
+                if offset == 0:
+                    self._emit("playlist_empty")
+                else:
+                    self._emit("no_more_results", offset=offset)
+
+    @_synchronized
     def remove_from_playlist(self, playlist_name, video_id):
         """Removes a video to a playlist with a given name.
 
@@ -163,16 +332,38 @@ class VideoPlayer:
         playlist_exists = self._playlist_library.get_playlist(playlist_name) is not None
         video = self._video_library.get_video(video_id)
         if not playlist_exists:
-            print(f"Cannot remove video from {playlist_name}: Playlist does not exist")
+            self._emit("remove_playlist_missing", playlist_name=playlist_name)
         elif video is None:
-            print(f"Cannot remove video from {playlist_name}: Video does not exist")
+            self._emit("remove_video_missing", playlist_name=playlist_name)
         else:
             video_removed = self._playlist_library.remove_video_from(playlist_name, video_id)
             if not video_removed:
-                print(f"Cannot remove video from {playlist_name}: Video is not in playlist")
+                self._emit("remove_video_absent", playlist_name=playlist_name)
             else:
-                print(f"Removed video from {playlist_name}: {video.title}")
+                self._state_store.remove_videos(playlist_name, [video_id])
+                self._emit("video_removed", playlist_name=playlist_name, title=video.title)
 
+    @_synchronized
+    def remove_videos_from_playlist(self, playlist_name, video_ids):
+        """Removes several videos from a playlist with a given name, reporting a single summary.
+
+        Args:
+            playlist_name: The playlist name.
+            video_ids: The video_ids to be removed.
+        """
+        if self._playlist_library.get_playlist(playlist_name) is None:
+            self._emit("remove_videos_playlist_missing", playlist_name=playlist_name)
+            return
+        existing_video_ids = [video_id for video_id in video_ids
+                              if self._video_library.get_video(video_id) is not None]
+        removed = self._playlist_library.remove_videos_from(playlist_name, existing_video_ids)
+        if removed:
+            self._state_store.remove_videos(playlist_name, existing_video_ids)
+        self._emit("videos_removed", playlist_name=playlist_name, removed=removed,
+                   missing=len(video_ids) - len(existing_video_ids),
+                   absent=len(existing_video_ids) - removed)
+
+    @_synchronized
     def clear_playlist(self, playlist_name):
         """Removes all videos from a playlist with a given name.
 
@@ -181,10 +372,12 @@ class VideoPlayer:
         """
         playlist_cleared = self._playlist_library.clear_playlist(playlist_name)
         if not playlist_cleared:
-            print(f"Cannot clear playlist {playlist_name}: Playlist does not exist")
+            self._emit("clear_playlist_missing", playlist_name=playlist_name)
         else:
-            print(f"Successfully removed all videos from {playlist_name}")
+            self._state_store.clear_playlist(playlist_name)
+            self._emit("playlist_cleared", playlist_name=playlist_name)
 
+    @_synchronized
     def delete_playlist(self, playlist_name):
         """Deletes a playlist with a given name.
 
@@ -193,64 +386,73 @@ class VideoPlayer:
         """
         playlist_removed = self._playlist_library.remove_playlist(playlist_name)
         if not playlist_removed:
-            print(f"Cannot delete playlist {playlist_name}: Playlist does not exist")
+            self._emit("delete_playlist_missing", playlist_name=playlist_name)
         else:
-            print(f"Deleted playlist: {playlist_name}")
+            self._state_store.remove_playlist(playlist_name)
+            self._emit("playlist_deleted", playlist_name=playlist_name)
 
-    def search_videos(self, search_term):
+    @_synchronized
+    def search_videos(self, search_term, offset=0, limit=None, ranked=False, fuzzy=False):
         """Display all the videos whose titles contain the search_term.
 
         Args:
             search_term: The query to be used in search.
+            offset: (optional) How many results to skip before showing any.
+            limit: (optional) The most results to show. Defaults to all of them, or RANKED_RESULTS
+                for a ranked search.
+            ranked: (optional) Show the videos most relevant to the words of the search_term
+                first, matched against titles and tags, instead of the videos whose titles contain
+                the search_term in library order.
+            fuzzy: (optional) Show the videos whose titles contain every word of the search_term,
+                allowing for a few typos in each word, instead of the exact search_term. Cannot be
+                combined with ranked.
         """
-        videos = self._video_library.get_all_non_flagged_videos()
-        matches = []
-        for video in videos:
-            if search_term.lower() in video.title.lower():
-                matches.append(video)
-        if len(matches) == 0:
-            print(f"No search results for {search_term}")
+        if ranked and fuzzy:
+            raise ValueError("A search cannot be both ranked and fuzzy")
+        page = _parse_page(offset, limit)
+        if page is None:
+            self._emit("invalid_page")
+        elif fuzzy:
+            self._offer_search_results(
+                search_term, self._video_library.search_titles_fuzzy(search_term), *page)
+        elif ranked:
+            offset, limit = page[0], page[1] if page[1] is not None else RANKED_RESULTS
+            # Only ranks as many results as the page needs, plus one to tell whether another
+            # page follows
+            matches = self._video_library.search_ranked(search_term, offset + limit + 1)
+            self._offer_search_results(search_term, matches, offset, limit)
+        elif page[1] is None:
+            # All results are shown, so the library may as well cache them
+            self._offer_search_results(search_term, self._video_library.search_titles(search_term))
         else:
-            print(f"Here are the results for {search_term}:")
-            for i in range(len(matches)):
-                print(f"{i + 1}) {matches[i].tostring()}")
-            print("Would you like to play any of the above? If yes, specify the number of the video.")
-            print("If your answer is not a valid number, we will assume it's a no.")
-            user_response = input("")
-            try:
-                index = int(user_response) - 1
-                if index in range(0, len(matches)):
-                    self.play_video(matches[index].video_id)
-            except ValueError:
-                pass
-
-    def search_videos_tag(self, video_tag):
+            self._offer_search_results(
+                search_term, self._video_library.iter_search_titles(search_term), *page)
+
+    @_synchronized
+    def search_videos_tag(self, video_tag, offset=0, limit=None, fuzzy=False):
         """Display all videos whose tags contains the provided tag.
 
         Args:
             video_tag: The video tag to be used in search.
+            offset: (optional) How many results to skip before showing any.
+            limit: (optional) The most results to show. Defaults to all of them.
+            fuzzy: (optional) Also show the videos with tags a few typos away from the provided
+                tag.
         """
-        videos = self._video_library.get_all_non_flagged_videos()
-        matches = []
-        for video in videos:
-            if video_tag.lower() in map(lambda x: x.lower(), video.tags):
-                matches.append(video)
-        if len(matches) == 0:
-            print(f"No search results for {video_tag}")
+        page = _parse_page(offset, limit)
+        if page is None:
+            self._emit("invalid_page")
+        elif fuzzy:
+            self._offer_search_results(
+                video_tag, self._video_library.search_tags_fuzzy([video_tag]), *page)
+        elif page[1] is None:
+            # All results are shown, so the library may as well cache them
+            self._offer_search_results(video_tag, self._video_library.search_tags([video_tag]))
         else:
-            print(f"Here are the results for {video_tag}:")
-            for i in range(len(matches)):
-                print(f"{i + 1}) {matches[i].tostring()}")
-            print("Would you like to play any of the above? If yes, specify the number of the video.")
-            print("If your answer is not a valid number, we will assume it's a no.")
-            user_response = input("")
-            try:
-                index = int(user_response) - 1
-                if index in range(0, len(matches)):
-                    self.play_video(matches[index].video_id)
-            except ValueError:
-                pass
+            self._offer_search_results(
+                video_tag, self._video_library.iter_search_tags([video_tag]), *page)
 
+    @_synchronized
     def flag_video(self, video_id, flag_reason=""):
         """Mark a video as flagged.
 
@@ -258,18 +460,20 @@ class VideoPlayer:
             video_id: The video_id to be flagged.
             flag_reason: Reason for flagging the video.
         """
+        flag_reason = flag_reason if flag_reason != "" else "Not supplied"
         video = self._video_library.get_video(video_id)
         if video is None:
-            print("Cannot flag video: Video does not exist")
-        elif video.is_flagged:
-            print("Cannot flag video: Video is already flagged")
+            self._emit("flag_video_missing")
+        # Another session may flag the video at the same time, so the library has the final say
+        elif not self._video_library.flag_video(video_id, flag_reason):
+            self._emit("flag_video_flagged")
         else:
             if self._current_video is not None and self._current_video.video_id.lower() == video_id.lower():
                 self.stop_video()
-            flag_reason = flag_reason if flag_reason != "" else "Not supplied"
-            self._video_library.flag_video(video_id, flag_reason)
-            print(f"Successfully flagged video: {video.title} (reason: {flag_reason})")
+            self._flag_store.flag_video(video.video_id, flag_reason)
+            self._emit("video_flagged", title=video.title, flag_reason=flag_reason)
 
+    @_synchronized
     def allow_video(self, video_id):
         """Removes a flag from a video.
 
@@ -278,9 +482,80 @@ class VideoPlayer:
         """
         video = self._video_library.get_video(video_id)
         if video is None:
-            print("Cannot remove flag from video: Video does not exist")
-        elif not video.is_flagged:
-            print("Cannot remove flag from video: Video is not flagged")
+            self._emit("allow_video_missing")
+        elif not self._video_library.allow_video(video_id):
+            self._emit("allow_video_not_flagged")
         else:
-            self._video_library.allow_video(video_id)
-            print(f"Successfully removed flag from video: {video.title}")
+            self._flag_store.allow_video(video.video_id)
+            self._emit("video_allowed", title=video.title)
+
+    @property
+    def has_question(self):
+        """Whether a question was asked and is waiting for answer_question (see defer_answers)."""
+        return self._pending_matches is not None
+
+    @_synchronized
+    def answer_question(self, user_response):
+        """Answers the question last asked, playing the search result picked (if any).
+
+        Args:
+            user_response: The number of the search result to play. Anything else means none.
+        """
+        matches = self._pending_matches
+        if matches is None:
+            return
+        self._pending_matches = None
+        try:
+            video = matches.get(int(user_response))
+        except ValueError:
+            return
+        if video is not None:
+            self.play_video(video.video_id)
+
+    def _offer_search_results(self, query, matches, offset=0, limit=None):
+        # Lists a page of the results of a search, and plays the one the user picks (if any)
+        matches = itertools.islice(matches, offset, None)
+        first_match = next(matches, None)
+        if first_match is None:
+            if offset == 0:
+                self._emit("no_search_results", query=query)
+            else:
+                self._emit("no_more_results", offset=offset)
+        else:
+            self._emit("search_results_header", query=query)
+            shown = {}
+            self._emit_page(itertools.chain([first_match], matches), offset, limit, shown)
+            self._emit("search_prompt")
+            self._emit("search_prompt_hint")
+            # The question has to be seen before the answer can be given
+            self._output.flush()
+            self._pending_matches = shown
+            if not self._defer_answers:
+                try:
+                    user_response = input("")
+                except EOFError:
+                    # No answer is coming, such as when a command file ends with a search
+                    user_response = ""
+                self.answer_question(user_response)
+
+    def _emit_page(self, videos, offset, limit, search_results=None):
+        # Shows the videos of the page starting at offset, which videos starts from, as they are
+        # reached. Videos after the page are only looked at to tell whether there is another page.
+        # Given a search_results dictionary, shows them numbered from offset + 1, and adds them to
+        # it by number. Returns how many videos were shown.
+        shown = 0
+        for video in videos:
+            if shown == limit:
+                self._emit("more_results", first=offset + 1, last=offset + shown,
+                           next_offset=offset + shown)
+                break
+            shown += 1
+            if search_results is None:
+                self._emit("video", video=video)
+            else:
+                search_results[offset + shown] = video
+                self._emit("search_result", number=offset + shown, video=video)
+        return shown
+
+    def _emit(self, kind, **fields):
+        self._output.write(Output(kind, fields))
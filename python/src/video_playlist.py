@@ -1,19 +1,83 @@
 """A video playlist class."""
 
-from typing import Sequence
+import itertools
+import threading
+from typing import Collection, Iterable, Iterator, Optional
 
 
 class Playlist:
-    """A class used to represent a Playlist."""
+    """A class used to represent a Playlist.
 
-    def __init__(self, name: str, videos: Sequence[str]):
+    The video ids are kept as the keys of a dict, which remembers the order they were added in
+    while making adding, finding and removing a video constant time. Each playlist has a lock of
+    its own, so it is safe to share between threads.
+    """
+
+    __slots__ = ("_name", "_videos", "_lock")
+
+    def __init__(self, name: str, videos: Iterable[str]):
         self._name = name
-        self._videos = videos
+        self._videos = dict.fromkeys(videos)
+        self._lock = threading.Lock()
 
     @property
     def name(self) -> str:
         return self._name
 
     @property
-    def videos(self) -> Sequence[str]:
-        return self._videos
+    def videos(self) -> Collection[str]:
+        """Returns the video ids, in the order they were added, as they are now."""
+        with self._lock:
+            return tuple(self._videos)
+
+    def iter_videos(self, start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+        """Returns the video ids from start up to stop, in the order they were added, as they are
+        now. Only copies those ids, so paging through a long playlist never copies all of it.
+        """
+        with self._lock:
+            return iter(tuple(itertools.islice(self._videos, start, stop)))
+
+    def add_video(self, video_id: str) -> bool:
+        """Adds a video to the end of the playlist - returns false if it is already in it."""
+        with self._lock:
+            if video_id in self._videos:
+                return False
+            self._videos[video_id] = None
+            return True
+
+    def add_videos(self, video_ids: Iterable[str]) -> int:
+        """Adds videos to the end of the playlist, skipping any already in it.
+
+        Returns:
+            The number of videos added.
+        """
+        with self._lock:
+            size = len(self._videos)
+            for video_id in video_ids:
+                self._videos.setdefault(video_id)
+            return len(self._videos) - size
+
+    def remove_video(self, video_id: str) -> bool:
+        """Removes a video from the playlist - returns false if it was not in it."""
+        with self._lock:
+            if video_id not in self._videos:
+                return False
+            del self._videos[video_id]
+            return True
+
+    def remove_videos(self, video_ids: Iterable[str]) -> int:
+        """Removes videos from the playlist, skipping any not in it.
+
+        Returns:
+            The number of videos removed.
+        """
+        with self._lock:
+            size = len(self._videos)
+            for video_id in video_ids:
+                self._videos.pop(video_id, None)
+            return size - len(self._videos)
+
+    def clear(self):
+        """Removes all videos from the playlist."""
+        with self._lock:
+            self._videos.clear()
@@ -1,43 +1,62 @@
 """ Manages playlists """
-import math
+import threading
+from bisect import bisect_left, insort
 
 from .video_playlist import Playlist
 
 
 class PlaylistLibrary:
-    """Manages access to and manipulation of the user's playlists."""
+    """Manages access to and manipulation of the user's playlists.
+
+    Safe to share between threads. Creating, deleting and listing playlists takes turns under a
+    lock on the library, while changes to a playlist's videos only lock that playlist, so changes
+    to different playlists never wait for each other.
+    """
+
+    __slots__ = ("_playlists", "_sorted_keys", "_lock")
 
     def __init__(self):
-        self._playlists = []
+        # Maps each lowercased playlist name to its playlist
+        self._playlists = {}
+        # The lowercased playlist names, kept sorted for listing the playlists in order
+        self._sorted_keys = []
+        # Held to add or remove playlists, and to list them
+        self._lock = threading.Lock()
+
+    def load_playlists(self, playlists):
+        """Adds many playlists at once, such as those loaded from a StateStore at startup.
+        Args:
+            playlists: The (name, video_ids) of each playlist. Names already in use are skipped.
+        """
+        with self._lock:
+            for playlist_name, video_ids in playlists:
+                self._playlists.setdefault(playlist_name.lower(), Playlist(playlist_name, video_ids))
+            self._sorted_keys = sorted(self._playlists)
 
     def add_playlist(self, playlist_name):
         """Adds a new playlist - returns false if a playlist by the given name already exists
         Args:
             playlist_name: Unique playlist name string
         """
-        for i in range(len(self._playlists)):
-            if self._playlists[i].name.lower() == playlist_name.lower():
+        playlist_key = playlist_name.lower()
+        with self._lock:
+            if playlist_key in self._playlists:
                 return False
-            if self._playlists[i].name.lower() > playlist_name.lower():
-                self._playlists.insert(i, Playlist(playlist_name, []))
-                return True
-        self._playlists.append((Playlist(playlist_name, [])))
+            self._playlists[playlist_key] = Playlist(playlist_name, [])
+            insort(self._sorted_keys, playlist_key)
         return True
 
     def get_all_playlist_names(self):
         """Returns a list of strings containing the names of all current playlists."""
-        return list(map(lambda x: x.name, self._playlists))
+        with self._lock:
+            return [self._playlists[playlist_key].name for playlist_key in self._sorted_keys]
 
     def get_playlist(self, playlist_name):
         """Retrieves the playlist object whose name matches the given argument
         Args:
             playlist_name: Name of the playlist to find
         """
-        index = self._find_playlist_index(playlist_name)
-        if index == -1:
-            return None
-        else:
-            return self._playlists[index]
+        return self._playlists.get(playlist_name.lower())
 
     def add_video_to(self, playlist_name, video_id):
         """Adds a video to the playlist with the given name.
@@ -45,14 +64,25 @@ class PlaylistLibrary:
             playlist_name: Name of the playlist to modify
             video_id: ID of the video to add to the playlist (must not exists in that playlist already)
         """
-        index = self._find_playlist_index(playlist_name)
-        if index == -1:
-            return False
-        elif video_id in self._playlists[index].videos:
+        playlist = self.get_playlist(playlist_name)
+        if playlist is None:
             return False
         else:
-            self._playlists[index].videos.append(video_id)
-            return True
+            return playlist.add_video(video_id)
+
+    def add_videos_to(self, playlist_name, video_ids):
+        """Adds several videos to the playlist with the given name, looking the playlist up once.
+        Args:
+            playlist_name: Name of the playlist to modify
+            video_ids: IDs of the videos to add, in order (any already in the playlist are skipped)
+
+        Returns:
+            The number of videos added. None if the playlist does not exist.
+        """
+        playlist = self.get_playlist(playlist_name)
+        if playlist is None:
+            return None
+        return playlist.add_videos(video_ids)
 
     def remove_video_from(self, playlist_name, video_id):
         """Removes a video from the playlist with the given name.
@@ -60,25 +90,36 @@ class PlaylistLibrary:
             playlist_name: Name of the playlist to modify
             video_id: ID of the video to remove from the playlist
         """
-        index = self._find_playlist_index(playlist_name)
-        if index == -1:
-            return False
-        elif video_id not in self._playlists[index].videos:
+        playlist = self.get_playlist(playlist_name)
+        if playlist is None:
             return False
         else:
-            self._playlists[index].videos.remove(video_id)
-            return True
+            return playlist.remove_video(video_id)
+
+    def remove_videos_from(self, playlist_name, video_ids):
+        """Removes several videos from the playlist with the given name, looking the playlist up once.
+        Args:
+            playlist_name: Name of the playlist to modify
+            video_ids: IDs of the videos to remove (any not in the playlist are skipped)
+
+        Returns:
+            The number of videos removed. None if the playlist does not exist.
+        """
+        playlist = self.get_playlist(playlist_name)
+        if playlist is None:
+            return None
+        return playlist.remove_videos(video_ids)
 
     def clear_playlist(self, playlist_name):
         """Removes all videos from the given playlist, but keeps the playlist in the list.
         Args:
             playlist_name: Name of the playlist to wipe
         """
-        index = self._find_playlist_index(playlist_name)
-        if index == -1:
+        playlist = self.get_playlist(playlist_name)
+        if playlist is None:
             return False
         else:
-            self._playlists[index].videos.clear()
+            playlist.clear()
             return True
 
     def remove_playlist(self, playlist_name):
@@ -86,17 +127,10 @@ class PlaylistLibrary:
         Args:
             playlist_name: Name of the playlist to remove
         """
-        index = self._find_playlist_index(playlist_name)
-        if index == -1:
-            return False
-        else:
-            del self._playlists[index]
-            return True
-
-    # Has the potential to implemented a binary search to improve access speed
-    def _find_playlist_index(self, playlist_name):
         playlist_key = playlist_name.lower()
-        for i in range(len(self._playlists)):
-            if self._playlists[i].name.lower() == playlist_key:
-                return i
-        return -1
+        with self._lock:
+            if self._playlists.pop(playlist_key, None) is None:
+                return False
+            else:
+                del self._sorted_keys[bisect_left(self._sorted_keys, playlist_key)]
+                return True
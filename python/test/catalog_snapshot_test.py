@@ -0,0 +1,70 @@
+import os
+import shutil
+from pathlib import Path
+
+from src.catalog_snapshot import default_snapshot_path
+from src.video_columns import VideoColumns
+from src.video_library import VideoLibrary
+
+
+def _copy_videos(tmp_path):
+    videos_path = tmp_path / "videos.txt"
+    shutil.copy(Path(__file__).parent.parent / "src" / "videos.txt", videos_path)
+    return videos_path
+
+
+def test_library_loads_saved_snapshot(tmp_path):
+    videos_path = _copy_videos(tmp_path)
+    expected = VideoLibrary(videos_path, snapshot=False)
+    snapshot_path = expected.save_snapshot()
+    assert snapshot_path == default_snapshot_path(videos_path)
+
+    library = VideoLibrary(videos_path)
+    assert isinstance(library._videos, VideoColumns)
+    assert [video.tostring() for video in library.get_all_videos()] == [
+        video.tostring() for video in expected.get_all_videos()]
+    assert [video.video_id for video in library.iter_videos_by_title()] == [
+        video.video_id for video in expected.iter_videos_by_title()]
+    assert library.get_video("nothing_video_id").tags == ()
+    assert [video.video_id for video in library.search_titles("cat")] == [
+        "amazing_cats_video_id", "another_cat_video_id"]
+    assert [video.video_id for video in library.search_tags(["#ANIMAL", "#dog"])] == [
+        "funny_dogs_video_id"]
+
+
+def test_library_ignores_stale_snapshot(tmp_path):
+    videos_path = _copy_videos(tmp_path)
+    VideoLibrary(videos_path).save_snapshot()
+    with open(videos_path, "a") as video_file:
+        video_file.write("\nNew Video | new_video_id | #new")
+
+    library = VideoLibrary(videos_path)
+    assert not isinstance(library._videos, VideoColumns)
+    assert library.get_video("new_video_id").title == "New Video"
+
+
+def test_library_ignores_corrupt_snapshot(tmp_path):
+    videos_path = _copy_videos(tmp_path)
+    default_snapshot_path(videos_path).write_bytes(b"not a snapshot")
+
+    assert len(VideoLibrary(videos_path).get_all_videos()) == 5
+
+
+def test_library_ignores_truncated_snapshot(tmp_path):
+    videos_path = _copy_videos(tmp_path)
+    snapshot_path = VideoLibrary(videos_path).save_snapshot()
+    snapshot = Path(snapshot_path).read_bytes()
+
+    for length in [48, 64, len(snapshot) // 2, len(snapshot) - 1]:
+        Path(snapshot_path).write_bytes(snapshot[:length])
+        library = VideoLibrary(videos_path)
+        assert not isinstance(library._videos, VideoColumns)
+        assert len(library.get_all_videos()) == 5
+
+
+def test_snapshot_disabled(tmp_path):
+    videos_path = _copy_videos(tmp_path)
+    VideoLibrary(videos_path).save_snapshot()
+
+    assert not isinstance(VideoLibrary(videos_path, snapshot=False)._videos, VideoColumns)
+    assert os.path.exists(default_snapshot_path(videos_path))
@@ -0,0 +1,60 @@
+import pytest
+
+from src.command_parser import CommandException, CommandParser
+from src.video_player import VideoPlayer
+
+
+def test_execute_command_ignores_case(capfd):
+    parser = CommandParser(VideoPlayer())
+    parser.execute_command(["play", "amazing_cats_video_id"])
+    parser.execute_command(["Stop"])
+    out, err = capfd.readouterr()
+    lines = out.splitlines()
+    assert len(lines) == 2
+    assert "Playing video: Amazing Cats" in lines[0]
+    assert "Stopping video: Amazing Cats" in lines[1]
+
+
+def test_execute_command_wrong_number_of_arguments():
+    parser = CommandParser(VideoPlayer())
+    with pytest.raises(CommandException, match="Please enter PLAY command followed by video_id."):
+        parser.execute_command(["PLAY"])
+    with pytest.raises(CommandException, match="FLAG_VIDEO"):
+        parser.execute_command(["FLAG_VIDEO", "a", "b", "c"])
+
+
+def test_execute_command_unknown_command(capfd):
+    parser = CommandParser(VideoPlayer())
+    parser.execute_command(["DANCE"])
+    out, err = capfd.readouterr()
+    assert "Please enter a valid command, type HELP for a list of available commands." in out
+
+
+def test_execute_command_empty():
+    parser = CommandParser(VideoPlayer())
+    with pytest.raises(CommandException):
+        parser.execute_command([])
+
+
+def test_register_command(capfd):
+    parser = CommandParser(VideoPlayer())
+    parser.register_command("ECHO", print, {1, 2}, "Please enter ECHO command followed by text.",
+                            "ECHO <text> - Prints the text.")
+    parser.execute_command(["echo", "hello", "world"])
+    parser.execute_command(["HELP"])
+    out, err = capfd.readouterr()
+    assert out.splitlines()[0] == "hello world"
+    assert "    ECHO <text> - Prints the text." in out
+    with pytest.raises(CommandException, match="Please enter ECHO command followed by text."):
+        parser.execute_command(["ECHO"])
+
+
+def test_execute_command_variable_arguments(capfd):
+    parser = CommandParser(VideoPlayer())
+    parser.execute_command(["CREATE_PLAYLIST", "my_playlist"])
+    parser.execute_command(
+        ["ADD_VIDEOS_TO_PLAYLIST", "my_playlist", "amazing_cats_video_id", "another_cat_video_id"])
+    out, err = capfd.readouterr()
+    assert "Added 2 videos to my_playlist" in out
+    with pytest.raises(CommandException, match="ADD_VIDEOS_TO_PLAYLIST"):
+        parser.execute_command(["ADD_VIDEOS_TO_PLAYLIST", "my_playlist"])
@@ -0,0 +1,136 @@
+import sys
+import threading
+
+import pytest
+
+from src.filtered_video_library import FilteredVideoLibrary
+from src.output_sink import ListSink
+from src.video_player import VideoPlayer
+from src.video_playlist_library import PlaylistLibrary
+
+_THREADS = 8
+
+
+@pytest.fixture(autouse=True)
+def frequent_thread_switches():
+    # Switching threads far more often than usual makes races far more likely to show up
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(switch_interval)
+
+
+def _start_threads(target, count, errors):
+    def run(number):
+        try:
+            target(number)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(number,)) for number in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads
+
+
+def _run_threads(target, count=_THREADS):
+    errors = []
+    for thread in _start_threads(target, count, errors):
+        thread.join()
+    assert errors == []
+
+
+def _library(tmp_path, count=200):
+    videos_path = tmp_path / "videos.txt"
+    videos_path.write_text("".join(f"Video {i} | video_{i}_id | #tag{i % 5}\n" for i in range(count)))
+    return FilteredVideoLibrary(videos_path, snapshot=False), [f"video_{i}_id" for i in range(count)]
+
+
+def test_readers_see_consistent_flags_while_writers_flag(tmp_path):
+    library, video_ids = _library(tmp_path)
+    writers_done = threading.Event()
+
+    def write(number):
+        for _ in range(20):
+            for video_id in video_ids[number::_THREADS // 2]:
+                library.flag_video(video_id, f"reason_{number}")
+            for video_id in video_ids[number::_THREADS // 2]:
+                library.allow_video(video_id)
+
+    def read(number):
+        while not writers_done.is_set():
+            for video in library.search_titles("video"):
+                assert not video.is_flagged
+            for video in library.get_all_videos():
+                assert video.is_flagged == (video.flag_reason != "")
+            video = library.get_random_non_flagged_video()
+            assert video is None or video.video_id in video_ids
+
+    errors = []
+    readers = _start_threads(read, _THREADS // 2, errors)
+    for writer in _start_threads(write, _THREADS // 2, errors):
+        writer.join()
+    writers_done.set()
+    for reader in readers:
+        reader.join()
+    assert errors == []
+
+    assert library.get_all_non_flagged_videos() == library.get_all_videos()
+    assert not any(video.is_flagged for video in library.get_all_videos())
+
+
+def test_only_one_thread_flags_a_video(tmp_path):
+    library, video_ids = _library(tmp_path)
+    flagged = []
+
+    def flag(number):
+        for video_id in video_ids:
+            if library.flag_video(video_id, f"reason_{number}"):
+                flagged.append(video_id)
+
+    _run_threads(flag)
+
+    assert sorted(flagged) == sorted(video_ids)
+    assert library.get_random_non_flagged_video() is None
+
+
+def test_playlist_changes_from_many_threads(tmp_path):
+    library = PlaylistLibrary()
+    library.add_playlist("shared")
+
+    def change(number):
+        library.add_playlist(f"playlist_{number}")
+        video_ids = [f"video_{number}_{i}_id" for i in range(200)]
+        for video_id in video_ids:
+            library.add_video_to("shared", video_id)
+            assert video_id in library.get_playlist("shared").videos
+        library.remove_videos_from("shared", video_ids[::2])
+        library.get_all_playlist_names()
+
+    _run_threads(change)
+
+    assert len(library.get_playlist("shared").videos) == _THREADS * 100
+    assert len(library.get_all_playlist_names()) == _THREADS + 1
+
+
+def test_player_shared_between_threads(tmp_path):
+    library, video_ids = _library(tmp_path)
+    output = ListSink()
+    player = VideoPlayer(library, output)
+    player.create_playlist("shared")
+
+    def play(number):
+        for video_id in video_ids[number::_THREADS]:
+            player.play_video(video_id)
+            player.pause_video()
+            player.add_to_playlist("shared", video_id)
+            player.flag_video(video_id)
+            player.continue_video()
+
+    _run_threads(play)
+
+    output.lines.clear()
+    player.show_playlist("shared")
+    assert len(output.lines) == len(video_ids) + 1
+    assert all(line.endswith("- FLAGGED (reason: Not supplied)") for line in output.lines[1:])
+    assert library.get_random_non_flagged_video() is None
@@ -0,0 +1,125 @@
+from src.filtered_video_library import FilteredVideoLibrary
+from src.video_library import VideoLibrary
+
+
+def test_flag_video_sets_flag_status():
+    library = FilteredVideoLibrary()
+    assert library.flag_video("amazing_cats_video_id", "dont_like_cats")
+    video = library.get_video("amazing_cats_video_id")
+
+    assert video.is_flagged
+    assert video.flag_reason == "dont_like_cats"
+
+
+def test_flag_video_defaults_reason():
+    library = FilteredVideoLibrary()
+    library.flag_video("amazing_cats_video_id")
+
+    assert library.get_video("amazing_cats_video_id").flag_reason == "Not supplied"
+
+
+def test_flag_video_twice():
+    library = FilteredVideoLibrary()
+
+    assert library.flag_video("amazing_cats_video_id")
+    assert not library.flag_video("amazing_cats_video_id")
+
+
+def test_allow_video_clears_flag():
+    library = FilteredVideoLibrary()
+    library.flag_video("amazing_cats_video_id")
+
+    assert library.allow_video("amazing_cats_video_id")
+    assert not library.allow_video("amazing_cats_video_id")
+    video = library.get_video("amazing_cats_video_id")
+    assert not video.is_flagged
+    assert video.flag_reason == ""
+
+
+def test_get_all_non_flagged_videos():
+    library = FilteredVideoLibrary()
+    library.flag_video("amazing_cats_video_id")
+    library.flag_video("funny_dogs_video_id")
+    video_ids = [video.video_id for video in library.get_all_non_flagged_videos()]
+
+    assert video_ids == ["another_cat_video_id", "life_at_google_video_id", "nothing_video_id"]
+
+
+def test_get_random_non_flagged_video_skips_flagged():
+    library = FilteredVideoLibrary()
+    for video in library.get_all_videos():
+        if video.video_id != "nothing_video_id":
+            library.flag_video(video.video_id)
+
+    assert library.get_random_non_flagged_video().video_id == "nothing_video_id"
+    library.flag_video("nothing_video_id")
+    assert library.get_random_non_flagged_video() is None
+
+
+def test_search_titles_skips_flagged():
+    library = FilteredVideoLibrary()
+    library.flag_video("amazing_cats_video_id")
+    assert [video.video_id for video in library.search_titles("cat")] == ["another_cat_video_id"]
+
+    library.allow_video("amazing_cats_video_id")
+    assert [video.video_id for video in library.search_titles("cat")] == ["amazing_cats_video_id",
+                                                                          "another_cat_video_id"]
+
+
+def test_flags_do_not_change_the_catalog_videos():
+    library = FilteredVideoLibrary()
+    video = library.get_video("amazing_cats_video_id")
+    library.flag_video("amazing_cats_video_id", "dont_like_cats")
+    flagged_video = library.get_video("amazing_cats_video_id")
+
+    assert not video.is_flagged
+    assert str(video) == "Amazing Cats (amazing_cats_video_id) [#cat #animal]"
+    assert str(flagged_video) == ("Amazing Cats (amazing_cats_video_id) [#cat #animal] - FLAGGED "
+                                  "(reason: dont_like_cats)")
+    assert all(not video.is_flagged for video in VideoLibrary.get_all_videos(library))
+
+
+def test_search_results_are_cached():
+    library = FilteredVideoLibrary()
+    first = library.search_titles("CAT")
+    second = library.search_titles("cat")
+
+    assert [video.video_id for video in second] == [video.video_id for video in first]
+    assert (library.search_cache.hits, library.search_cache.misses) == (1, 1)
+    library.search_tags(["#cat", "#animal"])
+    library.search_tags(["#ANIMAL", "#cat"])
+    assert (library.search_cache.hits, library.search_cache.misses) == (2, 2)
+
+
+def test_flag_and_allow_invalidate_only_matching_searches():
+    library = FilteredVideoLibrary()
+    library.search_titles("cat")
+    library.search_titles("google")
+    library.search_tags(["#cat"])
+    library.search_tags(["#dog"], match_any=True)
+
+    library.flag_video("amazing_cats_video_id")
+    assert len(library.search_cache) == 2
+    assert "amazing_cats_video_id" not in [video.video_id for video in library.search_titles("cat")]
+
+    library.search_tags(["#cat"])
+    library.allow_video("amazing_cats_video_id")
+    assert "amazing_cats_video_id" in [video.video_id for video in library.search_titles("cat")]
+    assert "amazing_cats_video_id" in [video.video_id for video in library.search_tags(["#cat"])]
+    assert library.search_cache.get(("title", "google")) is not None
+
+
+def test_load_flags_invalidates_only_newly_flagged_searches():
+    library = FilteredVideoLibrary()
+    library.flag_video("amazing_cats_video_id", "dont_like_cats")
+    library.search_titles("cat")
+    library.search_titles("google")
+
+    library.load_flags({})
+    library.load_flags({"amazing_cats_video_id": "dont_like_cats"})
+    assert len(library.search_cache) == 2
+
+    library.load_flags({"another_cat_video_id": "dont_like_cats"})
+    assert library.search_cache.get(("title", "google")) is not None
+    assert library.search_cache.get(("title", "cat")) is None
+    assert library.search_titles("cat") == []
@@ -0,0 +1,38 @@
+from src.flag_overlay import FlagOverlay
+from src.video import Video
+
+
+def test_flag_and_allow():
+    overlay = FlagOverlay(["a_id", "b_id"])
+
+    assert overlay.flag("a_id", "dont_like_it")
+    assert not overlay.flag("A_ID", "again")
+    assert overlay.get_reason("A_id") == "dont_like_it"
+    assert overlay.random_non_flagged_id() == "b_id"
+    assert overlay.allow("a_id")
+    assert not overlay.allow("a_id")
+    assert overlay.get_reason("a_id") is None
+
+
+def test_view_joins_flag_without_changing_video():
+    overlay = FlagOverlay(["a_id"])
+    video = Video("A", "a_id", ["#tag"])
+    assert overlay.view(video) is video
+
+    overlay.load({"a_id": "dont_like_it"})
+    flagged_video = overlay.view(video)
+
+    assert flagged_video.is_flagged
+    assert flagged_video.flag_reason == "dont_like_it"
+    assert (flagged_video.title, flagged_video.video_id, flagged_video.tags) == ("A", "a_id", ("#tag",))
+    assert str(flagged_video) == "A (a_id) [#tag] - FLAGGED (reason: dont_like_it)"
+    assert not video.is_flagged
+    assert overlay.random_non_flagged_id() is None
+
+
+def test_load_returns_newly_flagged_ids():
+    overlay = FlagOverlay(["a_id", "b_id"])
+    overlay.flag("a_id", "dont_like_it")
+
+    assert overlay.load({"A_ID": "still_dont_like_it", "b_id": "nor_this"}) == ["b_id"]
+    assert overlay.get_reason("a_id") == "still_dont_like_it"
@@ -0,0 +1,31 @@
+from src.fuzzy_index import FuzzyIndex, default_max_distance, edit_distance
+
+
+def test_edit_distance():
+    assert edit_distance("cat", "cat", 0) == 0
+    assert edit_distance("cat", "cast", 1) == 1
+    assert edit_distance("kitten", "sitting", 3) == 3
+    assert edit_distance("kitten", "sitting", 2) is None
+    assert edit_distance("cat", "category", 2) is None
+    assert edit_distance("vidoe", "video", 1) == 1
+
+
+def test_default_max_distance():
+    assert [default_max_distance(word) for word in ["ab", "abc", "abcde", "abcdef"]] == [0, 1, 1, 2]
+
+
+def test_search_finds_close_words_closest_first():
+    index = FuzzyIndex(["cats", "cat", "dog", "amazing", "amusing"])
+
+    assert index.search("cat") == ["cat", "cats"]
+    assert index.search("amzing") == ["amazing", "amusing"]
+    assert index.search("dgo") == ["dog"]
+    assert index.search("dgo", max_distance=0) == []
+    assert index.search("do") == []
+
+
+def test_search_short_words_with_many_edits():
+    index = FuzzyIndex(["a", "ab", "xyz"])
+
+    assert index.search("b", max_distance=1) == ["a", "ab"]
+    assert index.search("xy", max_distance=1) == ["xyz"]
@@ -0,0 +1,35 @@
+import random
+
+from src.indexed_set import IndexedSet
+
+
+def test_add_and_contains():
+    items = IndexedSet(["a", "b"])
+
+    assert "a" in items
+    assert "c" not in items
+    assert not items.add("a")
+    assert items.add("c")
+    assert len(items) == 3
+
+
+def test_discard_keeps_remaining_items():
+    items = IndexedSet(["a", "b", "c", "d"])
+
+    assert items.discard("b")
+    assert not items.discard("b")
+    assert items.discard("d")
+    assert sorted(items) == ["a", "c"]
+    assert "b" not in items and "d" not in items
+
+
+def test_choice():
+    items = IndexedSet(["a", "b", "c"])
+    items.discard("a")
+    rng = random.Random(0)
+
+    assert {items.choice(rng) for _ in range(50)} == {"b", "c"}
+
+
+def test_choice_empty():
+    assert IndexedSet().choice() is None
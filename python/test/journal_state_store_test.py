@@ -0,0 +1,162 @@
+import os
+import stat
+import time
+from unittest import mock
+
+import pytest
+
+from src.journal_state_store import JournalStateStore
+from src.video_player import VideoPlayer
+
+
+def _make_changes(store):
+    store.add_playlist("My_Playlist")
+    store.add_videos("my_playlist", ["b_id", "a_id", "c_id"])
+    store.remove_videos("MY_PLAYLIST", ["c_id"])
+    store.add_playlist("Deleted")
+    store.remove_playlist("deleted")
+    store.flag_video("a_id", "dont_like_it")
+    store.flag_video("b_id", "Not supplied")
+    store.allow_video("b_id")
+
+
+_EXPECTED_STATE = ({"a_id": "dont_like_it"}, [("My_Playlist", ["b_id", "a_id"])])
+
+
+def test_journal_replayed_at_startup(tmp_path):
+    store = JournalStateStore(str(tmp_path / "state.journal"))
+    _make_changes(store)
+    store.close()
+
+    store = JournalStateStore(str(tmp_path / "state.journal"))
+    assert store.load() == _EXPECTED_STATE
+    store.close()
+
+
+def test_journal_compacted_into_snapshot(tmp_path):
+    journal_path = tmp_path / "state.journal"
+    store = JournalStateStore(str(journal_path), batch_size=2, compact_after=4)
+    _make_changes(store)
+    store.close()
+    assert (tmp_path / "state.journal.snapshot").exists()
+    assert len(journal_path.read_text().splitlines()) <= 4
+
+    store = JournalStateStore(str(journal_path))
+    assert store.load() == _EXPECTED_STATE
+    store.close()
+
+
+def test_journal_drops_incomplete_change(tmp_path):
+    journal_path = tmp_path / "state.journal"
+    store = JournalStateStore(str(journal_path))
+    _make_changes(store)
+    store.close()
+    with open(journal_path, "a") as journal_file:
+        journal_file.write('["clear_playlist", "my_pl')
+
+    store = JournalStateStore(str(journal_path))
+    assert store.load() == _EXPECTED_STATE
+    store.clear_playlist("my_playlist")
+    store.close()
+    store = JournalStateStore(str(journal_path))
+    assert store.load() == (_EXPECTED_STATE[0], [("My_Playlist", [])])
+    store.close()
+
+
+def test_journal_drops_damaged_changes(tmp_path):
+    journal_path = tmp_path / "state.journal"
+    store = JournalStateStore(str(journal_path))
+    _make_changes(store)
+    store.close()
+    journal = journal_path.read_text()
+
+    for damaged_line in ['["no_such_change"]', '["allow_video"]', '{"allow_video": "a_id"}', '7',
+                         '[]', '[["allow_video"], "a_id"]']:
+        journal_path.write_text(journal + damaged_line + '\n["allow_video", "a_id"]\n')
+        store = JournalStateStore(str(journal_path))
+        assert store.load() == _EXPECTED_STATE
+        store.close()
+
+
+def test_journal_with_damaged_header_is_dropped(tmp_path):
+    journal_path = tmp_path / "state.journal"
+    for header in ["not json", "[0]"]:
+        journal_path.write_text(header + '\n["add_playlist", "My_Playlist"]\n')
+        store = JournalStateStore(str(journal_path))
+        assert store.load() == ({}, [])
+        store.add_playlist("Other")
+        store.close()
+        store = JournalStateStore(str(journal_path))
+        assert store.load() == ({}, [("Other", [])])
+        store.close()
+
+
+@pytest.mark.skipif(os.name != "posix", reason="directories are only synced on POSIX")
+def test_compaction_syncs_the_directory(tmp_path):
+    synced_directories = []
+    fsync = os.fsync
+
+    def recording_fsync(fd):
+        if stat.S_ISDIR(os.fstat(fd).st_mode):
+            synced_directories.append(fd)
+        fsync(fd)
+
+    store = JournalStateStore(str(tmp_path / "state.journal"))
+    _make_changes(store)
+    with mock.patch("os.fsync", recording_fsync):
+        store.compact()
+    store.close()
+    assert synced_directories
+
+
+def test_journal_appends_old_changes_without_a_full_batch(tmp_path):
+    journal_path = tmp_path / "state.journal"
+    store = JournalStateStore(str(journal_path), max_delay=0.05)
+    store.flag_video("a_id", "dont_like_it")
+
+    deadline = time.monotonic() + 5
+    while len(journal_path.read_text().splitlines()) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    # As if the process were killed here, without closing the store
+    recovered = JournalStateStore(str(journal_path))
+    assert recovered.load() == ({"a_id": "dont_like_it"}, [])
+    recovered.close()
+    store.close()
+
+
+def test_journal_ignores_changes_already_compacted(tmp_path):
+    journal_path = tmp_path / "state.journal"
+    store = JournalStateStore(str(journal_path))
+    _make_changes(store)
+    store.close()
+    stale_journal = journal_path.read_text()
+    store = JournalStateStore(str(journal_path))
+    store.compact()
+    store.close()
+    # As if the process stopped after writing the snapshot, but before starting the new journal
+    journal_path.write_text(stale_journal + '["remove_playlist", "my_playlist"]\n')
+
+    store = JournalStateStore(str(journal_path))
+    assert store.load() == _EXPECTED_STATE
+    store.close()
+
+
+def test_video_player_state_survives_restart(tmp_path, capfd):
+    store = JournalStateStore(str(tmp_path / "state.journal"))
+    player = VideoPlayer(state_store=store)
+    player.create_playlist("my_playlist")
+    player.add_to_playlist("my_playlist", "amazing_cats_video_id")
+    player.flag_video("funny_dogs_video_id")
+    store.close()
+    capfd.readouterr()
+
+    store = JournalStateStore(str(tmp_path / "state.journal"))
+    player = VideoPlayer(state_store=store)
+    player.show_playlist("my_playlist")
+    player.play_video("funny_dogs_video_id")
+    store.close()
+    out, err = capfd.readouterr()
+    lines = out.splitlines()
+    assert len(lines) == 3
+    assert "Amazing Cats (amazing_cats_video_id) [#cat #animal]" in lines[1]
+    assert "Cannot play video: Video is currently flagged (reason: Not supplied)" in lines[2]
@@ -0,0 +1,69 @@
+import io
+
+import pytest
+
+from src.command_parser import CommandParser
+from src.output_sink import BufferedSink, ListSink, NullSink, OutputSink, ResultSink
+from src.video_player import VideoPlayer
+
+
+def test_list_sink(capfd):
+    output = ListSink()
+    player = VideoPlayer(output=output)
+    player.play_video("amazing_cats_video_id")
+    player.show_playing()
+    out, err = capfd.readouterr()
+    assert out == ""
+    assert output.lines == ["Playing video: Amazing Cats",
+                            "Currently playing: Amazing Cats (amazing_cats_video_id) [#cat #animal]"]
+
+
+def test_result_sink():
+    output = ResultSink()
+    player = VideoPlayer(output=output)
+    player.play_video("amazing_cats_video_id")
+    player.flag_video("funny_dogs_video_id", "dont_like_dogs")
+
+    assert [result.kind for result in output.results] == ["playing_video", "video_flagged"]
+    assert output.results[1].fields == {"title": "Funny Dogs", "flag_reason": "dont_like_dogs"}
+
+
+def test_buffered_sink_writes_in_bulk():
+    stream = io.StringIO()
+    output = BufferedSink(stream, buffer_lines=3)
+    player = VideoPlayer(output=output)
+    player.play_video("amazing_cats_video_id")
+    player.stop_video()
+    assert stream.getvalue() == ""
+
+    player.stop_video()
+    assert stream.getvalue().splitlines() == ["Playing video: Amazing Cats",
+                                              "Stopping video: Amazing Cats",
+                                              "Cannot stop video: No video is currently playing"]
+    player.number_of_videos()
+    output.flush()
+    assert stream.getvalue().splitlines()[-1] == "5 videos in the library"
+
+
+def test_null_sink(capfd):
+    player = VideoPlayer(output=NullSink())
+    CommandParser(player, NullSink()).execute_command(["HELP"])
+    player.number_of_videos()
+    out, err = capfd.readouterr()
+    assert out == ""
+
+
+def test_command_parser_output():
+    output = ListSink()
+    CommandParser(VideoPlayer(), output).execute_command(["DANCE"])
+
+    assert output.lines == [
+        "Please enter a valid command, type HELP for a list of available commands."]
+
+
+def test_output_sink_requires_write():
+    class NoWriteSink(OutputSink):
+        pass
+
+    with pytest.raises(TypeError):
+        NoWriteSink()
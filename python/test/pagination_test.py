@@ -0,0 +1,101 @@
+from src.command_parser import CommandException, CommandParser
+from src.video_player import VideoPlayer
+from unittest import mock
+
+import pytest
+
+
+def test_show_all_videos_page(capfd):
+    player = VideoPlayer()
+    player.show_all_videos("1", "2")
+    out, err = capfd.readouterr()
+    lines = out.splitlines()
+    assert len(lines) == 4
+    assert "Here's a list of all available videos:" in lines[0]
+    assert "Another Cat Video (another_cat_video_id) [#cat #animal]" in lines[1]
+    assert "Funny Dogs (funny_dogs_video_id) [#dog #animal]" in lines[2]
+    assert "Showed 2 to 3. For the next page, use offset 3" in lines[3]
+
+
+def test_show_all_videos_last_page(capfd):
+    player = VideoPlayer()
+    player.show_all_videos(3, 2)
+    player.show_all_videos(5, 2)
+    out, err = capfd.readouterr()
+    lines = out.splitlines()
+    assert len(lines) == 5
+    assert "Life at Google (life_at_google_video_id) [#google #career]" in lines[1]
+    assert "Video about nothing (nothing_video_id) []" in lines[2]
+    assert "Nothing to show from offset 5" in lines[4]
+
+
+def test_show_all_videos_invalid_page(capfd):
+    player = VideoPlayer()
+    player.show_all_videos("one", "2")
+    player.show_all_videos(0, 0)
+    out, err = capfd.readouterr()
+    lines = out.splitlines()
+    assert len(lines) == 2
+    assert "Cannot show page: Offset must be 0 or more, and limit 1 or more" in lines[0]
+    assert "Cannot show page: Offset must be 0 or more, and limit 1 or more" in lines[1]
+
+
+def test_show_playlist_page(capfd):
+    player = VideoPlayer()
+    player.create_playlist("my_playlist")
+    player.add_videos_to_playlist("my_playlist", ["amazing_cats_video_id", "funny_dogs_video_id",
+                                                  "nothing_video_id"])
+    player.show_playlist("my_PLAYlist", 1, 1)
+    player.show_playlist("my_playlist", 3, 1)
+    out, err = capfd.readouterr()
+    lines = out.splitlines()
+    assert len(lines) == 7
+    assert "Showing playlist: my_PLAYlist" in lines[2]
+    assert "Funny Dogs (funny_dogs_video_id) [#dog #animal]" in lines[3]
+    assert "Showed 2 to 2. For the next page, use offset 2" in lines[4]
+    assert "Showing playlist: my_playlist" in lines[5]
+    assert "Nothing to show from offset 3" in lines[6]
+
+
+@mock.patch('builtins.input', lambda *args: '3')
+def test_search_videos_page_and_play_answer(capfd):
+    player = VideoPlayer()
+    player.search_videos("a", 1, 2)
+    out, err = capfd.readouterr()
+    lines = out.splitlines()
+    assert len(lines) == 7
+    assert "Here are the results for a:" in lines[0]
+    assert "2) Another Cat Video (another_cat_video_id) [#cat #animal]" in lines[1]
+    assert "3) Life at Google (life_at_google_video_id) [#google #career]" in lines[2]
+    assert "Showed 2 to 3. For the next page, use offset 3" in lines[3]
+    assert "Playing video: Life at Google" in lines[6]
+
+
+@mock.patch('builtins.input', lambda *args: '1')
+def test_search_videos_page_ignores_numbers_not_shown(capfd):
+    player = VideoPlayer()
+    player.search_videos_tag("#animal", 2, 5)
+    out, err = capfd.readouterr()
+    lines = out.splitlines()
+    assert len(lines) == 4
+    assert "3) Another Cat Video (another_cat_video_id) [#cat #animal]" in lines[1]
+    assert "Playing video" not in out
+
+
+def test_search_videos_past_last_page(capfd):
+    player = VideoPlayer()
+    player.search_videos("cat", 2, 5)
+    out, err = capfd.readouterr()
+    assert out.splitlines() == ["Nothing to show from offset 2"]
+
+
+def test_listing_commands_accept_offset_and_limit(capfd):
+    parser = CommandParser(VideoPlayer())
+    parser.execute_command(["SHOW_ALL_VIDEOS", "0", "1"])
+    out, err = capfd.readouterr()
+    assert len(out.splitlines()) == 3
+
+    with pytest.raises(CommandException):
+        parser.execute_command(["SHOW_ALL_VIDEOS", "0"])
+    with pytest.raises(CommandException):
+        parser.execute_command(["SEARCH_VIDEOS", "cat", "0"])
@@ -235,3 +235,62 @@ def test_delete_playlist_nonexistent(capfd):
     lines = out.splitlines()
     assert len(lines) == 1
     assert "Cannot delete playlist my_cool_playlist: Playlist does not exist" in lines[0]
+
+
+def test_add_videos_to_playlist(capfd):
+    player = VideoPlayer()
+    player.create_playlist("my_playlist")
+    player.add_to_playlist("my_playlist", "life_at_google_video_id")
+    player.flag_video("funny_dogs_video_id")
+    player.add_videos_to_playlist("MY_playlist", [
+        "amazing_cats_video_id", "does_not_exist", "funny_dogs_video_id",
+        "life_at_google_video_id", "another_cat_video_id", "amazing_cats_video_id"])
+    player.show_playlist("my_playlist")
+    out, err = capfd.readouterr()
+    lines = out.splitlines()
+    assert len(lines) == 8
+    assert ("Added 2 videos to MY_playlist (skipped: 1 do not exist, 1 flagged, "
+            "2 already added)") in lines[3]
+    assert "Life at Google (life_at_google_video_id) [#google #career]" in lines[5]
+    assert "Amazing Cats (amazing_cats_video_id) [#cat #animal]" in lines[6]
+    assert "Another Cat Video (another_cat_video_id) [#cat #animal]" in lines[7]
+
+
+def test_add_videos_to_playlist_nonexistent_playlist(capfd):
+    player = VideoPlayer()
+    player.add_videos_to_playlist("another_playlist", ["amazing_cats_video_id"])
+    out, err = capfd.readouterr()
+    lines = out.splitlines()
+    assert len(lines) == 1
+    assert "Cannot add videos to another_playlist: Playlist does not exist" in lines[0]
+
+
+def test_add_tag_and_search_to_playlist(capfd):
+    player = VideoPlayer()
+    player.create_playlist("my_playlist")
+    player.add_tag_to_playlist("my_playlist", "#cat")
+    player.add_search_to_playlist("my_playlist", "cat")
+    out, err = capfd.readouterr()
+    lines = out.splitlines()
+    assert len(lines) == 3
+    assert ("Added 2 videos to my_playlist (skipped: 0 do not exist, 0 flagged, "
+            "0 already added)") in lines[1]
+    assert ("Added 0 videos to my_playlist (skipped: 0 do not exist, 0 flagged, "
+            "2 already added)") in lines[2]
+
+
+def test_remove_videos_from_playlist(capfd):
+    player = VideoPlayer()
+    player.create_playlist("my_playlist")
+    player.add_videos_to_playlist("my_playlist", ["amazing_cats_video_id", "another_cat_video_id"])
+    player.remove_videos_from_playlist("my_PLAYLIST", [
+        "amazing_cats_video_id", "does_not_exist", "funny_dogs_video_id"])
+    player.remove_videos_from_playlist("another_playlist", ["amazing_cats_video_id"])
+    player.show_playlist("my_playlist")
+    out, err = capfd.readouterr()
+    lines = out.splitlines()
+    assert len(lines) == 6
+    assert ("Removed 1 videos from my_PLAYLIST (skipped: 1 do not exist, "
+            "1 not in playlist)") in lines[2]
+    assert "Cannot remove videos from another_playlist: Playlist does not exist" in lines[3]
+    assert "Another Cat Video (another_cat_video_id) [#cat #animal]" in lines[5]
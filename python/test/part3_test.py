@@ -140,3 +140,58 @@ def test_search_videos_tag_no_results(capfd):
     lines = out.splitlines()
     assert len(lines) == 1
     assert "No search results for #blah" in lines[0]
+
+
+@mock.patch('builtins.input', lambda *args: '1')
+def test_search_videos_ranked(capfd):
+    player = VideoPlayer()
+    player.search_videos("cat", ranked=True)
+
+    out, err = capfd.readouterr()
+    lines = out.splitlines()
+    assert len(lines) == 6
+    assert "Here are the results for cat:" in lines[0]
+    assert "1) Another Cat Video (another_cat_video_id) [#cat #animal]" in lines[1]
+    assert "2) Amazing Cats (amazing_cats_video_id) [#cat #animal]" in lines[2]
+    assert "Playing video: Another Cat Video" in lines[5]
+
+
+@mock.patch('builtins.input', lambda *args: 'No')
+def test_search_videos_ranked_page_leaves_out_flagged(capfd):
+    player = VideoPlayer()
+    player.flag_video("funny_dogs_video_id")
+    player.search_videos("funny_animal", 0, 1, ranked=True)
+
+    out, err = capfd.readouterr()
+    lines = out.splitlines()
+    assert len(lines) == 6
+    assert "1) Amazing Cats (amazing_cats_video_id) [#cat #animal]" in lines[2]
+    assert "Showed 1 to 1. For the next page, use offset 1" in lines[3]
+
+
+@mock.patch('builtins.input', lambda *args: 'No')
+def test_search_videos_fuzzy(capfd):
+    player = VideoPlayer()
+    player.search_videos("amzing_cat", fuzzy=True)
+    player.search_videos("amzing_dog", fuzzy=True)
+
+    out, err = capfd.readouterr()
+    lines = out.splitlines()
+    assert len(lines) == 5
+    assert "Here are the results for amzing_cat:" in lines[0]
+    assert "1) Amazing Cats (amazing_cats_video_id) [#cat #animal]" in lines[1]
+    assert "No search results for amzing_dog" in lines[4]
+
+
+@mock.patch('builtins.input', lambda *args: 'No')
+def test_search_videos_tag_fuzzy(capfd):
+    player = VideoPlayer()
+    player.search_videos_tag("#aminal", fuzzy=True)
+
+    out, err = capfd.readouterr()
+    lines = out.splitlines()
+    assert len(lines) == 6
+    assert "Here are the results for #aminal:" in lines[0]
+    assert "1) Funny Dogs (funny_dogs_video_id) [#dog #animal]" in lines[1]
+    assert "2) Amazing Cats (amazing_cats_video_id) [#cat #animal]" in lines[2]
+    assert "3) Another Cat Video (another_cat_video_id) [#cat #animal]" in lines[3]
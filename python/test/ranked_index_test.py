@@ -0,0 +1,38 @@
+from src.ranked_index import RankedIndex, split_words
+
+
+def _index():
+    return RankedIndex([
+        ("Amazing Cats", ["#cat", "#animal"]),
+        ("Cat Cat Cat", []),
+        ("A Very Long Title About A Cat And Other Things", []),
+        ("Funny Dogs", ["#dog", "#animal"]),
+    ])
+
+
+def test_split_words():
+    assert split_words("Funny_CATS, #dog!") == ["funny", "cats", "dog"]
+
+
+def test_ranks_by_relevance():
+    index = _index()
+
+    # The rare #cat tag outweighs a single "cat" in a long title
+    assert index.search("cat", 10) == [1, 0, 2]
+    assert index.search("CAT", 1) == [1]
+    assert index.search("funny animal", 10) == [3, 0]
+
+
+def test_keep_leaves_out_results():
+    index = _index()
+
+    assert index.search("cat", 2, keep=lambda ordinal: ordinal != 1) == [0, 2]
+
+
+def test_no_results():
+    index = _index()
+
+    assert index.search("bird", 10) == []
+    assert index.search("!!", 10) == []
+    assert index.search("cat", 0) == []
+    assert RankedIndex().search("cat", 10) == []
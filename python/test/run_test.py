@@ -0,0 +1,34 @@
+import io
+
+from src.command_parser import CommandParser
+from src.run import run_batch
+from src.video_player import VideoPlayer
+
+
+def test_run_batch(capfd):
+    commands = io.StringIO("PLAY amazing_cats_video_id\n\nPLAY\nSHOW_PLAYING\nEXIT\nSTOP\n")
+    assert run_batch(CommandParser(VideoPlayer()), commands) == 4
+    out, err = capfd.readouterr()
+    lines = out.splitlines()
+    assert len(lines) == 4
+    assert "Playing video: Amazing Cats" in lines[0]
+    assert "Please enter a valid command, type HELP for a list of available commands." in lines[1]
+    assert "Please enter PLAY command followed by video_id." in lines[2]
+    assert "Currently playing: Amazing Cats" in lines[3]
+
+
+def test_run_batch_answers_questions_from_file(capfd):
+    commands = io.StringIO("SEARCH_VIDEOS cat\n2\nSTOP\n")
+    assert run_batch(CommandParser(VideoPlayer()), commands) == 2
+    out, err = capfd.readouterr()
+    lines = out.splitlines()
+    assert "Playing video: Another Cat Video" in lines[5]
+    assert "Stopping video: Another Cat Video" in lines[6]
+
+
+def test_run_batch_ending_with_a_question(capfd):
+    commands = io.StringIO("SEARCH_VIDEOS cat\n")
+    assert run_batch(CommandParser(VideoPlayer()), commands) == 1
+    out, err = capfd.readouterr()
+    assert "Would you like to play any of the above?" in out
+    assert "Playing video" not in out
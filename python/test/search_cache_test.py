@@ -0,0 +1,61 @@
+from src.search_cache import SearchCache
+
+
+def test_get_counts_hits_and_misses():
+    cache = SearchCache()
+    assert cache.get("cat") is None
+
+    cache.put("cat", ("a",), cache.generation)
+
+    assert cache.get("cat") == ("a",)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_evicts_searches_not_used_lately():
+    cache = SearchCache(max_size=2)
+    cache.put("a", (), cache.generation)
+    cache.put("b", (), cache.generation)
+    cache.get("a")
+    cache.put("c", (), cache.generation)
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == ()
+    assert cache.get("c") == ()
+
+
+def test_invalidate_removes_only_affected_entries():
+    cache = SearchCache()
+    cache.put("cat", ("a",), cache.generation)
+    cache.put("dog", ("b",), cache.generation)
+
+    cache.invalidate(lambda key: key == "cat")
+
+    assert cache.get("cat") is None
+    assert cache.get("dog") == ("b",)
+
+
+def test_put_skips_results_older_than_invalidation():
+    cache = SearchCache()
+    generation = cache.generation
+    cache.invalidate(lambda key: True)
+
+    cache.put("cat", ("a",), generation)
+
+    assert cache.get("cat") is None
+
+
+def test_zero_size_disables_cache():
+    cache = SearchCache(max_size=0)
+    cache.put("cat", ("a",), cache.generation)
+
+    assert len(cache) == 0
+
+
+def test_get_takes_no_lock():
+    cache = SearchCache()
+    cache.put("cat", ("a",), cache.generation)
+
+    with cache._lock:
+        assert cache.get("cat") == ("a",)
+        assert cache.get("dog") is None
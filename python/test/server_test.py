@@ -0,0 +1,122 @@
+import asyncio
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+from src.filtered_video_library import FilteredVideoLibrary
+from src.server import VideoPlayerServer
+from src.session_manager import SessionManager
+
+
+async def _converse(port, commands, expected_lines):
+    # Sends the commands, then returns the first expected_lines lines of output
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write("".join(f"{command}\n" for command in commands).encode())
+    lines = []
+    for _ in range(expected_lines):
+        lines.append((await reader.readline()).decode().rstrip("\n"))
+    writer.close()
+    await writer.wait_closed()
+    return lines
+
+
+def _serve(conversation, sessions=None):
+    async def run():
+        server = await VideoPlayerServer(sessions).start()
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            return await conversation(port)
+    return asyncio.run(run())
+
+
+def test_server_executes_commands():
+    lines = _serve(lambda port: _converse(
+        port, ["PLAY amazing_cats_video_id", "PLAY", "SHOW_PLAYING", "EXIT"], 6))
+
+    assert "Hello and welcome to YouTube" in lines[0]
+    assert lines[2] == "Playing video: Amazing Cats"
+    assert lines[3] == "Please enter PLAY command followed by video_id."
+    assert lines[4] == "Currently playing: Amazing Cats (amazing_cats_video_id) [#cat #animal]"
+    assert lines[5] == "YouTube has now terminated its execution. Thank you and goodbye!"
+
+
+def test_server_takes_answers_from_next_line():
+    lines = _serve(lambda port: _converse(port, ["SEARCH_VIDEOS cat", "2", "SHOW_PLAYING"], 9))
+
+    assert lines[7] == "Playing video: Another Cat Video"
+    assert lines[8].startswith("Currently playing: Another Cat Video")
+
+
+def test_server_gives_each_connection_its_own_session():
+    async def conversation(port):
+        first = _converse(port, ["CREATE_PLAYLIST my_playlist", "PLAY amazing_cats_video_id"], 4)
+        second = _converse(port, ["SHOW_PLAYLIST my_playlist", "SHOW_PLAYING"], 4)
+        return await asyncio.gather(first, second)
+
+    first_lines, second_lines = _serve(conversation)
+
+    assert first_lines[2:] == ["Successfully created new playlist: my_playlist",
+                               "Playing video: Amazing Cats"]
+    assert second_lines[2:] == ["Cannot show playlist my_playlist: Playlist does not exist",
+                                "No video is currently playing"]
+
+
+def test_server_runs_last_command_without_newline():
+    async def conversation(port):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"NUMBER_OF_VIDEOS")
+        writer.write_eof()
+        lines = (await reader.read()).decode().splitlines()
+        writer.close()
+        await writer.wait_closed()
+        return lines
+
+    lines = _serve(conversation)
+
+    assert lines[2:] == ["5 videos in the library"]
+
+
+def test_server_memory_stays_bounded_for_slow_reader(tmp_path):
+    videos_path = tmp_path / "videos.txt"
+    videos_path.write_text("".join(f"Video {i} | video_{i}_id | #tag\n" for i in range(2000)))
+    sessions = SessionManager(FilteredVideoLibrary(videos_path))
+
+    async def conversation(port):
+        # Each listing is about 70KB, so 200 of them unsent would be about 14MB
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        tracemalloc.start()
+        writer.write(b"SHOW_ALL_VIDEOS\n" * 200)
+        await asyncio.sleep(0.5)
+        # The server still serves other clients while this one is not reading
+        other_lines = await asyncio.wait_for(_converse(port, ["NUMBER_OF_VIDEOS"], 3), 5)
+        growth = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        writer.close()
+        await writer.wait_closed()
+        return other_lines, growth
+
+    other_lines, growth = _serve(conversation, sessions)
+
+    assert other_lines[2] == "2000 videos in the library"
+    assert growth < 2_000_000
+
+
+def test_server_serves_others_with_more_stalled_clients_than_workers(tmp_path):
+    videos_path = tmp_path / "videos.txt"
+    videos_path.write_text("".join(f"Video {i} | video_{i}_id | #tag\n" for i in range(2000)))
+    sessions = SessionManager(FilteredVideoLibrary(videos_path))
+
+    async def conversation(port):
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(2))
+        stalled_writers = []
+        for _ in range(5):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"SHOW_ALL_VIDEOS\n" * 200)
+            stalled_writers.append(writer)
+        await asyncio.sleep(0.5)
+        other_lines = await asyncio.wait_for(_converse(port, ["NUMBER_OF_VIDEOS"], 3), 5)
+        for writer in stalled_writers:
+            writer.close()
+            await writer.wait_closed()
+        return other_lines
+
+    assert _serve(conversation, sessions)[2] == "2000 videos in the library"
@@ -0,0 +1,82 @@
+import pytest
+
+from src.output_sink import ListSink
+from src.session_manager import SessionManager
+from src.state_store import SqliteStateStore
+
+
+def test_sessions_keep_their_own_playback_and_playlists():
+    sessions = SessionManager()
+    alice_output, bob_output = ListSink(), ListSink()
+    alice = sessions.open_session("alice", alice_output)
+    bob = sessions.open_session("bob", bob_output)
+
+    alice.play_video("amazing_cats_video_id")
+    alice.create_playlist("my_playlist")
+    bob.show_playing()
+    bob.show_playlist("my_playlist")
+
+    assert bob_output.lines == ["No video is currently playing",
+                                "Cannot show playlist my_playlist: Playlist does not exist"]
+
+
+def test_sessions_share_the_library_and_its_flags():
+    sessions = SessionManager()
+    bob_output = ListSink()
+    alice = sessions.open_session("alice", ListSink())
+    bob = sessions.open_session("bob", bob_output)
+
+    alice.flag_video("funny_dogs_video_id", "dont_like_dogs")
+    bob.play_video("funny_dogs_video_id")
+
+    assert bob_output.lines == [
+        "Cannot play video: Video is currently flagged (reason: dont_like_dogs)"]
+
+
+def test_open_and_close_sessions():
+    sessions = SessionManager()
+    alice = sessions.open_session("alice", ListSink())
+
+    with pytest.raises(ValueError):
+        sessions.open_session("alice")
+    assert sessions.get_session("alice") is alice
+    assert len(sessions) == 1
+    assert sessions.close_session("alice")
+    assert not sessions.close_session("alice")
+    assert sessions.get_session("alice") is None
+    assert len(sessions) == 0
+
+
+def test_opening_a_session_keeps_cached_searches():
+    sessions = SessionManager()
+    sessions.open_session("alice", ListSink())
+    sessions.video_library.search_tags(["#cat"])
+    cached = len(sessions.video_library.search_cache)
+
+    sessions.open_session("bob", ListSink())
+
+    assert cached == 1
+    assert len(sessions.video_library.search_cache) == cached
+
+
+def test_flags_are_kept_in_the_shared_flag_store(tmp_path):
+    alice_store = SqliteStateStore(str(tmp_path / "alice.db"))
+    alice_store.flag_video("funny_dogs_video_id", "only_alice_saw_this")
+    alice_store.close()
+    flag_store = SqliteStateStore(str(tmp_path / "flags.db"))
+    sessions = SessionManager(flag_store=flag_store)
+
+    alice_store = SqliteStateStore(str(tmp_path / "alice.db"))
+    alice = sessions.open_session("alice", ListSink(), alice_store)
+    assert not sessions.video_library.get_video("funny_dogs_video_id").is_flagged
+    alice.flag_video("amazing_cats_video_id", "dont_like_cats")
+    alice.create_playlist("my_playlist")
+    alice_store.close()
+    flag_store.close()
+
+    assert SqliteStateStore(str(tmp_path / "flags.db")).load() == (
+        {"amazing_cats_video_id": "dont_like_cats"}, [])
+    assert SqliteStateStore(str(tmp_path / "alice.db")).load() == (
+        {"funny_dogs_video_id": "only_alice_saw_this"}, [("my_playlist", [])])
+    sessions = SessionManager(flag_store=SqliteStateStore(str(tmp_path / "flags.db")))
+    assert sessions.video_library.get_video("amazing_cats_video_id").is_flagged
@@ -0,0 +1,97 @@
+import time
+
+from src.state_store import SqliteStateStore
+from src.video_player import VideoPlayer
+
+
+def test_sqlite_state_store_round_trip(tmp_path):
+    store = SqliteStateStore(str(tmp_path / "state.db"))
+    store.add_playlist("My_Playlist")
+    store.add_videos("my_playlist", ["b_id", "a_id", "b_id"])
+    store.add_playlist("Empty")
+    store.flag_video("a_id", "dont_like_it")
+    store.flag_video("b_id", "Not supplied")
+    store.allow_video("b_id")
+    store.close()
+
+    store = SqliteStateStore(str(tmp_path / "state.db"))
+    flags, playlists = store.load()
+    store.close()
+    assert flags == {"a_id": "dont_like_it"}
+    assert sorted(playlists) == [("Empty", []), ("My_Playlist", ["b_id", "a_id"])]
+
+
+def test_sqlite_state_store_writes_behind(tmp_path):
+    store = SqliteStateStore(str(tmp_path / "state.db"), batch_size=3, max_delay=None)
+    reader = SqliteStateStore(str(tmp_path / "state.db"))
+    store.add_playlist("my_playlist")
+    store.add_videos("my_playlist", ["a_id"])
+    assert reader.load() == ({}, [])
+    store.add_videos("my_playlist", ["b_id"])
+    assert reader.load() == ({}, [("my_playlist", ["a_id", "b_id"])])
+    store.remove_videos("my_playlist", ["a_id"])
+    store.flush()
+    assert reader.load() == ({}, [("my_playlist", ["b_id"])])
+    store.remove_playlist("MY_PLAYLIST")
+    store.close()
+    assert reader.load() == ({}, [])
+    reader.close()
+
+
+def test_sqlite_state_store_writes_old_changes_without_a_full_batch(tmp_path):
+    store = SqliteStateStore(str(tmp_path / "state.db"), max_delay=0.05)
+    reader = SqliteStateStore(str(tmp_path / "state.db"))
+    store.flag_video("a_id", "dont_like_it")
+
+    deadline = time.monotonic() + 5
+    while reader.load() == ({}, []) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert reader.load() == ({"a_id": "dont_like_it"}, [])
+    store.close()
+    reader.close()
+
+
+def test_video_player_state_survives_restart(tmp_path, capfd):
+    store = SqliteStateStore(str(tmp_path / "state.db"))
+    player = VideoPlayer(state_store=store)
+    player.create_playlist("my_PLAYlist")
+    player.add_videos_to_playlist("my_playlist", ["amazing_cats_video_id", "funny_dogs_video_id"])
+    player.remove_from_playlist("my_playlist", "amazing_cats_video_id")
+    player.add_to_playlist("my_playlist", "another_cat_video_id")
+    player.create_playlist("deleted_playlist")
+    player.delete_playlist("deleted_playlist")
+    player.flag_video("amazing_cats_video_id", "dont_like_cats")
+    store.close()
+    capfd.readouterr()
+
+    store = SqliteStateStore(str(tmp_path / "state.db"))
+    player = VideoPlayer(state_store=store)
+    player.show_all_playlists()
+    player.show_playlist("my_playlist")
+    player.play_video("amazing_cats_video_id")
+    store.close()
+    out, err = capfd.readouterr()
+    lines = out.splitlines()
+    assert len(lines) == 6
+    assert "Showing all playlists:" in lines[0]
+    assert "my_PLAYlist" in lines[1]
+    assert "Funny Dogs (funny_dogs_video_id) [#dog #animal]" in lines[3]
+    assert "Another Cat Video (another_cat_video_id) [#cat #animal]" in lines[4]
+    assert ("Cannot play video: Video is currently flagged "
+            "(reason: dont_like_cats)") in lines[5]
+
+
+def test_video_player_skips_stored_videos_gone_from_the_catalog(tmp_path, capfd):
+    store = SqliteStateStore(str(tmp_path / "state.db"))
+    store.add_playlist("my_playlist")
+    store.add_videos("my_playlist", ["gone_video_id", "funny_dogs_video_id"])
+    store.close()
+
+    store = SqliteStateStore(str(tmp_path / "state.db"))
+    player = VideoPlayer(state_store=store)
+    player.show_playlist("my_playlist")
+    store.close()
+    out, err = capfd.readouterr()
+    lines = out.splitlines()
+    assert len(lines) == 2
+    assert "Funny Dogs (funny_dogs_video_id) [#dog #animal]" in lines[1]
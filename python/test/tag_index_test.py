@@ -0,0 +1,46 @@
+from src.tag_index import TagIndex
+
+
+def _index():
+    return TagIndex([["#dog", "#animal"], ["#cat", "#Animal"], [], ["#CAT", "#animal", "#cat"]])
+
+
+def test_search_single_tag_ignoring_case():
+    index = _index()
+
+    assert index.search(["#cat"]) == [1, 3]
+    assert index.search(["#ANIMAL"]) == [0, 1, 3]
+    assert index.search(["#google"]) == []
+
+
+def test_search_all_tags():
+    index = _index()
+
+    assert index.search(["#cat", "#animal"]) == [1, 3]
+    assert index.search(["#cat", "#dog"]) == []
+
+
+def test_search_any_tag():
+    index = _index()
+
+    assert index.search(["#cat", "#dog"], match_any=True) == [0, 1, 3]
+    assert index.search(["#google", "#dog"], match_any=True) == [0]
+
+
+def test_search_no_tags():
+    assert _index().search([]) == []
+
+
+def test_search_all_tags_rare_and_common():
+    index = TagIndex([["#common"] + (["#rare"] if i in (7, 300, 999) else []) for i in range(1000)])
+
+    assert index.search(["#common", "#rare"]) == [7, 300, 999]
+
+
+def test_iter_search_matches_search():
+    index = TagIndex([["#cat", "#animal"], ["#dog", "#animal"], ["#cat"]])
+
+    assert list(index.iter_search(["#CAT"])) == index.search(["#cat"])
+    assert list(index.iter_search(["#cat", "#animal"])) == index.search(["#cat", "#animal"])
+    assert list(index.iter_search(["#missing"])) == []
+    assert list(index.iter_search([])) == []
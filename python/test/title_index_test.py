@@ -0,0 +1,40 @@
+from src.title_index import TitleIndex
+
+
+def test_search_matches_substrings_ignoring_case():
+    index = TitleIndex(["Amazing Cats", "Funny Dogs", "Another Cat Video"])
+
+    assert index.search("cat") == [0, 2]
+    assert index.search("AZING c") == [0]
+    assert index.search("g cat") == [0]
+
+
+def test_search_short_terms():
+    index = TitleIndex(["Amazing Cats", "Funny Dogs", "Another Cat Video"])
+
+    assert index.search("do") == [1]
+    assert index.search("a") == [0, 2]
+    assert index.search("") == [0, 1, 2]
+
+
+def test_search_no_results():
+    index = TitleIndex(["Amazing Cats", "Funny Dogs"])
+
+    assert index.search("blah") == []
+    assert index.search("cats dogs") == []
+
+
+def test_add_returns_ordinal():
+    index = TitleIndex(["Amazing Cats"])
+
+    assert index.add("Funny Dogs") == 1
+    assert index.search("dogs") == [1]
+    assert len(index) == 2
+
+
+def test_iter_search_matches_search():
+    index = TitleIndex(["Amazing Cats", "Funny Dogs", "Another Cat Video"])
+
+    assert next(index.iter_search("cat")) == 0
+    assert list(index.iter_search("a")) == index.search("a")
+    assert list(index.iter_search("blah")) == []
@@ -0,0 +1,16 @@
+from src.title_order import TitleOrder
+
+
+def test_orders_by_title_keeping_ties_in_order():
+    order = TitleOrder(["b", "a", "B", "a"])
+
+    assert list(order.ordinals()) == [2, 1, 3, 0]
+    assert list(order.ordinals(1, 3)) == [1, 3]
+    assert len(order) == 4
+
+
+def test_from_buffers():
+    order = TitleOrder(["b", "a"])
+    buffers = [memoryview(buffer).cast("B") for buffer in order.to_buffers()]
+
+    assert list(TitleOrder.from_buffers(buffers).ordinals()) == [1, 0]
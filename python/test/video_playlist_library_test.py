@@ -0,0 +1,56 @@
+from src.video_playlist_library import PlaylistLibrary
+
+
+def test_playlists_listed_in_name_order_ignoring_case():
+    library = PlaylistLibrary()
+    for playlist_name in ["b_list", "A_list", "c_LIST", "a_list2"]:
+        assert library.add_playlist(playlist_name)
+
+    assert library.get_all_playlist_names() == ["A_list", "a_list2", "b_list", "c_LIST"]
+
+
+def test_add_existing_playlist():
+    library = PlaylistLibrary()
+    library.add_playlist("My_Playlist")
+
+    assert not library.add_playlist("my_playlist")
+    assert library.get_playlist("MY_PLAYLIST").name == "My_Playlist"
+
+
+def test_remove_playlist():
+    library = PlaylistLibrary()
+    library.add_playlist("first")
+    library.add_playlist("second")
+
+    assert library.remove_playlist("FIRST")
+    assert not library.remove_playlist("first")
+    assert library.get_playlist("first") is None
+    assert library.get_all_playlist_names() == ["second"]
+    assert library.add_playlist("First")
+    assert library.get_all_playlist_names() == ["First", "second"]
+
+
+def test_playlist_videos_keep_order():
+    library = PlaylistLibrary()
+    library.add_playlist("my_playlist")
+    for video_id in ["c_id", "a_id", "b_id"]:
+        assert library.add_video_to("my_playlist", video_id)
+
+    assert not library.add_video_to("my_playlist", "a_id")
+    assert library.remove_video_from("my_playlist", "a_id")
+    assert not library.remove_video_from("my_playlist", "a_id")
+    assert library.add_video_to("my_playlist", "a_id")
+    assert list(library.get_playlist("my_playlist").videos) == ["c_id", "b_id", "a_id"]
+    assert "b_id" in library.get_playlist("my_playlist").videos
+    assert list(library.get_playlist("my_playlist").iter_videos(1, 2)) == ["b_id"]
+    assert list(library.get_playlist("my_playlist").iter_videos(1)) == ["b_id", "a_id"]
+
+
+def test_clear_playlist():
+    library = PlaylistLibrary()
+    library.add_playlist("my_playlist")
+    library.add_video_to("my_playlist", "a_id")
+
+    assert library.clear_playlist("MY_PLAYLIST")
+    assert len(library.get_playlist("my_playlist").videos) == 0
+    assert not library.clear_playlist("other_playlist")
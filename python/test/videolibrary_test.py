@@ -1,9 +1,15 @@
+from unittest import mock
+
+import pytest
+
+from src.video_database import HAS_TRIGRAM_TOKENIZER, write_database
 from src.video_library import VideoLibrary
 
 
 def test_library_has_all_videos():
     library = VideoLibrary()
     assert len(library.get_all_videos()) == 5
+    assert len(library) == 5
 
 
 def test_parses_tags_correctly():
@@ -24,3 +30,160 @@ def test_parses_video_correctly_without_tags():
     assert video.title == "Video about nothing"
     assert video.video_id == "nothing_video_id"
     assert video.tags == ()
+
+
+def test_search_titles():
+    library = VideoLibrary()
+    videos = library.search_titles("CAT")
+
+    assert [video.video_id for video in videos] == ["amazing_cats_video_id",
+                                                    "another_cat_video_id"]
+
+
+def test_search_tags():
+    library = VideoLibrary()
+
+    assert [video.video_id for video in library.search_tags(["#CAT"])] == [
+        "amazing_cats_video_id", "another_cat_video_id"]
+    assert [video.video_id for video in library.search_tags(["#dog", "#google"], match_any=True)] == [
+        "funny_dogs_video_id", "life_at_google_video_id"]
+
+
+def test_iter_videos_by_title():
+    library = VideoLibrary()
+    by_title = sorted(library.get_all_videos(), key=lambda video: video.title)
+
+    assert list(library.iter_videos_by_title()) == by_title
+    assert list(library.iter_videos_by_title(1, 3)) == by_title[1:3]
+    assert list(library.iter_videos_by_title(4, 100)) == by_title[4:]
+    for other_library in [VideoLibrary(lazy=True), VideoLibrary(compact=True)]:
+        assert [video.tostring() for video in other_library.iter_videos_by_title()] == [
+            video.tostring() for video in by_title]
+
+
+def test_iter_search_matches_search():
+    library = VideoLibrary()
+
+    assert list(library.iter_search_titles("cat")) == library.search_titles("cat")
+    assert list(library.iter_search_tags(["#animal"])) == library.search_tags(["#animal"])
+
+
+def test_fuzzy_search():
+    library = VideoLibrary()
+
+    assert [video.video_id for video in library.search_titles_fuzzy("vidoe")] == [
+        "another_cat_video_id", "nothing_video_id"]
+    assert [video.video_id for video in library.search_titles_fuzzy("")] == []
+    assert [video.video_id for video in library.search_tags_fuzzy(["#CAAT", "#animl"])] == [
+        "amazing_cats_video_id", "another_cat_video_id"]
+    assert [video.video_id for video in library.search_tags_fuzzy(["#ct", "#dgo"],
+                                                                   match_any=True)] == [
+        "funny_dogs_video_id", "amazing_cats_video_id", "another_cat_video_id"]
+
+
+def test_lazy_library_matches_eager_library():
+    library = VideoLibrary()
+    lazy_library = VideoLibrary(lazy=True)
+
+    assert [video.tostring() for video in lazy_library.get_all_videos()] == [
+        video.tostring() for video in library.get_all_videos()]
+    assert lazy_library.get_video("missing_video_id") is None
+    assert lazy_library.get_video("nothing_video_id").tags == ()
+    assert [video.video_id for video in lazy_library.search_titles("cat")] == [
+        "amazing_cats_video_id", "another_cat_video_id"]
+
+
+def test_lazy_library_without_trailing_newline(tmp_path):
+    videos_path = tmp_path / "videos.txt"
+    videos_path.write_text("First | first_id | #a\nSecond | second_id | #b , #c")
+    library = VideoLibrary(videos_path, lazy=True)
+
+    assert library.get_video("first_id").tags == ("#a",)
+    assert library.get_video("second_id").tags == ("#b", "#c")
+
+
+def test_lazy_library_empty_file(tmp_path):
+    videos_path = tmp_path / "videos.txt"
+    videos_path.write_text("")
+
+    assert VideoLibrary(videos_path, lazy=True).get_all_videos() == []
+
+
+def test_compact_library_matches_eager_library():
+    library = VideoLibrary()
+    compact_library = VideoLibrary(compact=True)
+
+    assert [video.tostring() for video in compact_library.get_all_videos()] == [
+        video.tostring() for video in library.get_all_videos()]
+    assert compact_library.get_video("missing_video_id") is None
+    assert compact_library.get_video("nothing_video_id").tags == ()
+    assert [video.video_id for video in compact_library.search_tags(["#cat"])] == [
+        "amazing_cats_video_id", "another_cat_video_id"]
+
+
+def test_compact_library_repeated_video_id(tmp_path):
+    videos_path = tmp_path / "videos.txt"
+    videos_path.write_text("First | first_id | #a\nSecond | second_id |\nThird | first_id | #c\n")
+    library = VideoLibrary(videos_path, compact=True)
+
+    assert [video.title for video in library.get_all_videos()] == ["Third", "Second"]
+
+
+@pytest.mark.skipif(not HAS_TRIGRAM_TOKENIZER, reason="needs SQLite 3.34 or newer")
+def test_database_library_matches_eager_library(tmp_path):
+    library = VideoLibrary()
+    database_path = tmp_path / "catalog.db"
+    write_database(database_path, library.get_all_videos())
+    database_library = VideoLibrary(database=database_path)
+
+    assert [video.tostring() for video in database_library.get_all_videos()] == [
+        video.tostring() for video in library.get_all_videos()]
+    assert database_library.get_video("missing_video_id") is None
+    assert len(database_library) == 5
+    assert [video.video_id for video in database_library.iter_videos_by_title()] == [
+        video.video_id for video in library.iter_videos_by_title()]
+    assert database_library.get_video("amazing_cats_video_id").tags == ("#cat", "#animal")
+    for search_term in ["cat", "VIDEO", "o", "", "no match"]:
+        assert [video.video_id for video in database_library.search_titles(search_term)] == [
+            video.video_id for video in library.search_titles(search_term)]
+        assert [video.video_id for video in database_library.iter_search_titles(search_term)] == [
+            video.video_id for video in library.search_titles(search_term)]
+    for video_tags in [["#CAT"], ["#cat", "#animal"], ["#dog", "#cat"], []]:
+        for match_any in [False, True]:
+            assert [video.video_id for video in
+                    database_library.search_tags(video_tags, match_any)] == [
+                video.video_id for video in library.search_tags(video_tags, match_any)]
+            assert [video.video_id for video in
+                    database_library.search_tags_fuzzy(video_tags, match_any)] == [
+                video.video_id for video in library.search_tags_fuzzy(video_tags, match_any)]
+            assert [video.video_id for video in
+                    database_library.iter_search_tags(video_tags, match_any)] == [
+                video.video_id for video in library.search_tags(video_tags, match_any)]
+
+
+@pytest.mark.skipif(not HAS_TRIGRAM_TOKENIZER, reason="needs SQLite 3.34 or newer")
+def test_database_library_ranks_without_loading_every_video(tmp_path):
+    library = VideoLibrary()
+    database_path = tmp_path / "catalog.db"
+    write_database(database_path, library.get_all_videos())
+    database_library = VideoLibrary(database=database_path)
+
+    with mock.patch("src.video_database.VideoDatabase.values", side_effect=AssertionError):
+        for search_term in ["cat", "funny dog", "life animal", "vidoe"]:
+            assert [video.video_id for video in database_library.search_ranked(search_term, 3)] == [
+                video.video_id for video in library.search_ranked(search_term, 3)]
+            assert [video.video_id for video in
+                    database_library.search_titles_fuzzy(search_term)] == [
+                video.video_id for video in library.search_titles_fuzzy(search_term)]
+
+
+@mock.patch("src.video_database.HAS_TRIGRAM_TOKENIZER", False)
+def test_database_needs_trigram_tokenizer(tmp_path):
+    with pytest.raises(RuntimeError, match="SQLite 3.34"):
+        write_database(tmp_path / "catalog.db", VideoLibrary().get_all_videos())
+    assert not (tmp_path / "catalog.db").exists()
+
+
+def test_database_library_cannot_be_compact(tmp_path):
+    with pytest.raises(ValueError):
+        VideoLibrary(compact=True, database=tmp_path / "catalog.db")